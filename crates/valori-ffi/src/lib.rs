@@ -21,6 +21,91 @@ macro_rules! lock_engine {
     };
 }
 
+/// Body of `create_node`, shared with `create_nodes_batch`. Caller holds the lock.
+fn create_node_locked(engine: &mut Engine, kind: u8, record_id: Option<u32>) -> PyResult<u32> {
+    // When the event-log committer is active, insert_with_proof commits
+    // records only to live_state (not engine.state). create_node_for_record
+    // validates the record_id against engine.state via apply_committed_event_ns,
+    // so it would return NotFound for records inserted via the committer path.
+    // We must use the committer directly here to stay on the same state.
+    if let Some(committer) = engine.event_committer_mut() {
+        let node_kind =
+            valori_kernel::types::enums::NodeKind::from_u8(kind).unwrap_or_default();
+        let record = record_id.map(valori_kernel::types::id::RecordId);
+
+        // Validate record exists in live_state before committing.
+        if let Some(rid) = record {
+            if committer.live_state().get_record(rid).is_none() {
+                return Err(PyRuntimeError::new_err(format!(
+                    "CreateNode failed: Kernel(NotFound) — record {} not in live_state",
+                    rid.0
+                )));
+            }
+        }
+
+        let node_id = committer.live_state().next_node_id();
+        let event = KernelEvent::CreateNode {
+            id: node_id,
+            kind: node_kind,
+            record,
+        };
+        committer
+            .commit_event(event)
+            .map_err(|e| PyRuntimeError::new_err(format!("CreateNode failed: {:?}", e)))?;
+        return Ok(node_id.0);
+    }
+
+    // WAL / ephemeral path: commit_and_apply_ns touches engine.state directly.
+    let node_id = engine
+        .create_node_for_record(record_id, kind, 0)
+        .map_err(|e| PyRuntimeError::new_err(format!("CreateNode failed: {:?}", e)))?;
+    Ok(node_id)
+}
+
+/// Body of `create_edge`, shared with `create_edges_batch`. Caller holds the lock.
+fn create_edge_locked(engine: &mut Engine, from: u32, to: u32, kind: u8) -> PyResult<u32> {
+    // Same live_state/engine.state split as create_node: use committer when active.
+    if let Some(committer) = engine.event_committer_mut() {
+        use valori_kernel::types::id::{EdgeId, NodeId};
+        let from_id = NodeId(from);
+        let to_id = NodeId(to);
+        let edge_kind =
+            valori_kernel::types::enums::EdgeKind::from_u8(kind).unwrap_or_default();
+        let edge_id = committer.live_state().next_edge_id();
+        let event = KernelEvent::CreateEdge {
+            id: edge_id,
+            kind: edge_kind,
+            from: from_id,
+            to: to_id,
+        };
+        committer
+            .commit_event(event)
+            .map_err(|e| PyRuntimeError::new_err(format!("CreateEdge failed: {:?}", e)))?;
+        return Ok(edge_id.0);
+    }
+
+    engine
+        .create_edge(from, to, kind)
+        .map_err(|e| PyRuntimeError::new_err(format!("CreateEdge failed: {:?}", e)))
+}
+
+/// Decode a native-endian packed f32 buffer (``array('f', v).tobytes()``).
+///
+/// Taking ``bytes`` lets the Python side hand over a vector with one memcpy
+/// instead of PyO3 extracting a `Vec<f32>` element by element from a list.
+fn f32s_from_packed(data: &[u8]) -> PyResult<Vec<f32>> {
+    if data.len() % 4 != 0 {
+        return Err(PyValueError::new_err(format!(
+            "packed vector length {} is not a multiple of 4",
+            data.len()
+        )));
+    }
+    Ok(data
+        .chunks_exact(4)
+        .map(|c| f32::from_ne_bytes([c[0], c[1], c[2], c[3]]))
+        .collect())
+}
+
 #[pyclass]
 struct ValoricoreEngine {
     inner: Arc<Mutex<Engine>>,
@@ -55,6 +140,7 @@ impl ValoricoreEngine {
         config.index_kind = match index_kind {
             "hnsw" => IndexKind::Hnsw,
             "ivf" => IndexKind::Ivf,
+            "bq" => IndexKind::Bq,
             _ => IndexKind::BruteForce,
         };
 
@@ -100,6 +186,12 @@ impl ValoricoreEngine {
             .map_err(|e| PyRuntimeError::new_err(format!("insert failed: {:?}", e)))
     }
 
+    /// `insert` for a packed f32 buffer; see [`f32s_from_packed`].
+    #[pyo3(signature = (data, tag))]
+    fn insert_packed(&self, data: &[u8], tag: u64) -> PyResult<u32> {
+        self.insert(f32s_from_packed(data)?, tag)
+    }
+
     #[pyo3(signature = (vector, k, filter_tag=None))]
     fn search(
         &self,
@@ -140,75 +232,48 @@ impl ValoricoreEngine {
         Ok(py_results)
     }
 
+    /// `search` for a packed f32 query buffer; see [`f32s_from_packed`].
+    #[pyo3(signature = (data, k, filter_tag=None))]
+    fn search_packed(
+        &self,
+        data: &[u8],
+        k: usize,
+        filter_tag: Option<u64>,
+    ) -> PyResult<Vec<(u32, i64)>> {
+        self.search(f32s_from_packed(data)?, k, filter_tag)
+    }
+
     #[pyo3(signature = (kind, record_id=None))]
     fn create_node(&self, kind: u8, record_id: Option<u32>) -> PyResult<u32> {
         let mut engine = lock_engine!(self);
+        create_node_locked(&mut engine, kind, record_id)
+    }
 
-        // When the event-log committer is active, insert_with_proof commits
-        // records only to live_state (not engine.state). create_node_for_record
-        // validates the record_id against engine.state via apply_committed_event_ns,
-        // so it would return NotFound for records inserted via the committer path.
-        // We must use the committer directly here to stay on the same state.
-        if let Some(committer) = engine.event_committer_mut() {
-            let node_kind =
-                valori_kernel::types::enums::NodeKind::from_u8(kind).unwrap_or_default();
-            let record = record_id.map(valori_kernel::types::id::RecordId);
-
-            // Validate record exists in live_state before committing.
-            if let Some(rid) = record {
-                if committer.live_state().get_record(rid).is_none() {
-                    return Err(PyRuntimeError::new_err(format!(
-                        "CreateNode failed: Kernel(NotFound) — record {} not in live_state",
-                        rid.0
-                    )));
-                }
-            }
-
-            let node_id = committer.live_state().next_node_id();
-            let event = KernelEvent::CreateNode {
-                id: node_id,
-                kind: node_kind,
-                record,
-            };
-            committer
-                .commit_event(event)
-                .map_err(|e| PyRuntimeError::new_err(format!("CreateNode failed: {:?}", e)))?;
-            return Ok(node_id.0);
-        }
-
-        // WAL / ephemeral path: commit_and_apply_ns touches engine.state directly.
-        let node_id = engine
-            .create_node_for_record(record_id, kind, 0)
-            .map_err(|e| PyRuntimeError::new_err(format!("CreateNode failed: {:?}", e)))?;
-        Ok(node_id)
+    /// Create one node of `kind` per entry in `record_ids` under a single
+    /// engine lock. Returns the new node IDs in input order.
+    #[pyo3(signature = (kind, record_ids))]
+    fn create_nodes_batch(&self, kind: u8, record_ids: Vec<Option<u32>>) -> PyResult<Vec<u32>> {
+        let mut engine = lock_engine!(self);
+        record_ids
+            .into_iter()
+            .map(|record_id| create_node_locked(&mut engine, kind, record_id))
+            .collect()
     }
 
     fn create_edge(&self, from: u32, to: u32, kind: u8) -> PyResult<u32> {
         let mut engine = lock_engine!(self);
+        create_edge_locked(&mut engine, from, to, kind)
+    }
 
-        // Same live_state/engine.state split as create_node: use committer when active.
-        if let Some(committer) = engine.event_committer_mut() {
-            use valori_kernel::types::id::{EdgeId, NodeId};
-            let from_id = NodeId(from);
-            let to_id = NodeId(to);
-            let edge_kind =
-                valori_kernel::types::enums::EdgeKind::from_u8(kind).unwrap_or_default();
-            let edge_id = committer.live_state().next_edge_id();
-            let event = KernelEvent::CreateEdge {
-                id: edge_id,
-                kind: edge_kind,
-                from: from_id,
-                to: to_id,
-            };
-            committer
-                .commit_event(event)
-                .map_err(|e| PyRuntimeError::new_err(format!("CreateEdge failed: {:?}", e)))?;
-            return Ok(edge_id.0);
-        }
-
-        engine
-            .create_edge(from, to, kind)
-            .map_err(|e| PyRuntimeError::new_err(format!("CreateEdge failed: {:?}", e)))
+    /// Create `from -> to` edges of `kind` for every entry in `to_ids` under a
+    /// single engine lock. Returns the new edge IDs in input order.
+    #[pyo3(signature = (from_id, to_ids, kind))]
+    fn create_edges_batch(&self, from_id: u32, to_ids: Vec<u32>, kind: u8) -> PyResult<Vec<u32>> {
+        let mut engine = lock_engine!(self);
+        to_ids
+            .into_iter()
+            .map(|to| create_edge_locked(&mut engine, from_id, to, kind))
+            .collect()
     }
 
     fn delete_node(&self, node_id: u32) -> PyResult<()> {
@@ -629,6 +694,12 @@ impl ValoricoreEngine {
         Ok((rid, proof_hex))
     }
 
+    /// `insert_with_proof` for a packed f32 buffer; see [`f32s_from_packed`].
+    #[pyo3(signature = (data, tag))]
+    fn insert_with_proof_packed(&self, data: &[u8], tag: u64) -> PyResult<(u32, String)> {
+        self.insert_with_proof(f32s_from_packed(data)?, tag)
+    }
+
     fn get_timeline(&self) -> PyResult<Vec<String>> {
         let engine = lock_engine!(self);
         let Some(committer) = engine.event_committer() else {
@@ -30,8 +30,118 @@ pub fn validate_collection(collection: Option<&str>) -> Result<(), crate::errors
     }
 }
 
+// ── Quantized wire vectors ───────────────────────────────────────────────────
+//
+// `values` / `query` / `vector` (and each of `vectors`) accept either a plain
+// float array or a quantized object the SDK sends with `quant="int8"` /
+// `quant="fp16"`:
+//   {"scale": s, "i8": "<base64 i8[dim]>"}   value[i] = i8[i] * s
+//   {"f16": "<base64 little-endian f16[dim]>"}
+// Both are dequantized here, before any handler sees the request, so the
+// kernel path is unchanged. The plain-array path streams straight into a
+// Vec<f32> with no intermediate buffering.
+
+#[derive(Deserialize)]
+struct QuantizedVector {
+    #[serde(default)]
+    scale: Option<f32>,
+    #[serde(default)]
+    i8: Option<String>,
+    #[serde(default)]
+    f16: Option<String>,
+}
+
+impl QuantizedVector {
+    fn dequantize(self) -> Result<Vec<f32>, String> {
+        use base64::Engine as _;
+        let b64 = |s: &str| {
+            base64::engine::general_purpose::STANDARD
+                .decode(s)
+                .map_err(|e| format!("invalid base64 vector payload: {e}"))
+        };
+        match (self.i8, self.f16) {
+            (Some(q), None) => {
+                let scale = self.scale.ok_or("an i8 vector requires a scale")?;
+                Ok(b64(&q)?.into_iter().map(|b| b as i8 as f32 * scale).collect())
+            }
+            (None, Some(h)) => {
+                let bytes = b64(&h)?;
+                if bytes.len() % 2 != 0 {
+                    return Err("f16 vector payload has an odd byte count".to_string());
+                }
+                Ok(bytes
+                    .chunks_exact(2)
+                    .map(|b| f16_to_f32(u16::from_le_bytes([b[0], b[1]])))
+                    .collect())
+            }
+            _ => Err("a quantized vector needs exactly one of `i8` or `f16`".to_string()),
+        }
+    }
+}
+
+/// IEEE 754 binary16 → binary32 (exact; every f16 is representable).
+fn f16_to_f32(h: u16) -> f32 {
+    let sign = ((h >> 15) as u32) << 31;
+    let exp = ((h >> 10) & 0x1f) as u32;
+    let man = (h & 0x3ff) as u32;
+    match exp {
+        0 => {
+            // Zero or subnormal: man * 2^-24.
+            let v = man as f32 / 16_777_216.0;
+            if sign != 0 {
+                -v
+            } else {
+                v
+            }
+        }
+        0x1f => f32::from_bits(sign | 0x7f80_0000 | (man << 13)),
+        _ => f32::from_bits(sign | ((exp + 112) << 23) | (man << 13)),
+    }
+}
+
+struct WireVectorVisitor;
+
+impl<'de> serde::de::Visitor<'de> for WireVectorVisitor {
+    type Value = Vec<f32>;
+
+    fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+        f.write_str("a float array or a quantized {scale, i8} / {f16} object")
+    }
+
+    fn visit_seq<A: serde::de::SeqAccess<'de>>(self, mut seq: A) -> Result<Vec<f32>, A::Error> {
+        let mut out = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(x) = seq.next_element()? {
+            out.push(x);
+        }
+        Ok(out)
+    }
+
+    fn visit_map<A: serde::de::MapAccess<'de>>(self, map: A) -> Result<Vec<f32>, A::Error> {
+        QuantizedVector::deserialize(serde::de::value::MapAccessDeserializer::new(map))?
+            .dequantize()
+            .map_err(serde::de::Error::custom)
+    }
+}
+
+/// `deserialize_with` for vector fields that accept quantized payloads.
+pub fn de_wire_vector<'de, D: serde::Deserializer<'de>>(d: D) -> Result<Vec<f32>, D::Error> {
+    d.deserialize_any(WireVectorVisitor)
+}
+
+#[derive(Deserialize)]
+struct WireVector(#[serde(deserialize_with = "de_wire_vector")] Vec<f32>);
+
+/// `deserialize_with` for lists of vectors; each element may be quantized.
+pub fn de_wire_vectors<'de, D: serde::Deserializer<'de>>(
+    d: D,
+) -> Result<Vec<Vec<f32>>, D::Error> {
+    let vectors = Vec::<WireVector>::deserialize(d)?;
+    Ok(vectors.into_iter().map(|v| v.0).collect())
+}
+
 #[derive(Deserialize)]
 pub struct InsertRecordRequest {
+    #[serde(deserialize_with = "de_wire_vector")]
     pub values: Vec<f32>,
     #[serde(default)]
     pub collection: Option<String>,
@@ -91,6 +201,7 @@ pub struct DeleteRecordResponse {
 
 #[derive(Deserialize)]
 pub struct SearchRequest {
+    #[serde(deserialize_with = "de_wire_vector")]
     pub query: Vec<f32>,
     pub k: usize,
     #[serde(default)]
@@ -317,6 +428,7 @@ pub struct GetEdgesResponse {
 
 #[derive(Deserialize)]
 pub struct MemoryUpsertVectorRequest {
+    #[serde(deserialize_with = "de_wire_vector")]
     pub vector: Vec<f32>,
     #[serde(default)]
     pub collection: Option<String>,
@@ -328,12 +440,52 @@ pub struct MemoryUpsertVectorRequest {
     pub metadata: Option<serde_json::Value>,
 }
 
+/// Body of `POST /v1/memory/upsert_vectors` — one document's chunks in a
+/// single request. `tags` / `metadata` apply to every chunk.
+#[derive(Deserialize)]
+pub struct MemoryUpsertVectorsRequest {
+    #[serde(deserialize_with = "de_wire_vectors")]
+    pub vectors: Vec<Vec<f32>>,
+    #[serde(default)]
+    pub collection: Option<String>,
+    pub attach_to_document_node: Option<u32>,
+    #[serde(default)]
+    pub tags: Option<Vec<String>>,
+    #[serde(default)]
+    pub metadata: Option<serde_json::Value>,
+}
+
+/// Query string of `POST /v1/memory/upsert_vector_q16`. The body is the
+/// vector itself: little-endian `i32` Q16.16 raw values, 4 bytes per dim.
+#[derive(Deserialize, Default)]
+pub struct MemoryUpsertQ16Query {
+    #[serde(default)]
+    pub collection: Option<String>,
+    pub attach_to_document_node: Option<u32>,
+}
+
+#[derive(Serialize)]
+pub struct MemoryUpsertVectorsResponse {
+    pub document_node_id: u32,
+    pub memory_ids: Vec<String>,
+    pub record_ids: Vec<u32>,
+    pub chunk_node_ids: Vec<u32>,
+    /// Per-chunk `proof_hash`, as in `MemoryUpsertResponse`.
+    pub proof_hashes: Vec<String>,
+    /// Log index of the last chunk's commit (cluster mode only).
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub log_index: Option<u64>,
+}
+
 #[derive(Serialize)]
 pub struct MemoryUpsertResponse {
     pub memory_id: String,
     pub record_id: u32,
     pub document_node_id: u32,
     pub chunk_node_id: u32,
+    /// Hex Merkle root of the stored vector's Q16.16 values
+    /// (`generate_proof_bytes`), as committed in its insert receipt.
+    pub proof_hash: String,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub log_index: Option<u64>,
 }
@@ -421,6 +573,19 @@ pub struct MetadataSetResponse {
     pub success: bool,
 }
 
+/// Body of `POST /v1/memory/meta/set_batch` — one entry per `meta/set` call
+/// the client coalesced.
+#[derive(Deserialize, Serialize, Debug)]
+pub struct MetadataSetBatchRequest {
+    pub items: Vec<MetadataSetRequest>,
+}
+
+#[derive(Serialize, Debug)]
+pub struct MetadataSetBatchResponse {
+    pub success: bool,
+    pub count: usize,
+}
+
 #[derive(Deserialize, Serialize, Debug)]
 pub struct MetadataGetRequest {
     pub target_id: String,
@@ -492,6 +657,14 @@ pub struct BatchInsertRequest {
     pub texts: Option<Vec<Option<String>>>,
 }
 
+/// Query string of `POST /v1/vectors/insert_bin` and `/v1/vectors/search_bin`.
+/// The body is a binary frame; see `routes::binary`.
+#[derive(Deserialize, Default)]
+pub struct BinaryVectorsQuery {
+    #[serde(default)]
+    pub collection: Option<String>,
+}
+
 #[derive(Serialize, Deserialize, Debug)]
 pub struct BatchInsertResponse {
     pub ids: Vec<u32>,
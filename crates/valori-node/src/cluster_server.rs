@@ -356,6 +356,8 @@ pub fn build_cluster_router_with_keys(
         .route("/v1/delete", post(delete_record))
         .route("/v1/soft-delete", post(soft_delete_record))
         .route("/v1/vectors/batch-insert", post(batch_insert))
+        .route("/v1/vectors/insert_bin", post(insert_bin))
+        .route("/v1/vectors/search_bin", post(search_bin))
         .route(
             "/v1/namespaces",
             post(create_collection_handler).get(list_collections_handler),
@@ -412,9 +414,12 @@ pub fn build_cluster_router_with_keys(
         .route("/v1/memory/contradict", post(cluster_memory_contradict))
         .route("/v1/memory/upsert", post(cluster_memory_upsert))
         .route("/v1/memory/upsert_vector", post(cluster_memory_upsert))
+        .route("/v1/memory/upsert_vectors", post(cluster_memory_upsert_vectors))
+        .route("/v1/memory/upsert_vector_q16", post(cluster_memory_upsert_q16))
         .route("/v1/memory/search", post(cluster_memory_search))
         .route("/v1/memory/search_vector", post(cluster_memory_search))
         .route("/v1/memory/meta/set", post(cluster_meta_set))
+        .route("/v1/memory/meta/set_batch", post(cluster_meta_set_batch))
         .route("/v1/memory/meta/get", axum::routing::get(cluster_meta_get))
         .route("/v1/graph/nodes", get(cluster_list_nodes))
         .route("/v1/models/health", get(cluster_models_health))
@@ -428,6 +433,7 @@ pub fn build_cluster_router_with_keys(
         )
         .route("/v1/snapshot/save", post(cluster_snapshot_save))
         .route("/v1/snapshot/restore", post(cluster_snapshot_restore))
+        // zstd for `Accept-Encoding: zstd` (see `server::snapshot_response`).
         .route("/v1/snapshot/download", get(cluster_snapshot_download));
 
     // ── Deprecated legacy routes ──────────────────────────────────────────────
@@ -698,6 +704,7 @@ async fn raft_write_data(
 
 #[derive(Deserialize)]
 struct InsertRequest {
+    #[serde(deserialize_with = "crate::api::de_wire_vector")]
     values: Vec<f32>,
     #[serde(default)]
     metadata: Option<Vec<u8>>,
@@ -882,6 +889,7 @@ enum Consistency {
 
 #[derive(Deserialize)]
 struct SearchRequest {
+    #[serde(deserialize_with = "crate::api::de_wire_vector")]
     query: Vec<f32>,
     #[serde(default = "default_k")]
     k: usize,
@@ -1455,6 +1463,30 @@ async fn update_record_metadata(
     Ok(Json(serde_json::json!({ "ok": true, "id": id })))
 }
 
+/// `search` with a binary `dim | k | f32[dim]` body (see `routes::binary`).
+async fn search_bin(
+    state: State<DataPlaneState>,
+    receipts: axum::Extension<Arc<valori_effect::ReceiptStore>>,
+    Query(q): Query<crate::api::BinaryVectorsQuery>,
+    body: axum::body::Bytes,
+) -> Response {
+    let (query, k) = match crate::routes::binary::decode_search(&body) {
+        Ok(frame) => frame,
+        Err(resp) => return resp,
+    };
+    let req = SearchRequest {
+        query,
+        k,
+        consistency: Consistency::default(),
+        decay_half_life_secs: None,
+        rerank: false,
+        query_text: None,
+        metadata_filter: None,
+        collection: q.collection,
+    };
+    search(state, receipts, Json(req)).await
+}
+
 // ── Batch insert ──────────────────────────────────────────────────────────────
 // Wire-compatible with the standalone server: request `{ batch: [[f32]] }`,
 // response `{ ids: [u32] }`. Any rejected vector fails the whole batch with a
@@ -1479,6 +1511,26 @@ struct BatchInsertRequest {
     collection: Option<String>,
 }
 
+/// `batch_insert` with a binary `dim | n | f32[dim * n]` body.
+async fn insert_bin(
+    state: State<DataPlaneState>,
+    receipts: axum::Extension<Arc<valori_effect::ReceiptStore>>,
+    Query(q): Query<crate::api::BinaryVectorsQuery>,
+    body: axum::body::Bytes,
+) -> Response {
+    let batch = match crate::routes::binary::decode_insert(&body) {
+        Ok(batch) => batch,
+        Err(resp) => return resp,
+    };
+    let req = BatchInsertRequest {
+        batch,
+        metadata: None,
+        texts: None,
+        collection: q.collection,
+    };
+    batch_insert(state, receipts, Json(req)).await
+}
+
 async fn batch_insert(
     State(state): State<DataPlaneState>,
     axum::Extension(receipts): axum::Extension<Arc<valori_effect::ReceiptStore>>,
@@ -3005,6 +3057,13 @@ async fn cluster_meta_set(
     crate::routes::meta::meta_set(&state, payload).await
 }
 
+async fn cluster_meta_set_batch(
+    State(state): State<DataPlaneState>,
+    Json(payload): Json<crate::api::MetadataSetBatchRequest>,
+) -> Result<Json<crate::api::MetadataSetBatchResponse>, Response> {
+    crate::routes::meta::meta_set_batch(&state, payload).await
+}
+
 async fn cluster_meta_get(
     State(state): State<DataPlaneState>,
     axum::extract::Query(q): axum::extract::Query<crate::api::MetadataGetRequest>,
@@ -4785,13 +4844,35 @@ async fn cluster_memory_upsert(
     crate::routes::memory::memory_upsert(&state, &receipts, payload).await
 }
 
+async fn cluster_memory_upsert_vectors(
+    State(state): State<DataPlaneState>,
+    axum::Extension(receipts): axum::Extension<std::sync::Arc<valori_effect::ReceiptStore>>,
+    Json(payload): Json<crate::api::MemoryUpsertVectorsRequest>,
+) -> Result<Json<crate::api::MemoryUpsertVectorsResponse>, Response> {
+    crate::routes::memory::memory_upsert_batch(&state, &receipts, payload).await
+}
+
+async fn cluster_memory_upsert_q16(
+    State(state): State<DataPlaneState>,
+    axum::Extension(receipts): axum::Extension<std::sync::Arc<valori_effect::ReceiptStore>>,
+    Query(q): Query<crate::api::MemoryUpsertQ16Query>,
+    body: axum::body::Bytes,
+) -> Result<Json<crate::api::MemoryUpsertResponse>, Response> {
+    crate::routes::memory::memory_upsert_q16(&state, &receipts, q, &body).await
+}
+
 // ── Cluster memory search — read-only ────────────────────────────────────────
 
 async fn cluster_memory_search(
     State(state): State<DataPlaneState>,
+    headers: axum::http::HeaderMap,
     Json(payload): Json<crate::api::MemorySearchVectorRequest>,
-) -> Result<Json<crate::api::MemorySearchResponse>, Response> {
-    crate::routes::memory::memory_search(&state, payload).await
+) -> Result<Response, Response> {
+    let Json(resp) = crate::routes::memory::memory_search(&state, payload).await?;
+    if crate::routes::memory::wants_binary_hits(&headers) {
+        return Ok(crate::routes::memory::binary_hits_response(&resp.results));
+    }
+    Ok(Json(resp).into_response())
 }
 
 // ── Cluster timeline — read from events.log if configured ────────────────────
@@ -5228,20 +5309,26 @@ async fn cluster_snapshot_restore() -> Response {
     }))).into_response()
 }
 
-async fn cluster_snapshot_download(State(state): State<DataPlaneState>) -> Response {
+async fn cluster_snapshot_download(
+    State(state): State<DataPlaneState>,
+    headers: axum::http::HeaderMap,
+) -> Response {
     match state.sm.with_state(encode_cluster_snapshot).await {
-        Ok(bytes) => (
-            StatusCode::OK,
-            [
-                (header::CONTENT_TYPE.as_str(), "application/octet-stream"),
-                (
-                    header::CONTENT_DISPOSITION.as_str(),
-                    "attachment; filename=\"cluster-snapshot.snap\"",
-                ),
-            ],
-            bytes,
-        )
-            .into_response(),
+        Ok(bytes) => {
+            let mut resp = crate::server::snapshot_response(bytes, &headers).await;
+            if resp.status().is_success() {
+                let h = resp.headers_mut();
+                h.insert(
+                    header::CONTENT_TYPE,
+                    HeaderValue::from_static("application/octet-stream"),
+                );
+                h.insert(
+                    header::CONTENT_DISPOSITION,
+                    HeaderValue::from_static("attachment; filename=\"cluster-snapshot.snap\""),
+                );
+            }
+            resp
+        }
         Err(e) => (
             StatusCode::INTERNAL_SERVER_ERROR,
             Json(serde_json::json!({
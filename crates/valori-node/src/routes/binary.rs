@@ -0,0 +1,60 @@
+// Copyright (c) 2025 Varshith Gudur. Dual-licensed under MIT OR Apache-2.0.
+//! Binary vector frames — shared decoding for `POST /v1/vectors/insert_bin`
+//! and `POST /v1/vectors/search_bin`.
+//!
+//! Frame: `dim: u32 | n: u32 | f32[dim * n]`, all little-endian. For
+//! `insert_bin`, `n` is the number of vectors; `search_bin` carries one query
+//! vector and `n` is `k`. `collection` travels in the query string.
+//!
+//! Each router builds its ordinary JSON request type from the decoded frame
+//! and serves it through its existing `/v1/vectors/batch-insert` /
+//! `/v1/search` handler, so validation, receipts and (cluster) replication
+//! are those of the JSON routes. Only the body encoding differs — 4 bytes per
+//! float instead of a decimal string. Binary search never BM25-reranks: the
+//! frame cannot carry `query_text`.
+
+use axum::http::StatusCode;
+use axum::response::{IntoResponse, Response};
+use axum::Json;
+
+fn bad_frame(msg: String) -> Response {
+    (StatusCode::BAD_REQUEST, Json(serde_json::json!({ "error": msg }))).into_response()
+}
+
+/// Split a frame into its `n` header field and `dim`-wide rows.
+fn decode_frame(
+    body: &[u8],
+    rows: impl Fn(u32) -> usize,
+) -> Result<(u32, Vec<Vec<f32>>), Response> {
+    if body.len() < 8 {
+        return Err(bad_frame(
+            "body must start with little-endian u32 dim and u32 n".to_string(),
+        ));
+    }
+    let dim = u32::from_le_bytes([body[0], body[1], body[2], body[3]]) as usize;
+    let n = u32::from_le_bytes([body[4], body[5], body[6], body[7]]);
+    let count = rows(n);
+    let payload = &body[8..];
+    if dim == 0 || dim.checked_mul(count).and_then(|c| c.checked_mul(4)) != Some(payload.len()) {
+        return Err(bad_frame(format!(
+            "expected {count} x {dim} little-endian f32 values after the header, got {} bytes",
+            payload.len()
+        )));
+    }
+    let floats: Vec<f32> = payload
+        .chunks_exact(4)
+        .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+        .collect();
+    Ok((n, floats.chunks_exact(dim).map(<[f32]>::to_vec).collect()))
+}
+
+/// Decode an `insert_bin` frame into its `n` rows.
+pub fn decode_insert(body: &[u8]) -> Result<Vec<Vec<f32>>, Response> {
+    decode_frame(body, |n| n as usize).map(|(_, rows)| rows)
+}
+
+/// Decode a `search_bin` frame into its query vector and `k`.
+pub fn decode_search(body: &[u8]) -> Result<(Vec<f32>, usize), Response> {
+    let (k, mut rows) = decode_frame(body, |_| 1)?;
+    Ok((rows.pop().unwrap_or_default(), k as usize))
+}
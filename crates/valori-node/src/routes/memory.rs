@@ -1,12 +1,24 @@
 // Copyright (c) 2025 Varshith Gudur. Dual-licensed under MIT OR Apache-2.0.
-//! Memory domain — shared bodies for `POST /v1/memory/upsert`, `POST /v1/memory/search`,
-//! `POST /v1/memory/consolidate`, and `POST /v1/memory/contradict` (and aliases).
+//! Memory domain — shared bodies for `POST /v1/memory/upsert`, `POST /v1/memory/upsert_vectors`,
+//! `POST /v1/memory/upsert_vector_q16`, `POST /v1/memory/search`, `POST /v1/memory/consolidate`, and `POST /v1/memory/contradict`
+//! (and aliases).
 //!
 //! Canonical behavior (both paths, enforced here):
 //! * Unknown `collection` -> 404 Not Found.
 //! * Consolidate sets metadata if provided in the payload on BOTH paths (previously omitted on cluster).
 //! * Contradict checks similarity threshold and commits Contradicts edge identically on both paths.
 //! * Upsert, consolidate, and contradict emit write receipts through `receipt_bridge`.
+//! * Upsert responses carry `proof_hash`, computed from the vector as stored (after
+//!   any int8/fp16 dequantization), so clients never have to compute their own.
+//! * `upsert_vectors` is N upserts in one request: the first chunk creates (or attaches
+//!   to) the document node and the rest attach to it, each committed and receipted
+//!   exactly like a single upsert. A failure stops the batch; earlier chunks stay.
+//! * `upsert_vector_q16` is `upsert` with the vector pre-quantized by the client as
+//!   raw Q16.16 `i32`s in a binary body. Decoding goes through `fxp::ops::to_f32`,
+//!   which `from_f32` maps back to the same raw value, so the stored record is
+//!   bit-identical to the JSON route's.
+//! * Search answers `Accept: application/x-valori-hits` with the compact binary
+//!   encoding from `binary_hits_response` instead of JSON, on both paths.
 //! * Read consistency for search: cluster mode executes read-index check via `ensure_read_consistency`
 //!   before searching, while standalone mode executes a zero-overhead local read.
 
@@ -18,7 +30,8 @@ use std::sync::Arc;
 use crate::api::{
     MemoryConsolidateRequest, MemoryConsolidateResponse, MemoryContradictRequest,
     MemoryContradictResponse, MemorySearchHit, MemorySearchResponse, MemorySearchVectorRequest,
-    MemoryUpsertResponse, MemoryUpsertVectorRequest,
+    MemoryUpsertQ16Query, MemoryUpsertResponse, MemoryUpsertVectorRequest,
+    MemoryUpsertVectorsRequest, MemoryUpsertVectorsResponse,
 };
 
 /// Outcome of a memory vector upsert.
@@ -124,6 +137,95 @@ async fn resolve<O: MemoryOps>(ops: &O, collection: Option<&str>) -> Result<u16,
     })
 }
 
+fn emit_upsert_receipt(
+    receipts: &Arc<valori_effect::ReceiptStore>,
+    collection: Option<&str>,
+    ns: u16,
+    u: UpsertedMemory,
+) {
+    use valori_planner::operation::{OperationInputs, OperationKind};
+    let inputs = OperationInputs::MemoryUpsert {
+        collection: collection.unwrap_or("default").to_string(),
+        shard_id: u.shard_id,
+    };
+    crate::receipt_bridge::emit_write(
+        receipts,
+        OperationKind::MemoryUpsert,
+        &inputs,
+        ns,
+        u.shard_id,
+        u.log_index.unwrap_or(0),
+        u.cluster,
+        u.state_before,
+        u.state_after,
+    );
+}
+
+/// Hex `generate_proof_bytes` root of `vector`'s Q16.16 values: the proof the
+/// insert receipt commits for the stored record.
+fn vector_proof_hex(vector: &[f32]) -> String {
+    let fxp: Vec<i32> = vector
+        .iter()
+        .map(|&f| valori_kernel::fxp::ops::from_f32(f).0)
+        .collect();
+    valori_kernel::proof::generate_proof_bytes(&fxp)
+        .iter()
+        .map(|b| format!("{b:02x}"))
+        .collect()
+}
+
+pub async fn memory_upsert_batch<O: MemoryOps>(
+    ops: &O,
+    receipts: &Arc<valori_effect::ReceiptStore>,
+    req: MemoryUpsertVectorsRequest,
+) -> Result<Json<MemoryUpsertVectorsResponse>, Response> {
+    if req.vectors.is_empty() {
+        return Err((
+            StatusCode::BAD_REQUEST,
+            Json(serde_json::json!({"error": "vectors must not be empty"})),
+        )
+            .into_response());
+    }
+    let ns = resolve(ops, req.collection.as_deref()).await?;
+
+    let n = req.vectors.len();
+    let mut memory_ids = Vec::with_capacity(n);
+    let mut record_ids = Vec::with_capacity(n);
+    let mut chunk_node_ids = Vec::with_capacity(n);
+    let mut proof_hashes = Vec::with_capacity(n);
+    let mut document_node_id = req.attach_to_document_node;
+    let mut log_index = None;
+
+    for vector in req.vectors {
+        let proof_hash = vector_proof_hex(&vector);
+        let item = MemoryUpsertVectorRequest {
+            vector,
+            collection: req.collection.clone(),
+            attach_to_document_node: document_node_id,
+            tags: req.tags.clone(),
+            metadata: req.metadata.clone(),
+        };
+        let u = ops.upsert_vector(ns, &item).await?;
+        document_node_id = Some(u.document_node_id);
+        log_index = u.log_index;
+        memory_ids.push(u.memory_id.clone());
+        record_ids.push(u.record_id);
+        chunk_node_ids.push(u.chunk_node_id);
+        proof_hashes.push(proof_hash);
+        emit_upsert_receipt(receipts, req.collection.as_deref(), ns, u);
+    }
+
+    Ok(Json(MemoryUpsertVectorsResponse {
+        // Non-empty batch: the first upsert always sets it.
+        document_node_id: document_node_id.unwrap_or_default(),
+        memory_ids,
+        record_ids,
+        chunk_node_ids,
+        proof_hashes,
+        log_index,
+    }))
+}
+
 pub async fn memory_upsert<O: MemoryOps>(
     ops: &O,
     receipts: &Arc<valori_effect::ReceiptStore>,
@@ -131,31 +233,78 @@ pub async fn memory_upsert<O: MemoryOps>(
 ) -> Result<Json<MemoryUpsertResponse>, Response> {
     let ns = resolve(ops, req.collection.as_deref()).await?;
     let u = ops.upsert_vector(ns, &req).await?;
-    {
-        use valori_planner::operation::{OperationInputs, OperationKind};
-        let inputs = OperationInputs::MemoryUpsert {
-            collection: req.collection.clone().unwrap_or_else(|| "default".into()),
-            shard_id: u.shard_id,
-        };
-        crate::receipt_bridge::emit_write(
-            receipts,
-            OperationKind::MemoryUpsert,
-            &inputs,
-            ns,
-            u.shard_id,
-            u.log_index.unwrap_or(0),
-            u.cluster,
-            u.state_before,
-            u.state_after,
-        );
-    }
-    Ok(Json(MemoryUpsertResponse {
-        memory_id: u.memory_id,
+    let resp = MemoryUpsertResponse {
+        memory_id: u.memory_id.clone(),
         record_id: u.record_id,
         document_node_id: u.document_node_id,
         chunk_node_id: u.chunk_node_id,
+        proof_hash: vector_proof_hex(&req.vector),
         log_index: u.log_index,
-    }))
+    };
+    emit_upsert_receipt(receipts, req.collection.as_deref(), ns, u);
+    Ok(Json(resp))
+}
+
+pub async fn memory_upsert_q16<O: MemoryOps>(
+    ops: &O,
+    receipts: &Arc<valori_effect::ReceiptStore>,
+    q: MemoryUpsertQ16Query,
+    body: &[u8],
+) -> Result<Json<MemoryUpsertResponse>, Response> {
+    use valori_kernel::fxp::ops::to_f32;
+    use valori_kernel::types::scalar::FxpScalar;
+
+    if body.is_empty() || body.len() % 4 != 0 {
+        return Err((
+            StatusCode::BAD_REQUEST,
+            Json(serde_json::json!({
+                "error": "body must be little-endian i32 Q16.16 values (4 bytes per dimension)"
+            })),
+        )
+            .into_response());
+    }
+    let vector = body
+        .chunks_exact(4)
+        .map(|b| to_f32(FxpScalar(i32::from_le_bytes([b[0], b[1], b[2], b[3]]))))
+        .collect();
+    let req = MemoryUpsertVectorRequest {
+        vector,
+        collection: q.collection,
+        attach_to_document_node: q.attach_to_document_node,
+        tags: None,
+        metadata: None,
+    };
+    memory_upsert(ops, receipts, req).await
+}
+
+/// Media type of the compact search response: a `u32` hit count, then per hit
+/// a `u32` record id and an `f32` score, all little-endian (8 bytes per hit).
+/// Memory ids are `rec:<record_id>`; metadata and decay fields are omitted.
+pub const BINARY_HITS_MEDIA_TYPE: &str = "application/x-valori-hits";
+
+/// True when the request's `Accept` header lists [`BINARY_HITS_MEDIA_TYPE`].
+pub fn wants_binary_hits(headers: &axum::http::HeaderMap) -> bool {
+    headers
+        .get(axum::http::header::ACCEPT)
+        .and_then(|v| v.to_str().ok())
+        .map_or(false, |v| {
+            v.split(',')
+                .any(|t| t.split(';').next().map(str::trim) == Some(BINARY_HITS_MEDIA_TYPE))
+        })
+}
+
+pub fn binary_hits_response(results: &[MemorySearchHit]) -> Response {
+    let mut body = Vec::with_capacity(4 + results.len() * 8);
+    body.extend_from_slice(&(results.len() as u32).to_le_bytes());
+    for hit in results {
+        body.extend_from_slice(&hit.record_id.to_le_bytes());
+        body.extend_from_slice(&hit.score.to_le_bytes());
+    }
+    (
+        [(axum::http::header::CONTENT_TYPE, BINARY_HITS_MEDIA_TYPE)],
+        body,
+    )
+        .into_response()
 }
 
 pub async fn memory_search<O: MemoryOps>(
@@ -1,17 +1,21 @@
 // Copyright (c) 2025 Varshith Gudur. Dual-licensed under MIT OR Apache-2.0.
-//! Metadata sidecar — shared bodies for `POST /v1/memory/meta/set` and
-//! `GET /v1/memory/meta/get`.
+//! Metadata sidecar — shared bodies for `POST /v1/memory/meta/set`,
+//! `POST /v1/memory/meta/set_batch` and `GET /v1/memory/meta/get`.
 //!
 //! Canonical wire format (both paths, enforced here):
 //! * set → `{"success": true}`. (The cluster path previously answered
 //!   `{"ok": true}` — a silent wire divergence from standalone.)
+//! * set_batch → `{"success": true, "count": n}`. Items are applied in order,
+//!   each through the same audited `set_meta` as a single set; the first
+//!   failure aborts the batch and earlier items stay committed.
 //! * get → `{"target_id": …, "metadata": …}` with `metadata: null` when unset.
 
 use axum::response::Response;
 use axum::Json;
 
 use crate::api::{
-    MetadataGetRequest, MetadataGetResponse, MetadataSetRequest, MetadataSetResponse,
+    MetadataGetRequest, MetadataGetResponse, MetadataSetBatchRequest, MetadataSetBatchResponse,
+    MetadataSetRequest, MetadataSetResponse,
 };
 
 #[async_trait::async_trait]
@@ -34,6 +38,20 @@ pub async fn meta_set<O: MetaOps>(
     Ok(Json(MetadataSetResponse { success: true }))
 }
 
+pub async fn meta_set_batch<O: MetaOps>(
+    ops: &O,
+    req: MetadataSetBatchRequest,
+) -> Result<Json<MetadataSetBatchResponse>, Response> {
+    let count = req.items.len();
+    for item in req.items {
+        ops.set_meta(item.target_id, item.metadata).await?;
+    }
+    Ok(Json(MetadataSetBatchResponse {
+        success: true,
+        count,
+    }))
+}
+
 pub async fn meta_get<O: MetaOps>(ops: &O, req: MetadataGetRequest) -> Json<MetadataGetResponse> {
     let metadata = ops.get_meta(&req.target_id).await;
     Json(MetadataGetResponse {
@@ -30,6 +30,7 @@
 //! built through [`crate::errors::EngineError`] so both paths emit the same
 //! canonical `{"error": …}` body shape.
 
+pub mod binary;
 pub mod collections;
 pub mod explain;
 pub mod graph;
@@ -274,18 +274,26 @@ pub fn build_router_with_keys(
         .route("/v1/delete", post(delete_record))
         .route("/v1/soft-delete", post(soft_delete_record))
         .route("/v1/vectors/batch-insert", post(batch_insert))
+        .route("/v1/vectors/insert_bin", post(insert_bin))
+        .route("/v1/vectors/search_bin", post(search_bin))
         .route("/v1/graphrag", post(graphrag))
+        // zstd on the wire, negotiated per request: the download is compressed
+        // for `Accept-Encoding: zstd`, an upload with `Content-Encoding: zstd`
+        // is decompressed before `restore` sees it. Plain transfers unchanged.
         .route("/v1/snapshot/download", axum::routing::get(snapshot))
         .route("/v1/snapshot/upload", post(restore))
         .route("/v1/snapshot/save", post(snapshot_save))
         .route("/v1/snapshot/restore", post(snapshot_restore))
         .route("/v1/memory/upsert", post(memory_upsert_vector))
         .route("/v1/memory/upsert_vector", post(memory_upsert_vector))
+        .route("/v1/memory/upsert_vectors", post(memory_upsert_vectors))
+        .route("/v1/memory/upsert_vector_q16", post(memory_upsert_vector_q16))
         .route("/v1/memory/search", post(memory_search_vector))
         .route("/v1/memory/search_vector", post(memory_search_vector))
         .route("/v1/memory/consolidate", post(memory_consolidate))
         .route("/v1/memory/contradict", post(memory_contradict))
         .route("/v1/memory/meta/set", post(meta_set))
+        .route("/v1/memory/meta/set_batch", post(meta_set_batch))
         .route("/v1/memory/meta/get", axum::routing::get(meta_get))
         .route("/v1/proof/state", axum::routing::get(get_proof))
         .route("/v1/proof/event-log", axum::routing::get(get_event_proof))
@@ -1020,6 +1028,13 @@ async fn meta_set(
     crate::routes::meta::meta_set(&state, payload).await
 }
 
+async fn meta_set_batch(
+    State(state): State<SharedEngine>,
+    Json(payload): Json<MetadataSetBatchRequest>,
+) -> Result<Json<MetadataSetBatchResponse>, Response> {
+    crate::routes::meta::meta_set_batch(&state, payload).await
+}
+
 async fn meta_get(
     State(state): State<SharedEngine>,
     Query(payload): Query<MetadataGetRequest>,
@@ -1262,6 +1277,49 @@ async fn batch_insert(
     Ok(Json(BatchInsertResponse { ids }))
 }
 
+/// `batch_insert` with a binary `dim | n | f32[dim * n]` body.
+async fn insert_bin(
+    state: State<SharedEngine>,
+    receipts: axum::Extension<Arc<valori_effect::ReceiptStore>>,
+    Query(q): Query<crate::api::BinaryVectorsQuery>,
+    body: axum::body::Bytes,
+) -> Result<Json<BatchInsertResponse>, Response> {
+    let req = BatchInsertRequest {
+        batch: crate::routes::binary::decode_insert(&body)?,
+        collection: q.collection,
+        metadata: None,
+        request_ids: None,
+        texts: None,
+    };
+    batch_insert(state, receipts, Json(req))
+        .await
+        .map_err(IntoResponse::into_response)
+}
+
+/// `search` with a binary `dim | k | f32[dim]` body.
+async fn search_bin(
+    state: State<SharedEngine>,
+    receipts: axum::Extension<Arc<valori_effect::ReceiptStore>>,
+    Query(q): Query<crate::api::BinaryVectorsQuery>,
+    body: axum::body::Bytes,
+) -> Result<Json<SearchResponse>, Response> {
+    let (query, k) = crate::routes::binary::decode_search(&body)?;
+    let req = SearchRequest {
+        query,
+        k,
+        collection: q.collection,
+        as_of: None,
+        as_of_log_index: None,
+        decay_half_life_secs: None,
+        rerank: false,
+        query_text: None,
+        metadata_filter: None,
+    };
+    search(state, receipts, Json(req))
+        .await
+        .map_err(IntoResponse::into_response)
+}
+
 async fn search(
     State(state): State<SharedEngine>,
     axum::Extension(receipts): axum::Extension<Arc<valori_effect::ReceiptStore>>,
@@ -1892,20 +1950,99 @@ async fn graphrag(
     Ok(Json(result))
 }
 
-async fn snapshot(State(state): State<SharedEngine>) -> Result<Vec<u8>, EngineError> {
-    let engine = state.read().await;
-    engine.snapshot()
+async fn snapshot(
+    State(state): State<SharedEngine>,
+    headers: axum::http::HeaderMap,
+) -> Result<Response, EngineError> {
+    let bytes = state.read().await.snapshot()?;
+    Ok(snapshot_response(bytes, &headers).await)
 }
 
 async fn restore(
     State(state): State<SharedEngine>,
+    headers: axum::http::HeaderMap,
     body: axum::body::Bytes,
-) -> Result<(), EngineError> {
+) -> Result<(), Response> {
+    let body = decode_snapshot_upload(&headers, body)?;
     let mut engine = state.write().await;
-    engine.restore(&body)?;
+    engine.restore(&body).map_err(IntoResponse::into_response)?;
     Ok(())
 }
 
+/// True when `Accept-Encoding` lists `zstd` (and does not refuse it with `q=0`).
+fn accepts_zstd(headers: &axum::http::HeaderMap) -> bool {
+    headers
+        .get_all(axum::http::header::ACCEPT_ENCODING)
+        .iter()
+        .filter_map(|v| v.to_str().ok())
+        .flat_map(|v| v.split(','))
+        .any(|coding| {
+            let mut parts = coding.split(';').map(str::trim);
+            parts.next().is_some_and(|name| name.eq_ignore_ascii_case("zstd"))
+                && !parts.any(|p| p.replace(' ', "") == "q=0")
+        })
+}
+
+/// Snapshot download body, zstd-compressed when the client asked for it.
+/// Plain clients get the raw bytes unchanged.
+pub(crate) async fn snapshot_response(bytes: Vec<u8>, headers: &axum::http::HeaderMap) -> Response {
+    use axum::http::header::{CONTENT_ENCODING, VARY};
+
+    if accepts_zstd(headers) {
+        let compressed = tokio::task::spawn_blocking(move || {
+            let encoded = zstd::encode_all(&bytes[..], 0);
+            encoded.map_err(|_| bytes)
+        })
+        .await;
+        return match compressed {
+            Ok(Ok(body)) => (
+                [(CONTENT_ENCODING, "zstd"), (VARY, "accept-encoding")],
+                body,
+            )
+                .into_response(),
+            // Compression is best-effort: fall back to the plain bytes.
+            Ok(Err(bytes)) => ([(VARY, "accept-encoding")], bytes).into_response(),
+            Err(e) => (
+                StatusCode::INTERNAL_SERVER_ERROR,
+                Json(serde_json::json!({"error": format!("snapshot compression failed: {e}")})),
+            )
+                .into_response(),
+        };
+    }
+    ([(VARY, "accept-encoding")], bytes).into_response()
+}
+
+/// Snapshot upload body with any `Content-Encoding: zstd` removed.
+/// Other encodings are rejected with 415 so clients resend uncompressed.
+fn decode_snapshot_upload(
+    headers: &axum::http::HeaderMap,
+    body: axum::body::Bytes,
+) -> Result<axum::body::Bytes, Response> {
+    let encoding = match headers.get(axum::http::header::CONTENT_ENCODING) {
+        None => return Ok(body),
+        Some(v) => v.to_str().unwrap_or("").trim(),
+    };
+    if encoding.is_empty() || encoding.eq_ignore_ascii_case("identity") {
+        return Ok(body);
+    }
+    if !encoding.eq_ignore_ascii_case("zstd") {
+        return Err((
+            StatusCode::UNSUPPORTED_MEDIA_TYPE,
+            Json(serde_json::json!({"error": format!("unsupported content-encoding: {encoding}")})),
+        )
+            .into_response());
+    }
+    zstd::decode_all(&body[..])
+        .map(axum::body::Bytes::from)
+        .map_err(|e| {
+            (
+                StatusCode::BAD_REQUEST,
+                Json(serde_json::json!({"error": format!("invalid zstd body: {e}")})),
+            )
+                .into_response()
+        })
+}
+
 async fn memory_upsert_vector(
     State(state): State<SharedEngine>,
     axum::Extension(receipts): axum::Extension<Arc<valori_effect::ReceiptStore>>,
@@ -1914,13 +2051,31 @@ async fn memory_upsert_vector(
     crate::routes::memory::memory_upsert(&state, &receipts, payload).await
 }
 
+async fn memory_upsert_vectors(
+    State(state): State<SharedEngine>,
+    axum::Extension(receipts): axum::Extension<Arc<valori_effect::ReceiptStore>>,
+    Json(payload): Json<MemoryUpsertVectorsRequest>,
+) -> Result<Json<MemoryUpsertVectorsResponse>, Response> {
+    crate::routes::memory::memory_upsert_batch(&state, &receipts, payload).await
+}
+
+async fn memory_upsert_vector_q16(
+    State(state): State<SharedEngine>,
+    axum::Extension(receipts): axum::Extension<Arc<valori_effect::ReceiptStore>>,
+    Query(q): Query<MemoryUpsertQ16Query>,
+    body: axum::body::Bytes,
+) -> Result<Json<MemoryUpsertResponse>, Response> {
+    crate::routes::memory::memory_upsert_q16(&state, &receipts, q, &body).await
+}
+
 async fn memory_search_vector(
     State(state): State<SharedEngine>,
     axum::Extension(caps): axum::Extension<Arc<valori_effect::capability::CapabilityRegistry>>,
     axum::Extension(task_reg): axum::Extension<Arc<crate::runner::TaskRegistry>>,
     axum::extract::Query(explain): axum::extract::Query<crate::routes::explain::ExplainParams>,
+    headers: axum::http::HeaderMap,
     Json(payload): Json<MemorySearchVectorRequest>,
-) -> Result<Json<serde_json::Value>, Response> {
+) -> Result<Response, Response> {
     use crate::runner::run_graph_inline;
     use axum::http::StatusCode;
     use valori_planner::context::{
@@ -2030,6 +2185,11 @@ async fn memory_search_vector(
         })
         .unwrap_or_default();
 
+    // The binary encoding has no room for an `_execution` block.
+    if crate::routes::memory::wants_binary_hits(&headers) {
+        return Ok(crate::routes::memory::binary_hits_response(&results));
+    }
+
     let execution = if explain.on() {
         let state_hash = { state.read().await.get_proof().final_state_hash };
         Some(crate::routes::explain::execution_block(
@@ -2044,7 +2204,8 @@ async fn memory_search_vector(
     Ok(Json(crate::routes::explain::with_execution(
         MemorySearchResponse { results },
         execution,
-    )))
+    ))
+    .into_response())
 }
 
 async fn get_proof(State(state): State<SharedEngine>) -> impl IntoResponse {
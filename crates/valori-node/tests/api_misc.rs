@@ -5,11 +5,15 @@
 //!   GET  /v1/graph/nodes
 //!   POST /v1/index/rebuild
 //!   POST /v1/delete
-//!   GET  /v1/records/:id
+//!   GET  /v1/records/:id     (+ quantized int8 / fp16 insert and search bodies)
 //!   PATCH /v1/records/:id/metadata
 //!   POST /v1/memory/contradict
-//!   GET  /v1/memory/meta/get  +  POST /v1/memory/meta/set
-//!   GET  /v1/snapshot/download
+//!   POST /v1/memory/upsert_vectors
+//!   POST /v1/memory/upsert_vector_q16
+//!   POST /v1/memory/search_vector  (Accept: application/x-valori-hits)
+//!   POST /v1/vectors/insert_bin  +  POST /v1/vectors/search_bin
+//!   GET  /v1/memory/meta/get  +  POST /v1/memory/meta/set  +  POST /v1/memory/meta/set_batch
+//!   GET  /v1/snapshot/download  (+ zstd Accept-Encoding / Content-Encoding)
 //!   POST /v1/snapshot/restore
 //!   POST /v1/ingest/document   (embed-disabled path)
 //!   POST /v1/ingest/update     (embed-disabled path)
@@ -85,6 +89,26 @@ async fn post_json(router: axum::Router, uri: &str, body: Value) -> (StatusCode,
     (status, json)
 }
 
+async fn post_bytes(router: axum::Router, uri: &str, body: Vec<u8>) -> (StatusCode, Value) {
+    let resp = router
+        .oneshot(
+            Request::builder()
+                .method(Method::POST)
+                .uri(uri)
+                .header("content-type", "application/octet-stream")
+                .body(Body::from(body))
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+    let status = resp.status();
+    let bytes = axum::body::to_bytes(resp.into_body(), 1 << 20)
+        .await
+        .unwrap();
+    let json = serde_json::from_slice(&bytes).unwrap_or(serde_json::json!(null));
+    (status, json)
+}
+
 async fn patch_json(router: axum::Router, uri: &str, body: Value) -> (StatusCode, Value) {
     let resp = router
         .oneshot(
@@ -223,6 +247,77 @@ async fn get_record_by_id_roundtrip() {
     assert!(body["vector"].is_array());
 }
 
+#[tokio::test]
+async fn quantized_vectors_dequantize_on_ingest() {
+    use base64::Engine as _;
+    let b64 = |b: Vec<u8>| base64::engine::general_purpose::STANDARD.encode(b);
+    let (_, router) = engine_router(tiny_cfg());
+    let plain = insert_one(router.clone(), [0.5, -1.0, 0.25, 0.0]).await;
+
+    // The same vector as int8 (scale 0.25) and as little-endian fp16.
+    let i8_body = serde_json::json!({
+        "values": {"scale": 0.25, "i8": b64([2i8, -4, 1, 0].iter().map(|&q| q as u8).collect())}
+    });
+    let f16_bits: [u16; 4] = [0x3800, 0xBC00, 0x3400, 0x0000];
+    let f16 = b64(f16_bits.iter().flat_map(|h| h.to_le_bytes()).collect());
+    let f16_body = serde_json::json!({"values": {"f16": f16.clone()}});
+
+    let (_, expected) = get(router.clone(), &format!("/v1/records/{plain}")).await;
+    let mut receipt_proof = serde_json::Value::Null;
+    for body in [i8_body, f16_body] {
+        let (status, resp) = post_json(router.clone(), "/v1/records", body).await;
+        assert_eq!(status, StatusCode::OK, "{resp}");
+        let (_, rec) = get(router.clone(), &format!("/v1/records/{}", resp["id"])).await;
+        assert_eq!(rec["vector"], expected["vector"]);
+        receipt_proof = resp["receipt"]["proof"].clone();
+    }
+
+    // The fused memory upsert takes the same encodings.
+    let (status, resp) = post_json(
+        router.clone(),
+        "/v1/memory/upsert_vector",
+        serde_json::json!({"vector": {"f16": f16.clone()}}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{resp}");
+    let (_, rec) = get(router.clone(), &format!("/v1/records/{}", resp["record_id"])).await;
+    assert_eq!(rec["vector"], expected["vector"]);
+    // The proof covers the dequantized vector, matching the insert receipt's.
+    assert!(receipt_proof.is_string());
+    assert_eq!(resp["proof_hash"], receipt_proof);
+
+    // So does the document batch upsert, per chunk.
+    let (status, resp) = post_json(
+        router.clone(),
+        "/v1/memory/upsert_vectors",
+        serde_json::json!({"vectors": [{"f16": f16.clone()}, [0.5, -1.0, 0.25, 0.0]]}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{resp}");
+    assert_eq!(resp["proof_hashes"], serde_json::json!([receipt_proof, receipt_proof]));
+
+    let (status, hits) = post_json(
+        router,
+        "/v1/search",
+        serde_json::json!({"query": {"f16": f16}, "k": 1, "rerank": false}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{hits}");
+    assert_eq!(hits["results"][0]["score"].as_f64().unwrap(), 0.0);
+}
+
+#[tokio::test]
+async fn quantized_vector_without_scale_is_rejected() {
+    let (_, router) = engine_router(tiny_cfg());
+    let (status, _) = post_json(
+        router,
+        "/v1/records",
+        serde_json::json!({"values": {"i8": "AgQBAA=="}}),
+    )
+    .await;
+    assert!(status.is_client_error(), "got {status}");
+}
+
 #[tokio::test]
 async fn get_record_by_id_not_found() {
     let (_, router) = engine_router(tiny_cfg());
@@ -306,6 +401,210 @@ async fn contradict_orthogonal_vectors_below_threshold() {
     assert!(body["edge_id"].is_null());
 }
 
+// ── /v1/memory/upsert_vectors ────────────────────────────────────────────────
+
+#[tokio::test]
+async fn upsert_vectors_links_every_chunk_to_one_document() {
+    let (_, router) = engine_router(tiny_cfg());
+
+    let (status, body) = post_json(
+        router,
+        "/v1/memory/upsert_vectors",
+        serde_json::json!({"vectors": [
+            [0.1, 0.2, 0.3, 0.4],
+            [0.5, 0.6, 0.7, 0.8],
+            [0.9, 0.1, 0.2, 0.3],
+        ]}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{body}");
+    assert_eq!(body["record_ids"].as_array().unwrap().len(), 3);
+    assert_eq!(body["chunk_node_ids"].as_array().unwrap().len(), 3);
+    assert_eq!(body["proof_hashes"].as_array().unwrap().len(), 3);
+    let memory_ids: Vec<&str> = body["memory_ids"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|v| v.as_str().unwrap())
+        .collect();
+    let record_ids: Vec<u64> = body["record_ids"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|v| v.as_u64().unwrap())
+        .collect();
+    assert_eq!(
+        memory_ids,
+        record_ids.iter().map(|r| format!("rec:{r}")).collect::<Vec<_>>()
+    );
+    assert!(body["document_node_id"].is_u64());
+}
+
+#[tokio::test]
+async fn upsert_vectors_rejects_empty_batch() {
+    let (_, router) = engine_router(tiny_cfg());
+    let (status, body) = post_json(
+        router,
+        "/v1/memory/upsert_vectors",
+        serde_json::json!({"vectors": []}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::BAD_REQUEST, "{body}");
+}
+
+// ── /v1/memory/upsert_vector_q16 ─────────────────────────────────────────────
+
+#[tokio::test]
+async fn upsert_vector_q16_stores_same_record_as_json() {
+    let (_, router) = engine_router(tiny_cfg());
+    let vec = [0.1f32, -0.25, 3.5, 0.0];
+
+    let (status, json_body) = post_json(
+        router.clone(),
+        "/v1/memory/upsert_vector",
+        serde_json::json!({"vector": vec}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{json_body}");
+
+    let raw: Vec<u8> = vec
+        .iter()
+        .flat_map(|&f| valori_kernel::fxp::ops::from_f32(f).0.to_le_bytes())
+        .collect();
+    let doc = json_body["document_node_id"].as_u64().unwrap();
+    let (status, q16_body) = post_bytes(
+        router.clone(),
+        &format!("/v1/memory/upsert_vector_q16?attach_to_document_node={doc}"),
+        raw,
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{q16_body}");
+    assert_eq!(q16_body["document_node_id"].as_u64().unwrap(), doc);
+
+    let (_, a) = get(
+        router.clone(),
+        &format!("/v1/records/{}", json_body["record_id"]),
+    )
+    .await;
+    let (_, b) = get(router, &format!("/v1/records/{}", q16_body["record_id"])).await;
+    assert_eq!(a["vector"], b["vector"]);
+}
+
+#[tokio::test]
+async fn upsert_vector_q16_rejects_ragged_body() {
+    let (_, router) = engine_router(tiny_cfg());
+    let (status, body) = post_bytes(router, "/v1/memory/upsert_vector_q16", vec![0u8; 6]).await;
+    assert_eq!(status, StatusCode::BAD_REQUEST, "{body}");
+}
+
+// ── /v1/memory/search_vector (binary hits) ──────────────────────────────────
+
+#[tokio::test]
+async fn search_vector_binary_hits_match_json() {
+    let (_, router) = engine_router(tiny_cfg());
+    for vec in [[1.0f32, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]] {
+        let (status, body) = post_json(
+            router.clone(),
+            "/v1/memory/upsert_vector",
+            serde_json::json!({"vector": vec}),
+        )
+        .await;
+        assert_eq!(status, StatusCode::OK, "{body}");
+    }
+    let query = serde_json::json!({"query_vector": [1.0, 0.0, 0.0, 0.0], "k": 2});
+
+    let (status, json_body) =
+        post_json(router.clone(), "/v1/memory/search_vector", query.clone()).await;
+    assert_eq!(status, StatusCode::OK, "{json_body}");
+
+    let resp = router
+        .oneshot(
+            Request::builder()
+                .method(Method::POST)
+                .uri("/v1/memory/search_vector")
+                .header("content-type", "application/json")
+                .header("accept", "application/x-valori-hits, application/json;q=0.5")
+                .body(Body::from(serde_json::to_vec(&query).unwrap()))
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+    assert_eq!(resp.status(), StatusCode::OK);
+    assert_eq!(
+        resp.headers()["content-type"],
+        "application/x-valori-hits"
+    );
+    let bytes = axum::body::to_bytes(resp.into_body(), 1 << 20)
+        .await
+        .unwrap();
+
+    let hits = json_body["results"].as_array().unwrap();
+    let count = u32::from_le_bytes(bytes[..4].try_into().unwrap()) as usize;
+    assert_eq!(count, hits.len());
+    assert_eq!(bytes.len(), 4 + 8 * count);
+    for (i, hit) in hits.iter().enumerate() {
+        let rec = &bytes[4 + 8 * i..4 + 8 * (i + 1)];
+        let id = u32::from_le_bytes(rec[..4].try_into().unwrap());
+        let score = f32::from_le_bytes(rec[4..].try_into().unwrap());
+        assert_eq!(id as u64, hit["record_id"].as_u64().unwrap());
+        assert_eq!(score, hit["score"].as_f64().unwrap() as f32);
+    }
+}
+
+// ── /v1/vectors/insert_bin + /v1/vectors/search_bin ──────────────────────────
+
+fn bin_frame(dim: u32, n: u32, floats: &[f32]) -> Vec<u8> {
+    let mut body = Vec::with_capacity(8 + 4 * floats.len());
+    body.extend_from_slice(&dim.to_le_bytes());
+    body.extend_from_slice(&n.to_le_bytes());
+    for f in floats {
+        body.extend_from_slice(&f.to_le_bytes());
+    }
+    body
+}
+
+#[tokio::test]
+async fn binary_insert_and_search_match_json() {
+    let (_, router) = engine_router(tiny_cfg());
+    let (status, body) = post_bytes(
+        router.clone(),
+        "/v1/vectors/insert_bin",
+        bin_frame(4, 2, &[1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0]),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{body}");
+    assert_eq!(body["ids"].as_array().unwrap().len(), 2);
+
+    let (status, json_body) = post_json(
+        router.clone(),
+        "/v1/search",
+        serde_json::json!({"query": [1.0, 0.0, 0.0, 0.0], "k": 2, "rerank": false}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{json_body}");
+    let (status, bin_body) = post_bytes(
+        router,
+        "/v1/vectors/search_bin",
+        bin_frame(4, 2, &[1.0, 0.0, 0.0, 0.0]),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "{bin_body}");
+    assert_eq!(bin_body["results"], json_body["results"]);
+    assert_eq!(bin_body["results"][0]["id"], body["ids"][0]);
+}
+
+#[tokio::test]
+async fn binary_insert_rejects_short_payload() {
+    let (_, router) = engine_router(tiny_cfg());
+    let (status, body) = post_bytes(
+        router,
+        "/v1/vectors/insert_bin",
+        bin_frame(4, 2, &[1.0, 0.0, 0.0, 0.0]),
+    )
+    .await;
+    assert_eq!(status, StatusCode::BAD_REQUEST, "{body}");
+}
+
 // ── /v1/memory/meta/get + /v1/memory/meta/set ────────────────────────────────
 
 #[tokio::test]
@@ -327,6 +626,28 @@ async fn meta_set_and_get_roundtrip() {
     assert_eq!(body2["metadata"]["role"].as_str().unwrap(), "agent");
 }
 
+#[tokio::test]
+async fn meta_set_batch_applies_every_item() {
+    let (_, router) = engine_router(tiny_cfg());
+
+    let (status, body) = post_json(
+        router.clone(),
+        "/v1/memory/meta/set_batch",
+        serde_json::json!({"items": [
+            {"target_id": "node:1", "metadata": {"title": "a"}},
+            {"target_id": "rec:7", "metadata": {"title": "b"}},
+        ]}),
+    )
+    .await;
+    assert_eq!(status, StatusCode::OK, "set_batch: {body}");
+    assert_eq!(body["count"].as_u64().unwrap(), 2);
+
+    let (_, body1) = get(router.clone(), "/v1/memory/meta/get?target_id=node:1").await;
+    assert_eq!(body1["metadata"]["title"].as_str().unwrap(), "a");
+    let (_, body2) = get(router, "/v1/memory/meta/get?target_id=rec:7").await;
+    assert_eq!(body2["metadata"]["title"].as_str().unwrap(), "b");
+}
+
 #[tokio::test]
 async fn meta_get_missing_key_returns_null_metadata() {
     let (_, router) = engine_router(tiny_cfg());
@@ -362,6 +683,48 @@ async fn snapshot_download_returns_bytes() {
     );
 }
 
+#[tokio::test]
+async fn snapshot_transfers_negotiate_zstd() {
+    let (_, router) = engine_router(tiny_cfg());
+    insert_one(router.clone(), [0.1, 0.2, 0.3, 0.4]).await;
+
+    let download = |encoding: Option<&'static str>| {
+        let router = router.clone();
+        async move {
+            let mut req = Request::builder().uri("/v1/snapshot/download");
+            if let Some(enc) = encoding {
+                req = req.header("accept-encoding", enc);
+            }
+            let resp = router.oneshot(req.body(Body::empty()).unwrap()).await.unwrap();
+            assert_eq!(resp.status(), StatusCode::OK);
+            let encoded = resp.headers().get("content-encoding").cloned();
+            let bytes = axum::body::to_bytes(resp.into_body(), 1 << 20)
+                .await
+                .unwrap();
+            (encoded, bytes)
+        }
+    };
+    let (plain_enc, plain) = download(None).await;
+    assert!(plain_enc.is_none());
+    let (zstd_enc, compressed) = download(Some("zstd")).await;
+    assert_eq!(zstd_enc.unwrap(), "zstd");
+    assert_eq!(zstd::decode_all(&compressed[..]).unwrap(), plain.to_vec());
+
+    let resp = router
+        .oneshot(
+            Request::builder()
+                .method(Method::POST)
+                .uri("/v1/snapshot/upload")
+                .header("content-type", "application/octet-stream")
+                .header("content-encoding", "zstd")
+                .body(Body::from(compressed))
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+    assert_eq!(resp.status(), StatusCode::OK);
+}
+
 // ── /v1/snapshot/restore ─────────────────────────────────────────────────────
 
 #[tokio::test]
@@ -178,6 +178,20 @@ class TestInsertWithProof:
         assert proof1 == proof2, \
             "Same embedding must produce same proof on any engine"
 
+    def test_packed_matches_list_proof(self, db_dir):
+        """LocalClient's packed-buffer insert yields the same proof as a list."""
+        np.random.seed(7)
+        embedding = np.random.randn(16).astype(np.float32)
+        embedding /= np.linalg.norm(embedding)
+
+        list_engine = LocalClient(path=os.path.join(db_dir, "list"))
+        _, list_proof = list_engine.kernel.insert_with_proof(embedding.tolist(), 0)
+
+        packed_engine = LocalClient(path=os.path.join(db_dir, "packed"))
+        _, packed_proof = packed_engine.insert_with_proof(embedding)
+
+        assert packed_proof.hex() == list_proof
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
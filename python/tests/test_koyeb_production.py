@@ -5,13 +5,16 @@ Rigorous Production Testing Suite for Valoricore Koyeb Deployment
 Tests all endpoints, edge cases, concurrent operations, and determinism.
 """
 
+import httpx
+import importlib.util
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
-import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 import os
+import numpy as np
 from dotenv import load_dotenv
 
 pytestmark = pytest.mark.integration
@@ -39,11 +42,17 @@ def log_test(name: str, status: str, message: str = ""):
     color = Colors.GREEN if status == "PASS" else Colors.RED if status == "FAIL" else Colors.YELLOW
     print(f"{color}[{status}]{Colors.RESET} {name}: {message}")
 
+# Seeded vectors are reused across tests (seed 42, range(10), ...); build each once.
+_RNG_CACHE: Dict[int, List[float]] = {}
+
 def generate_vector(seed: int = None) -> List[float]:
     """Generate a deterministic test vector"""
-    if seed is not None:
-        random.seed(seed)
-    return [round(random.random(), 3) for _ in range(VECTOR_DIM)]
+    if seed is None:
+        return np.random.default_rng().random(VECTOR_DIM).round(3).tolist()
+    vec = _RNG_CACHE.get(seed)
+    if vec is None:
+        vec = _RNG_CACHE[seed] = np.random.default_rng(seed).random(VECTOR_DIM).round(3).tolist()
+    return vec
 
 # =======================
 # TEST 1: Health & Version
@@ -189,32 +198,41 @@ def test_batch_operations():
 # TEST 4: Concurrent Operations
 # =======================
 def test_concurrent_operations():
-    """Test concurrent inserts to validate thread safety"""
+    """Test concurrent batch inserts to validate thread safety"""
     print(f"\n{Colors.BLUE}=== TEST 4: Concurrent Operations ==={Colors.RESET}")
     
-    def insert_vector(seed: int):
+    # 4 writers x 5-vector batches: the server still sees concurrent writes,
+    # but over 4 requests instead of 20 single-vector round trips.
+    # batch_insert takes per-item metadata as JSON strings; one read-back per
+    # batch checks it was committed with the vectors.
+    def insert_batch(seeds: range) -> int:
         try:
-            vec = generate_vector(seed)
             payload = {
-                "vector": vec,
-                "metadata": {"thread": seed}
+                "batch": [generate_vector(seed) for seed in seeds],
+                "metadata": [json.dumps({"thread": seed}) for seed in seeds],
             }
-            resp = requests.post(f"{BASE_URL}/v1/memory/upsert_vector", json=payload, timeout=15)
-            return resp.status_code == 200
+            resp = requests.post(f"{BASE_URL}/v1/vectors/batch_insert", json=payload, timeout=15)
+            if resp.status_code != 200:
+                return 0
+            ids = resp.json()["ids"]
+            rec = requests.get(f"{BASE_URL}/v1/records/{ids[0]}", timeout=15)
+            if rec.status_code != 200 or rec.json()["metadata"] != {"thread": seeds[0]}:
+                return 0
+            return len(ids)
         except:
-            return False
+            return 0
     
     try:
         start = time.time()
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(insert_vector, i) for i in range(20)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(insert_batch, range(i, i + 5)) for i in range(0, 20, 5)]
             results = [f.result() for f in as_completed(futures)]
         
         elapsed = time.time() - start
         success_count = sum(results)
         
         assert success_count >= 18  # Allow 2 failures for network issues
-        log_test("Concurrent Inserts (20 threads)", "PASS", 
+        log_test("Concurrent Batch Inserts (4 threads x 5)", "PASS", 
                 f"{success_count}/20 succeeded in {elapsed:.2f}s")
         return True
     except Exception as e:
@@ -310,27 +328,37 @@ def test_search_accuracy():
 # TEST 7: Stress Test
 # =======================
 def test_stress():
-    """Stress test with rapid sequential operations"""
+    """Stress test with rapid concurrent operations"""
     print(f"\n{Colors.BLUE}=== TEST 7: Stress Test ==={Colors.RESET}")
     
     try:
-        success = 0
         total = 50
-        start = time.time()
+        # All 50 vectors from one RNG call, outside the timed loop.
+        vectors = np.random.default_rng(1000).random((total, VECTOR_DIM)).round(3).tolist()
+        # 8 workers over one keep-alive pool: wall time ~ RTT * 50/8, not RTT * 50.
+        sess = requests.Session()
+        sess.mount(BASE_URL, HTTPAdapter(pool_maxsize=16))
         
-        for i in range(total):
-            vec = generate_vector(1000 + i)
-            payload = {"vector": vec, "metadata": {"stress_test": i}}
-            resp = requests.post(f"{BASE_URL}/v1/memory/upsert_vector", json=payload, timeout=10)
-            if resp.status_code == 200:
-                success += 1
+        def upsert(i: int):
+            payload = {"vector": vectors[i], "metadata": {"stress_test": i}}
+            t0 = time.time()
+            resp = sess.post(f"{BASE_URL}/v1/memory/upsert_vector", json=payload, timeout=10)
+            return resp.status_code == 200, time.time() - t0
         
+        start = time.time()
+        with sess, ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(upsert, i) for i in range(total)]
+            results = [f.result() for f in as_completed(futures)]
         elapsed = time.time() - start
+        
+        success = sum(ok for ok, _ in results)
         ops_per_sec = total / elapsed
+        mean_latency_ms = 1000 * sum(t for _, t in results) / total
         
         assert success >= total * 0.9  # 90% success rate
-        log_test("Stress Test (50 ops)", "PASS", 
-                f"{success}/{total} succeeded, {ops_per_sec:.1f} ops/sec")
+        log_test("Stress Test (50 ops, 8 workers)", "PASS", 
+                f"{success}/{total} succeeded, {ops_per_sec:.1f} ops/sec, "
+                f"{mean_latency_ms:.1f} ms/op")
         return True
     except Exception as e:
         log_test("Stress Test", "FAIL", str(e))
@@ -344,18 +372,22 @@ def test_uptime():
     print(f"\n{Colors.BLUE}=== TEST 8: Uptime Validation ==={Colors.RESET}")
     
     try:
-        failures = 0
         checks = 10
+        # Back-to-back pings over one (HTTP/2 when h2 is installed) connection:
+        # no idle sleeps, and the latencies measured are the server's, not TCP setup.
+        http2 = importlib.util.find_spec("h2") is not None
+        with httpx.Client(base_url=BASE_URL, http2=http2, timeout=5) as client:
+            resps = [client.get("/health") for _ in range(checks)]
         
-        for i in range(checks):
-            resp = requests.get(f"{BASE_URL}/health", timeout=5)
-            if resp.status_code != 200:
-                failures += 1
-            time.sleep(0.5)
+        failures = sum(resp.status_code != 200 for resp in resps)
+        times = sorted(resp.elapsed.total_seconds() for resp in resps)
+        p50 = times[len(times) // 2]
+        p99 = times[min(int(len(times) * 0.99), len(times) - 1)]
         
         uptime_percent = ((checks - failures) / checks) * 100
         assert uptime_percent >= 95  # 95% uptime
-        log_test("Uptime Check (10 samples)", "PASS", f"{uptime_percent:.1f}% uptime")
+        log_test("Uptime Check (10 samples)", "PASS",
+                f"{uptime_percent:.1f}% uptime, p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms")
         return True
     except Exception as e:
         log_test("Uptime Check", "FAIL", str(e))
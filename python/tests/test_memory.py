@@ -2,6 +2,7 @@
 import unittest
 import pytest
 import os
+import json
 import sys
 from unittest.mock import MagicMock
 from valoricore.memory import MemoryClient
@@ -16,6 +17,7 @@ class MockLocalClient:
         self.node_counter = 0
         self.edge_counter = 0
         self.records = {}
+        self.metadata = {}
         self.nodes = {}
         self.edges = []
 
@@ -29,6 +31,15 @@ class MockLocalClient:
         rid = self.insert(vector)
         return rid, "mock_proof_hex"
 
+    def insert_batch_with_proof(self, vectors, tags=None):
+        return [self.insert_with_proof(v) for v in vectors]
+
+    def set_metadata(self, record_id, metadata):
+        self.metadata[record_id] = metadata
+
+    def get_metadata(self, record_id):
+        return self.metadata.get(record_id)
+
     def create_node(self, kind, record_id=None):
         self.node_counter += 1
         nid = self.node_counter
@@ -41,11 +52,24 @@ class MockLocalClient:
         self.edges.append({'id': eid, 'from': from_id, 'to': to_id, 'kind': kind})
         return eid
 
+    def get_node(self, node_id):
+        return self.nodes.get(node_id)
+
+    def get_edges(self, node_id):
+        return [{'edge_id': e['id'], 'to_node': e['to'], 'kind': e['kind']}
+                for e in self.edges if e['from'] == node_id]
+
+    def create_nodes_batch(self, kind, record_ids):
+        return [self.create_node(kind, rid) for rid in record_ids]
+
+    def create_edges_batch(self, from_id, to_ids, kind):
+        return [self.create_edge(from_id, to, kind) for to in to_ids]
+
     def search(self, vector, k):
         # Fake search results: return existing records with dummy score
         hits = []
         for rid in list(self.records.keys())[:k]:
-            hits.append((rid, 100)) # (id, score)
+            hits.append({"id": rid, "score": 100})  # ValoriClient.search shape
         return hits
         
     def snapshot(self):
@@ -127,7 +151,120 @@ def test_add_chunks_with_parent(memory_client):
     
     assert res['document_node_id'] == parent_id
     assert len(res['chunk_node_ids']) == 2
+
+def test_add_chunks_links_every_chunk(memory_client):
+    res = memory_client.add_chunks(["one.", "two.", "three."], embed=dummy_embed)
+    doc_id = res['document_node_id']
+
+    assert len(res['record_ids']) == 3
+    assert len(res['proof_hashes']) == 3
+    for cid, rid in zip(res['chunk_node_ids'], res['record_ids']):
+        assert memory_client.get_node(cid)['record_id'] == rid
+    linked = {e['to_node'] for e in memory_client.get_edges(doc_id)}
+    assert set(res['chunk_node_ids']) <= linked
     
+def test_add_chunks_embeds_once_when_batching(memory_client):
+    calls = []
+    def embed(texts):
+        calls.append(list(texts))
+        return [[0.1] * 384 for _ in texts]
+    embed.supports_batch = True
+
+    res = memory_client.add_chunks(["one.", "two.", "three."], embed=embed)
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == ["one.", "three.", "two."]
+    assert len(res['record_ids']) == 3
+
+def test_add_document_with_vectors_rejects_count_mismatch(memory_client):
+    from valoricore.exceptions import ValidationError
+    with pytest.raises(ValidationError):
+        memory_client.add_document_with_vectors(["one.", "two."], [[0.1] * 384])
+
+def test_add_chunks_remote_uses_one_request(monkeypatch):
+    from unittest.mock import patch
+    from valoricore.remote import SyncRemoteClient
+
+    monkeypatch.setattr(
+        "valoricore.memory.Valoricore", lambda remote=None, **kw: SyncRemoteClient(remote)
+    )
+    client = MemoryClient(remote="http://mock-node:3000")
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[])
+        mock_post.return_value.content = json.dumps({
+            "document_node_id": 7, "memory_ids": ["rec:1", "rec:2"],
+            "record_ids": [1, 2], "chunk_node_ids": [8, 9], "proof_hashes": ["01", "02"],
+        }).encode()
+        res = client.add_chunks(["one.", "two."], embed=dummy_embed)
+
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == "http://mock-node:3000/v1/memory/upsert_vectors"
+    assert len(json.loads(mock_post.call_args.kwargs["data"])["vectors"]) == 2
+    assert res['document_node_id'] == 7
+    assert res['record_ids'] == [1, 2]
+    assert res['chunk_node_ids'] == [8, 9]
+    assert res['proof_hashes'] == ["01", "02"]
+
+
+def test_add_chunks_remote_falls_back_without_bulk_route(monkeypatch):
+    from unittest.mock import patch
+    from valoricore.remote import SyncRemoteClient
+
+    monkeypatch.setattr(
+        "valoricore.memory.Valoricore", lambda remote=None, **kw: SyncRemoteClient(remote)
+    )
+    client = MemoryClient(remote="http://mock-node:3000")
+    next_id = iter(range(100, 200))
+
+    def respond(url, **kwargs):
+        resp = MagicMock(status_code=200, history=[])
+        if url.endswith("/v1/memory/upsert_vectors"):
+            resp.status_code = 404
+        elif url.endswith("/v1/vectors/batch-insert"):
+            resp.content = json.dumps({"ids": [1, 2]}).encode()
+        elif url.endswith("/v1/graph/node"):
+            resp.content = json.dumps({"node_id": next(next_id)}).encode()
+        else:
+            resp.content = json.dumps({"edge_id": next(next_id)}).encode()
+        return resp
+
+    with patch("requests.Session.post", side_effect=respond) as mock_post, \
+            patch("valoricore.remote._client_proofs", return_value=[b"\x01", b"\x02"]):
+        res = client.add_chunks(["one.", "two."], embed=dummy_embed)
+        assert res["record_ids"] == [1, 2]
+        assert res["document_node_id"] == 100
+        assert res["chunk_node_ids"] == [101, 102]
+        assert res["proof_hashes"] == ["01", "02"]
+        assert client.supports_bulk is False
+
+        # The missing route is remembered: the next document skips the probe.
+        mock_post.reset_mock()
+        client.add_chunks(["three.", "four."], embed=dummy_embed)
+        assert not any(c.args[0].endswith("/upsert_vectors") for c in mock_post.call_args_list)
+
+
+def test_upsert_vector_remote_uses_one_request(monkeypatch):
+    from unittest.mock import patch
+    from valoricore.remote import SyncRemoteClient
+
+    monkeypatch.setattr(
+        "valoricore.memory.Valoricore", lambda remote=None, **kw: SyncRemoteClient(remote)
+    )
+    client = MemoryClient(remote="http://mock-node:3000")
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[])
+        mock_post.return_value.content = json.dumps({
+            "memory_id": "rec:3", "record_id": 3, "document_node_id": 4, "chunk_node_id": 5,
+            "proof_hash": "ab" * 32,
+        }).encode()
+        res = client.upsert_vector(dummy_embed("x"), attach_to_document_node=4)
+
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == "http://mock-node:3000/v1/memory/upsert_vector"
+    assert json.loads(mock_post.call_args.kwargs["data"])["attach_to_document_node"] == 4
+    # proof_hash is the node's, passed through rather than computed client-side.
+    assert res == {"record_id": 3, "document_node_id": 4, "chunk_node_id": 5, "proof_hash": "ab" * 32}
+
 def test_ingest_text_file_roundtrip(memory_client, tmp_path):
     # Create temp file
     fpath = tmp_path / "test.txt"
@@ -156,3 +293,57 @@ def test_chunking_semantics():
     chunks_small = split_by_sentences(text, max_chars=20)
     # The structure might vary depending on hard-split impl, but len should be >= 3
     assert len(chunks_small) >= 3
+
+def test_binary_quantization_selects_bq_index(monkeypatch):
+    seen = {}
+    def fake_factory(**kwargs):
+        seen.update(kwargs)
+        return MockLocalClient()
+    monkeypatch.setattr("valoricore.memory.Valoricore", fake_factory)
+
+    MemoryClient(quantization="binary")
+    assert seen["index_kind"] == "bq"
+
+    from valoricore.exceptions import ValidationError
+    with pytest.raises(ValidationError):
+        MemoryClient(quantization="binary", index_kind="hnsw")
+
+def test_protocol_client_binds_local_paths_once(monkeypatch):
+    from valoricore.protocol import ProtocolClient
+    monkeypatch.setattr("valoricore.memory.Valoricore", lambda **kwargs: MockLocalClient())
+
+    client = ProtocolClient(embed=dummy_embed)
+    assert client._search_vector_impl == client._search_vector_local
+
+    res = client.upsert_vector([0.1] * 384)
+    hits = client.search_vector([0.1] * 384, k=1)["results"]
+    assert hits[0]["record_id"] == res["record_id"]
+    assert hits[0]["memory_id"] == res["memory_id"]
+    assert json.loads(json.dumps(hits))[0]["record_id"] == res["record_id"]
+
+def test_protocol_client_upsert_vectors_local_batch(monkeypatch):
+    import numpy as np
+    from valoricore.protocol import ProtocolClient
+    monkeypatch.setattr("valoricore.memory.Valoricore", lambda **kwargs: MockLocalClient())
+
+    client = ProtocolClient(embed=dummy_embed)
+    db = client._memory._db
+    matrix = np.full((3, 384), 0.1, dtype=np.float32)
+    res = client.upsert_vectors(matrix, metadata={"source": "batch"})
+
+    assert len(res["record_ids"]) == 3
+    assert len(res["chunk_node_ids"]) == 3
+    assert res["memory_ids"] == [f"rec:{rid}" for rid in res["record_ids"]]
+    # The checked float32 rows reach the kernel without a list round-trip.
+    assert all(isinstance(db.records[rid], np.ndarray) for rid in res["record_ids"])
+    assert all(db.get_metadata(rid) == {"source": "batch"} for rid in res["record_ids"])
+    # ...and reads back through the same client, by memory_id.
+    assert client.get_metadata(res["memory_ids"][0]) == {"source": "batch"}
+    client.set_metadata(res["memory_ids"][1], {"source": "edited"})
+    assert client.get_metadata(res["memory_ids"][1]) == {"source": "edited"}
+    with pytest.raises(NotImplementedError):
+        client.get_metadata(f"node:{res['document_node_id']}")
+    with pytest.raises(NotImplementedError):
+        client.upsert_vectors(matrix, tags=["t"])
+    with pytest.raises(ValueError):
+        client.upsert_vectors([[0.1] * 384, [0.1] * 383])
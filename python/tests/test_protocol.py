@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Varshith Gudur. Licensed under MIT OR Apache-2.0.
 import unittest
 import os
+import json
 import pytest
 from valoricore.protocol import ProtocolClient
 from valoricore import ProtocolClient as PublicProtocolClient # Verify export
@@ -78,3 +79,15 @@ def test_dim_mismatch(protocol_client):
 
     with pytest.raises((ValueError, VErr)):
         protocol_client.search_vector(bad_vec)
+
+def test_search_hits_are_plain_dicts(protocol_client):
+    vec = [0.5] * 16
+    res = protocol_client.upsert_vector(vec)
+
+    hits = protocol_client.search_vector(vec, k=1)
+
+    hit = hits["results"][0]
+    assert type(hit) is dict
+    assert hit["memory_id"] == res["memory_id"]
+    # Responses go straight to json.dumps, as the demo does.
+    assert json.loads(json.dumps(hits))["results"][0]["record_id"] == res["record_id"]
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Varshith Gudur. Licensed under MIT OR Apache-2.0.
 import pytest
 import json
+import numpy as np
 from unittest.mock import MagicMock, patch
 from valoricore.protocol import ProtocolRemoteClient, ProtocolError, AuthError, ValidationError
 
@@ -23,7 +24,9 @@ def mock_response(status=200, json_data=None, text="", reason="OK"):
     mock.text = text
     if json_data is not None:
         mock.json.return_value = json_data
+        mock.content = json.dumps(json_data).encode()
     else:
+        mock.content = text.encode()
         # If json() is called when no json_data provided, raise ValueError
         mock.json.side_effect = ValueError("No JSON")
     return mock
@@ -55,6 +58,35 @@ def test_validation_error(client):
     with pytest.raises(ValidationError, match="out of allowed range"):
         client.upsert_vector([40000.0] + [0.0]*15)
 
+    # The offending index is reported, and NaN is rejected
+    with pytest.raises(ValidationError, match="index 3 \\(nan\\)"):
+        client.upsert_vector([0.0]*3 + [float("nan")] + [0.0]*12)
+
+    # A batch is checked as one matrix; the failing chunk and index are reported.
+    batch = [[0.0]*16, [0.0]*5 + [-40000.0] + [0.0]*10]
+    with patch.object(client.session, 'post') as post:
+        with pytest.raises(ValidationError, match="chunk 1, index 5"):
+            client.upsert_vectors_bulk(batch)
+        with pytest.raises(ValueError, match="same dimension"):
+            client.upsert_vectors_bulk([[0.0]*16, [0.0]*15])
+    post.assert_not_called()
+
+def test_array_inputs_are_accepted(client):
+    from array import array
+    from valoricore.protocol import _validate_vector
+
+    resp = mock_response(json_data={"results": []})
+    packed = array("f", [0.5] * 16)
+    with patch.object(client.session, 'post', return_value=resp) as post:
+        for vec in (np.full(16, 0.5, dtype=np.float32), packed, memoryview(packed)):
+            client.search_vector(vec, k=1)
+            assert json.loads(post.call_args.kwargs["data"])["query_vector"] == [0.5] * 16
+
+    f32 = np.zeros(16, dtype=np.float32)
+    assert np.shares_memory(_validate_vector(f32), f32)
+    with pytest.raises(ValidationError, match="1-D"):
+        _validate_vector(np.zeros((16, 1)))
+
 def test_server_error_json(client):
     # Server error with JSON message
     resp = mock_response(status=500, json_data={"error": "Something went wrong"})
@@ -75,3 +107,35 @@ def test_non_json_success(client):
     with patch.object(client.session, 'post', return_value=resp):
         with pytest.raises(ProtocolError, match="non-JSON response"):
             client._post("badjson", {})
+
+def test_session_retries_transient_errors_without_replaying_posts(client):
+    retry = client.session.get_adapter(BASE_URL).max_retries
+    assert retry.total == 3
+    # GETs (snapshot, meta/get) retry on any transient 5xx ...
+    assert retry.is_retry("GET", 502)
+    # ... but a POST is only replayed when the node rejected it outright.
+    assert retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 502)
+    assert not retry.is_retry("POST", 504)
+
+def test_upsert_vector_q16_sends_kernel_fixed_point(client):
+    body = {"memory_id": "rec:1", "record_id": 1, "document_node_id": 2, "chunk_node_id": 3}
+    vec = [1.0, -0.5, 2.0 ** -17, -(2.0 ** -17)] + [0.0] * 12
+    with patch.object(client.session, 'post', return_value=mock_response(json_data=body)) as post:
+        assert client.upsert_vector_q16(vec, attach_to_document_node=2)["record_id"] == 1
+    args, kwargs = post.call_args
+    assert args[0] == f"{BASE_URL}/v1/memory/upsert_vector_q16"
+    assert kwargs["params"] == {"attach_to_document_node": 2}
+    raw = np.frombuffer(kwargs["data"], dtype="<i4")
+    # Ties round away from zero, as in the kernel's from_f32.
+    assert raw[:4].tolist() == [65536, -32768, 1, -1]
+
+def test_upsert_vector_q16_falls_back_to_json(client):
+    body = {"memory_id": "rec:1", "record_id": 1, "document_node_id": 2, "chunk_node_id": 3}
+    responses = [mock_response(status=415), mock_response(json_data=body)]
+    with patch.object(client.session, 'post', side_effect=responses) as post:
+        client.upsert_vector_q16([0.25] * 16)
+    assert not client.supports_q16
+    args, kwargs = post.call_args
+    assert args[0] == f"{BASE_URL}/v1/memory/upsert_vector"
+    assert json.loads(kwargs["data"])["vector"] == [0.25] * 16
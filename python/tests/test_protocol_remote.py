@@ -1,8 +1,14 @@
 import pytest
 # Copyright (c) 2025 Varshith Gudur. Licensed under MIT OR Apache-2.0.
+import io
+import json
 import unittest
 from unittest.mock import MagicMock, patch
-from valoricore.protocol import ProtocolClient, ProtocolError
+import httpx
+import numpy as np
+from valoricore import protocol
+from valoricore.ingest import chunk_text
+from valoricore.protocol import AsyncProtocolRemoteClient, AuthenticationError, ProtocolClient, ProtocolError
 
 pytestmark = pytest.mark.integration
 
@@ -15,12 +21,12 @@ class TestProtocolRemote(unittest.TestCase):
     def test_upsert_vector(self, mock_post):
         # Mock response
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "memory_id": "rec:10",
             "record_id": 10,
             "document_node_id": 100,
             "chunk_node_id": 200
-        }
+        }).encode()
         mock_resp.raise_for_status.return_value = None
         mock_post.return_value = mock_resp
 
@@ -33,40 +39,88 @@ class TestProtocolRemote(unittest.TestCase):
         # Verify call
         args, kwargs = mock_post.call_args
         self.assertEqual(args[0], "http://mock-node:3000/v1/memory/upsert_vector")
-        self.assertEqual(kwargs["json"]["vector"], vec)
+        # Bodies are pre-serialised (float32) and sent as data=.
+        self.assertEqual(json.loads(kwargs["data"])["vector"], pytest.approx(vec))
 
     @patch("requests.Session.post")
     def test_search_vector(self, mock_post):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "results": [
                 {"memory_id": "rec:5", "record_id": 5, "score": 999}
             ]
-        }
+        }).encode()
         mock_resp.raise_for_status.return_value = None
         mock_post.return_value = mock_resp
 
         vec = [0.1] * 384
-        res = self.client.search_vector(vec, k=3)
+        with patch("valoricore.protocol._validate_vector", wraps=protocol._validate_vector) as validate:
+            res = self.client.search_vector(vec, k=3)
+        # Checked once by ProtocolClient, not again by the remote client.
+        validate.assert_called_once()
         
         self.assertEqual(len(res["results"]), 1)
         self.assertEqual(res["results"][0]["record_id"], 5)
         
         args, kwargs = mock_post.call_args
         self.assertEqual(args[0], "http://mock-node:3000/v1/memory/search_vector")
-        self.assertEqual(kwargs["json"]["k"], 3)
+        self.assertEqual(json.loads(kwargs["data"])["k"], 3)
+
+    @patch("requests.Session.post")
+    def test_upsert_vector_stringifies_metadata_keys(self, mock_post):
+        mock_post.return_value.content = json.dumps({
+            "memory_id": "rec:1", "record_id": 1, "document_node_id": 2, "chunk_node_id": 3,
+        }).encode()
+
+        self.client.upsert_vector([0.1] * 384, metadata={3: "c"})
+
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"])["metadata"], {"3": "c"})
+
+    @patch("requests.Session.post")
+    def test_search_vector_binary_hits(self, mock_post):
+        hits = np.array([(5, 0.75), (9, 0.5)], dtype=protocol._BINARY_HIT_DTYPE)
+        mock_resp = MagicMock(ok=True, status_code=200)
+        mock_resp.headers = {"Content-Type": "application/x-valori-hits"}
+        mock_resp.content = (2).to_bytes(4, "little") + hits.tobytes()
+        mock_post.return_value = mock_resp
+
+        res = self.client.search_vector([0.1] * 384, k=2, binary=True)
+
+        self.assertEqual(
+            res["results"],
+            [
+                {"memory_id": "rec:5", "record_id": 5, "score": 0.75, "metadata": None},
+                {"memory_id": "rec:9", "record_id": 9, "score": 0.5, "metadata": None},
+            ],
+        )
+        self.assertEqual(json.loads(json.dumps(res)), res)
+        _, kwargs = mock_post.call_args
+        self.assertIn("application/x-valori-hits", kwargs["headers"]["Accept"])
+
+        # A JSON-only node ignores the Accept header; the JSON body still parses.
+        mock_resp.headers = {"Content-Type": "application/json"}
+        mock_resp.content = json.dumps({
+            "results": [{"memory_id": "rec:5", "record_id": 5, "score": 0.75, "metadata": None}]
+        }).encode()
+        res = self.client.search_vector([0.1] * 384, k=1, binary=True)
+        self.assertEqual(res["results"][0]["record_id"], 5)
+
+        mock_resp.content = (3).to_bytes(4, "little") + hits.tobytes()
+        mock_resp.headers = {"Content-Type": "application/x-valori-hits"}
+        with self.assertRaises(ProtocolError):
+            self.client.search_vector([0.1] * 384, k=3, binary=True)
 
     @patch("requests.Session.post")
     def test_upsert_text(self, mock_post):
         # We test a case that produces exactly 1 chunk
         
         resp1 = {
-            "memory_id": "rec:1", "record_id": 1, 
-            "document_node_id": 50, "chunk_node_id": 51
+            "document_node_id": 50, "memory_ids": ["rec:1"],
+            "record_ids": [1], "chunk_node_ids": [51]
         }
         
         mock_resp = MagicMock()
-        mock_resp.json.side_effect = [resp1]
+        mock_resp.content = json.dumps(resp1).encode()
         mock_resp.raise_for_status.return_value = None # Ensure this is mocked too
         mock_post.return_value = mock_resp
 
@@ -78,20 +132,206 @@ class TestProtocolRemote(unittest.TestCase):
         self.assertEqual(res["chunk_count"], 1)
         self.assertEqual(res["record_ids"], [1])
         
-        # Verify it called upsert_vector
+        # Verify the whole document went out in one bulk call
+        self.assertEqual(mock_post.call_count, 1)
         args, kwargs = mock_post.call_args
-        self.assertEqual(args[0], "http://mock-node:3000/v1/memory/upsert_vector")
+        self.assertEqual(args[0], "http://mock-node:3000/v1/memory/upsert_vectors")
+        self.assertEqual(len(json.loads(kwargs["data"])["vectors"]), 1)
+
+    @patch("requests.Session.post")
+    def test_upsert_text_embeds_chunks_in_one_batch(self, mock_post):
+        def respond(url, **kwargs):
+            n = len(json.loads(kwargs["data"])["vectors"])
+            resp = MagicMock()
+            resp.content = json.dumps({
+                "document_node_id": 50, "memory_ids": [f"rec:{i}" for i in range(n)],
+                "record_ids": list(range(n)), "chunk_node_ids": list(range(n)),
+            }).encode()
+            return resp
+        mock_post.side_effect = respond
+
+        class Embedder:
+            def __init__(self):
+                self.batches = []
+            def __call__(self, text):
+                raise AssertionError("per-chunk embed should not be called")
+            def embed_batch(self, texts):
+                self.batches.append(list(texts))
+                return [[0.1] * 384 for _ in texts]
+
+        embed = Embedder()
+        client = ProtocolClient(embed=embed, remote="http://mock-node:3000")
+        res = client.upsert_text("alpha. " * 200, chunk_size=256)
+
+        self.assertEqual(len(embed.batches), 1)
+        self.assertGreater(res["chunk_count"], 1)
+        self.assertEqual(len(embed.batches[0]), res["chunk_count"])
+
+    @patch("requests.Session.post")
+    def test_embed_batch_kwarg_replaces_embed(self, mock_post):
+        resp = MagicMock()
+        resp.content = json.dumps({
+            "document_node_id": 50, "memory_ids": ["rec:0", "rec:1"],
+            "record_ids": [0, 1], "chunk_node_ids": [0, 1],
+        }).encode()
+        mock_post.return_value = resp
+
+        batches = []
+        def embed_batch(texts):
+            batches.append(list(texts))
+            return [[0.1] * 4 for _ in texts]
+
+        client = ProtocolClient(embed_batch=embed_batch, remote="http://mock-node:3000")
+        with patch("valoricore.protocol.chunk_text", return_value=["a", "b"]):
+            client.upsert_text("ignored")
+        self.assertEqual(batches, [["a", "b"]])
+
+        # Single texts (search_text) go through a one-element batch.
+        client._impl._post_search_vector = MagicMock(return_value={"results": []})
+        client.search_text("q")
+        self.assertEqual(batches[-1], ["q"])
+
+        with self.assertRaises(ValueError):
+            ProtocolClient(remote="http://mock-node:3000")
+
+    @patch("requests.Session.post")
+    def test_upsert_text_embeds_by_length_keeps_chunk_order(self, mock_post):
+        resp = MagicMock()
+        resp.content = json.dumps({
+            "document_node_id": 50, "memory_ids": ["rec:0", "rec:1", "rec:2"],
+            "record_ids": [0, 1, 2], "chunk_node_ids": [0, 1, 2],
+        }).encode()
+        mock_post.return_value = resp
+
+        seen = []
+        def embed(texts):
+            seen.append(list(texts))
+            return [[len(t) / 1000.0] * 4 for t in texts]
+        embed.supports_batch = True
+
+        text = "a much longer first paragraph here.\n\nmid one.\n\nx."
+        chunks = chunk_text(text, max_chars=40)
+        client = ProtocolClient(embed=embed, remote="http://mock-node:3000")
+        client.upsert_text(text, chunk_size=40)
+
+        self.assertEqual(seen, [sorted(chunks, key=len)])
+        sent = json.loads(mock_post.call_args.kwargs["data"])["vectors"]
+        self.assertEqual([v[0] for v in sent], pytest.approx([len(c) / 1000.0 for c in chunks]))
+
+    @patch("requests.Session.post")
+    def test_upsert_vectors_checks_dim_once_and_posts_once(self, mock_post):
+        mock_post.return_value.content = json.dumps({
+            "document_node_id": 5, "memory_ids": ["rec:0", "rec:1", "rec:2"],
+            "record_ids": [0, 1, 2], "chunk_node_ids": [6, 7, 8],
+        }).encode()
+        client = ProtocolClient(embed=MagicMock(), remote="http://mock-node:3000", expected_dim=4)
+
+        res = client.upsert_vectors(np.full((3, 4), 0.25, dtype=np.float32))
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args.args[0], "http://mock-node:3000/v1/memory/upsert_vectors")
+        self.assertEqual(res["record_ids"], [0, 1, 2])
+
+        with self.assertRaisesRegex(ValueError, "4-dimensional"):
+            client.upsert_vectors(np.zeros((3, 5), dtype=np.float32))
+        mock_post.assert_called_once()
+
+    @patch("requests.Session.post")
+    def test_upsert_text_falls_back_to_concurrent_upserts(self, mock_post):
+        def respond(url, **kwargs):
+            if url.endswith("/upsert_vectors"):
+                return MagicMock(status_code=404)
+            # Each chunk's vector starts with its index; echo it back as the record id.
+            rid = int(json.loads(kwargs["data"])["vector"][0])
+            resp = MagicMock()
+            resp.content = json.dumps({
+                "memory_id": f"rec:{rid}", "record_id": rid,
+                "document_node_id": 50, "chunk_node_id": 100 + rid,
+            }).encode()
+            return resp
+        mock_post.side_effect = respond
+
+        vectors = [[float(i)] + [0.1] * 383 for i in range(20)]
+        embed = MagicMock()
+        embed.embed_batch.return_value = vectors
+        client = ProtocolClient(embed=embed, remote="http://mock-node:3000")
+        with patch("valoricore.protocol.chunk_text", return_value=["c"] * 20):
+            res = client.upsert_text("ignored")
+
+        self.assertEqual(res["record_ids"], list(range(20)))
+        self.assertEqual(res["chunk_node_ids"], [100 + i for i in range(20)])
+        self.assertEqual(res["document_node_id"], 50)
+        # One bulk probe, then per-chunk upserts; every chunk after the first
+        # attaches to the document node.
+        calls = mock_post.call_args_list
+        self.assertTrue(calls[0].args[0].endswith("/upsert_vectors"))
+        attached = [json.loads(c.kwargs["data"]).get("attach_to_document_node") for c in calls[1:]]
+        self.assertEqual(attached.count(50), 19)
+        self.assertFalse(client._impl.supports_bulk)
+
+    @patch("requests.Session.post")
+    def test_upsert_text_pipelines_per_text_embeds(self, mock_post):
+        def respond(url, **kwargs):
+            rid = int(json.loads(kwargs["data"])["vector"][0])
+            resp = MagicMock()
+            resp.content = json.dumps({
+                "memory_id": f"rec:{rid}", "record_id": rid,
+                "document_node_id": 50, "chunk_node_id": 100 + rid,
+            }).encode()
+            return resp
+        mock_post.side_effect = respond
+
+        chunks = [str(i) for i in range(10)]
+        embed = MagicMock(side_effect=lambda c: [float(c)] + [0.1] * 383, spec=["__call__"])
+        client = ProtocolClient(embed=embed, remote="http://mock-node:3000")
+        client._impl.supports_bulk = False
+        with patch("valoricore.protocol.chunk_text", return_value=chunks):
+            res = client.upsert_text("ignored")
+
+        self.assertEqual([c.args[0] for c in embed.call_args_list], chunks)
+        self.assertEqual(res["record_ids"], list(range(10)))
+        self.assertEqual(res["chunk_count"], 10)
+        urls = {c.args[0] for c in mock_post.call_args_list}
+        self.assertEqual(urls, {"http://mock-node:3000/v1/memory/upsert_vector"})
+        attached = [json.loads(c.kwargs["data"]).get("attach_to_document_node") for c in mock_post.call_args_list]
+        self.assertEqual(attached.count(50), 9)
+
+    @patch("requests.Session.post")
+    def test_embedding_cache_skips_repeat_embeds(self, mock_post):
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"results": []}).encode()
+        mock_post.return_value = mock_resp
+
+        calls = []
+        def embed(text):
+            calls.append(text)
+            return [0.1] * 384
+
+        client = ProtocolClient(embed=embed, remote="http://mock-node:3000", cache_embeddings=True)
+        client.search_text("same question")
+        client.search_text("same question")
+        client.search_text("other question")
+
+        self.assertEqual(calls, ["same question", "other question"])
+        info = client.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+        self.assertIsNone(self.client.cache_info())
+
+        client.invalidate_cache()
+        client.search_text("same question")
+        self.assertEqual(calls[-1], "same question")
+        self.assertEqual(client.cache_info().currsize, 1)
+        self.client.invalidate_cache()
 
     @patch("requests.Session.post")
     def test_missing_keys_raises_protocol_error(self, mock_post):
         mock_resp = MagicMock()
         # Missing 'record_id'
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "memory_id": "rec:10",
             # record_id missing
             "document_node_id": 100,
             "chunk_node_id": 200
-        }
+        }).encode()
         mock_resp.raise_for_status.return_value = None
         mock_post.return_value = mock_resp
 
@@ -114,6 +354,61 @@ class TestProtocolRemote(unittest.TestCase):
         self.assertEqual(kwargs["headers"]["Content-Type"], "application/octet-stream")
         self.assertEqual(kwargs["data"], data)
 
+    @patch("requests.Session.get")
+    def test_snapshot_streams_into_file(self, mock_get):
+        mock_resp = MagicMock()
+        mock_resp.__enter__.return_value = mock_resp
+        mock_resp.iter_content.return_value = [b"abc", b"def"]
+        mock_get.return_value = mock_resp
+
+        out = io.BytesIO()
+        self.assertIsNone(self.client.snapshot(out))
+
+        self.assertEqual(out.getvalue(), b"abcdef")
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+    @patch("requests.Session.post")
+    def test_restore_streams_file(self, mock_post):
+        src = io.BytesIO(b"snapshot-bytes")
+        self.client.restore(src)
+        # The file object itself is handed to requests, which streams it.
+        self.assertIs(mock_post.call_args.kwargs["data"], src)
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_snapshot_zstd_roundtrip(self, mock_get, mock_post):
+        zstd = pytest.importorskip("zstandard")
+        blob = b"snapshot-bytes" * 1000
+        mock_resp = MagicMock()
+        mock_resp.__enter__.return_value = mock_resp
+        mock_resp.headers = {"Content-Encoding": "zstd"}
+        frame = zstd.ZstdCompressor().compress(blob)
+        mock_resp.raw.stream.return_value = [frame[:10], frame[10:]]
+        mock_get.return_value = mock_resp
+
+        self.assertEqual(self.client.snapshot(), blob)
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["Accept-Encoding"], "zstd")
+
+        mock_post.return_value.status_code = 200
+        self.client.restore(io.BytesIO(blob), compress=True)
+        kwargs = mock_post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "zstd")
+        self.assertEqual(zstd.ZstdDecompressor().decompressobj().decompress(b"".join(kwargs["data"])), blob)
+
+    @patch("requests.Session.post")
+    def test_restore_compressed_falls_back_when_node_rejects_zstd(self, mock_post):
+        pytest.importorskip("zstandard")
+        mock_post.side_effect = [MagicMock(status_code=415), MagicMock(status_code=200)]
+
+        src = io.BytesIO(b"snapshot-bytes")
+        self.client.restore(src, compress=True)
+
+        self.assertEqual(mock_post.call_count, 2)
+        retry = mock_post.call_args.kwargs
+        self.assertNotIn("Content-Encoding", retry["headers"])
+        self.assertIs(retry["data"], src)
+        self.assertEqual(src.tell(), 0)
+
     @patch("requests.Session.post")
     @patch("requests.Session.get")
     def test_metadata_ops(self, mock_get, mock_post):
@@ -126,7 +421,7 @@ class TestProtocolRemote(unittest.TestCase):
         # Mock Get
         mock_get_resp = MagicMock()
         mock_get_resp.raise_for_status.return_value = None
-        mock_get_resp.json.return_value = {"target_id": "rec:1", "metadata": {"author": "me"}}
+        mock_get_resp.content = json.dumps({"target_id": "rec:1", "metadata": {"author": "me"}}).encode()
         mock_get.return_value = mock_get_resp
         
         # Test Set
@@ -142,5 +437,231 @@ class TestProtocolRemote(unittest.TestCase):
         self.assertEqual(args[0], "http://mock-node:3000/v1/memory/meta/get")
         self.assertEqual(kwargs["params"]["target_id"], "rec:1")
 
+    @patch("requests.Session.post")
+    def test_metadata_writes_coalesce(self, mock_post):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_post.return_value = mock_resp
+
+        self.client.set_metadata("node:1", {"a": 1}, sync=False)
+        self.client.set_metadata("rec:2", {"b": 2}, sync=False)
+        self.client.flush()
+
+        urls = [c.args[0] for c in mock_post.call_args_list]
+        self.assertIn("http://mock-node:3000/v1/memory/meta/set_batch", urls)
+        items = [i for c in mock_post.call_args_list for i in c.kwargs["json"]["items"]]
+        self.assertEqual(items, [
+            {"target_id": "node:1", "metadata": {"a": 1}},
+            {"target_id": "rec:2", "metadata": {"b": 2}},
+        ])
+
+    @patch("requests.Session.close")
+    @patch("requests.Session.post")
+    def test_close_flushes_then_releases_pool_and_session(self, mock_post, mock_close):
+        mock_post.return_value = MagicMock(status_code=200)
+
+        with ProtocolClient(embed=self.dummy_embed, remote="http://mock-node:3000") as client:
+            impl = client._impl
+            client.set_metadata("rec:4", {"d": 4}, sync=False)
+
+        self.assertEqual(mock_post.call_args.args[0], "http://mock-node:3000/v1/memory/meta/set_batch")
+        mock_close.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            impl._pool.submit(print)
+
+    @patch("requests.Session.post")
+    def test_metadata_batch_falls_back_on_404(self, mock_post):
+        missing = MagicMock(status_code=404)
+        ok = MagicMock(status_code=200)
+        mock_post.side_effect = [missing, ok]
+
+        self.client.set_metadata("rec:3", {"c": 3}, sync=False)
+        self.client.flush()
+
+        urls = [c.args[0] for c in mock_post.call_args_list]
+        self.assertEqual(urls, [
+            "http://mock-node:3000/v1/memory/meta/set_batch",
+            "http://mock-node:3000/v1/memory/meta/set",
+        ])
+        self.assertEqual(mock_post.call_args.kwargs["json"], {"target_id": "rec:3", "metadata": {"c": 3}})
+
+class TestAsyncProtocolRemote(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        self.bulk_status = 200
+        self.q16_status = 200
+        self.upload_statuses = []
+        self.snapshot_response = lambda: httpx.Response(200, content=b"snap")
+
+        def handler(request):
+            self.requests.append(request)
+            if request.url.path == "/v1/snapshot/download":
+                return self.snapshot_response()
+            if request.url.path == "/v1/snapshot/upload":
+                request.read()
+                return httpx.Response(self.upload_statuses.pop(0) if self.upload_statuses else 200)
+            if request.url.path == "/v1/memory/upsert_vector_q16":
+                if self.q16_status != 200:
+                    return httpx.Response(self.q16_status)
+                return httpx.Response(200, json={
+                    "memory_id": "rec:1", "record_id": 1, "document_node_id": 100, "chunk_node_id": 200,
+                })
+            if request.url.path == "/v1/forbidden":
+                return httpx.Response(403)
+            body = json.loads(request.content)
+            if request.url.path == "/v1/memory/upsert_vectors":
+                if self.bulk_status != 200:
+                    return httpx.Response(self.bulk_status)
+                n = len(body["vectors"])
+                return httpx.Response(200, json={
+                    "document_node_id": 100,
+                    "memory_ids": [f"rec:{i}" for i in range(n)],
+                    "record_ids": list(range(n)),
+                    "chunk_node_ids": [200 + i for i in range(n)],
+                })
+            if request.url.path == "/v1/memory/upsert_vector":
+                rid = len(self.requests)
+                return httpx.Response(200, json={
+                    "memory_id": f"rec:{rid}",
+                    "record_id": rid,
+                    "document_node_id": body.get("attach_to_document_node", 100),
+                    "chunk_node_id": 200 + rid,
+                })
+            return httpx.Response(200, json={"results": [{"memory_id": "rec:1", "record_id": 1, "score": 0.9, "metadata": None}]})
+
+        async def embed(text):
+            return [0.1] * 4
+
+        self.transport = httpx.MockTransport(handler)
+        self.client = ProtocolClient(embed=embed, remote="http://mock-node:3000", async_=True)
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(transport=self.transport)
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_factory_returns_async_client(self):
+        self.assertIsInstance(self.client, AsyncProtocolRemoteClient)
+        self.assertEqual(self.client.max_parallel, 16)
+        with self.assertRaises(ValueError):
+            ProtocolClient(embed=lambda x: [0.1], async_=True)
+
+    async def test_api_key_is_sent_per_request_not_as_client_header(self):
+        client = AsyncProtocolRemoteClient("http://mock-node:3000", lambda t: [0.1] * 4, 4, api_key="s3cret")
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(transport=self.transport)
+        try:
+            await client.search_vector([0.1] * 4)
+        finally:
+            await client.aclose()
+        self.assertEqual(self.requests[-1].headers["Authorization"], "Bearer s3cret")
+        self.assertNotIn("Authorization", client.client.headers)
+        self.assertNotIn("s3cret", repr(client._auth))
+
+    async def test_errors_and_probes_match_sync_client(self):
+        with self.assertRaises(AuthenticationError):
+            await self.client._post("/v1/forbidden", {})
+        self.bulk_status = 500
+        with self.assertRaisesRegex(ProtocolError, "500 Server Error"):
+            await self.client._post_raw(self.client._urls.upsert_vectors, {"vectors": []}, allow_missing=True)
+
+    async def test_upsert_vector_q16_falls_back_on_415(self):
+        res = await self.client.upsert_vector_q16([0.25] * 4, attach_to_document_node=7)
+        self.assertEqual(res["record_id"], 1)
+        q16 = self.requests[-1]
+        self.assertEqual(q16.url.params["attach_to_document_node"], "7")
+        self.assertEqual(len(q16.content), 16)
+
+        self.q16_status = 415
+        await self.client.upsert_vector_q16([0.25] * 4)
+        self.assertFalse(self.client.supports_q16)
+        self.assertEqual(self.requests[-1].url.path, "/v1/memory/upsert_vector")
+
+    async def test_snapshot_zstd_roundtrip(self):
+        zstd = pytest.importorskip("zstandard")
+        blob = b"snapshot-bytes" * 1000
+        frame = zstd.ZstdCompressor().compress(blob)
+        self.snapshot_response = lambda: httpx.Response(
+            200, stream=httpx.ByteStream(frame), headers={"Content-Encoding": "zstd"}
+        )
+        self.assertEqual(await self.client.snapshot(), blob)
+        self.assertEqual(self.requests[-1].headers["Accept-Encoding"], "zstd")
+        out = io.BytesIO()
+        self.assertIsNone(await self.client.snapshot(out))
+        self.assertEqual(out.getvalue(), blob)
+
+        await self.client.restore(io.BytesIO(blob), compress=True)
+        upload = self.requests[-1]
+        self.assertEqual(upload.headers["Content-Encoding"], "zstd")
+        self.assertEqual(zstd.ZstdDecompressor().decompressobj().decompress(upload.content), blob)
+
+    async def test_restore_compressed_falls_back_when_node_rejects_zstd(self):
+        pytest.importorskip("zstandard")
+        self.upload_statuses = [415, 200]
+        await self.client.restore(b"snapshot-bytes", compress=True)
+
+        first, retry = self.requests
+        self.assertEqual(first.headers["Content-Encoding"], "zstd")
+        self.assertNotIn("Content-Encoding", retry.headers)
+        self.assertEqual(retry.content, b"snapshot-bytes")
+
+    async def test_search_text_awaits_embedder(self):
+        res = await self.client.search_text("query", k=3)
+        self.assertEqual(res["results"][0]["record_id"], 1)
+        self.assertEqual(json.loads(self.requests[0].content)["k"], 3)
+
+    async def test_sync_client_coroutine_methods(self):
+        sync = ProtocolClient(embed=lambda t: [0.1] * 4, remote="http://mock-node:3000")
+        sync._async_impl = self.client
+
+        res = await sync.aupsert_text("word " * 300, chunk_size=200)
+        self.assertEqual(res["record_ids"], list(range(res["chunk_count"])))
+        self.assertEqual(self.requests[-1].url.path, "/v1/memory/upsert_vectors")
+
+        with patch("valoricore.protocol._validate_vector", wraps=protocol._validate_vector) as check, \
+                patch("valoricore.protocol._check_vectors") as check_batch:
+            hits = await sync.asearch_vector([0.1] * 4, k=2)
+        self.assertEqual(hits["results"][0]["record_id"], 1)
+        self.assertEqual(json.loads(self.requests[-1].content)["k"], 2)
+        # The query is range-checked once, not again by the async client.
+        check.assert_called_once()
+        check_batch.assert_not_called()
+
+    async def test_upsert_text_uses_bulk_route(self):
+        res = await self.client.upsert_text("word " * 300, chunk_size=200)
+        self.assertEqual([r.url.path for r in self.requests], ["/v1/memory/upsert_vectors"])
+        self.assertEqual(res["chunk_count"], len(res["record_ids"]))
+        self.assertGreater(res["chunk_count"], 1)
+
+    async def test_upsert_text_falls_back_to_gathered_upserts(self):
+        self.bulk_status = 404
+        res = await self.client.upsert_text("word " * 300, chunk_size=200)
+        self.assertFalse(self.client.supports_bulk)
+        paths = [r.url.path for r in self.requests]
+        self.assertEqual(paths[0], "/v1/memory/upsert_vectors")
+        self.assertEqual(paths[1:], ["/v1/memory/upsert_vector"] * res["chunk_count"])
+        self.assertEqual(res["document_node_id"], 100)
+        # Every chunk after the first attaches to the first chunk's document.
+        for r in self.requests[2:]:
+            self.assertEqual(json.loads(r.content)["attach_to_document_node"], 100)
+
+
+@pytest.mark.parametrize("use_msgspec", [True, False])
+def test_decode_response_agrees_with_and_without_msgspec(use_msgspec):
+    if use_msgspec and protocol.msgspec is None:
+        pytest.skip("msgspec not installed")
+    decoder = protocol.msgspec if use_msgspec else None
+    hit = {"memory_id": "rec:5", "record_id": 5, "score": 0.5, "explain": {"rank": 1}}
+
+    with patch("valoricore.protocol.msgspec", decoder):
+        res = protocol._decode_response(json.dumps({"results": [hit], "took_ms": 3}).encode(), ("results",))
+        # Missing optional keys are accepted and unknown keys are kept.
+        assert res == {"results": [hit], "took_ms": 3}
+
+        with pytest.raises(ProtocolError, match="missing keys"):
+            protocol._decode_response(b'{"hits": []}', ("results",))
+        with pytest.raises(ProtocolError, match="non-JSON"):
+            protocol._decode_response(b"<html>", ("results",))
+
 if __name__ == "__main__":
     unittest.main()
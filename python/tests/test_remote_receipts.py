@@ -36,3 +36,145 @@ def test_sync_remote_get_receipt_by_id():
 
         mock_get.assert_called_once_with("http://localhost:3000/v1/proof/receipt/rec_999", timeout=5)
         assert receipt["receipt_id"] == "rec_999"
+
+def test_sync_remote_pools_more_than_ten_connections():
+    client = SyncRemoteClient("http://localhost:3000")
+    adapter = client.session.get_adapter("http://localhost:3000/v1/records")
+    assert adapter._pool_maxsize >= 64
+
+def test_sync_remote_shares_one_session_across_threads():
+    import threading
+
+    client = SyncRemoteClient("http://localhost:3000")
+    client.session.headers["X-Trace"] = "on"
+
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(client.session))
+    worker.start()
+    worker.join()
+    # Configuration made through .session applies to every thread's calls.
+    assert seen[0] is client.session
+    assert seen[0].headers["X-Trace"] == "on"
+
+def test_sync_remote_post_rpc_encodes_numpy_bodies():
+    import json
+    import numpy as np
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[], content=b'{"id": 4}')
+
+        client = SyncRemoteClient("http://localhost:3000")
+        rid = client.insert(np.array([0.5, -1.0], dtype=np.float32))
+
+        assert rid == 4
+        body = json.loads(mock_post.call_args.kwargs["data"])
+        assert body["values"] == [0.5, -1.0]
+        assert mock_post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_sync_remote_bodies_encode_like_json_without_orjson(use_orjson):
+    import json
+    import valoricore.remote as remote
+
+    if use_orjson and remote.orjson is None:
+        pytest.skip("orjson not installed")
+    orjson = remote.orjson if use_orjson else None
+
+    with patch("valoricore.remote.orjson", orjson), patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[], content=b'{"record_id": 1}')
+
+        client = SyncRemoteClient("http://localhost:3000")
+        client.memory_upsert([0.1, 0.2], metadata={3: "c", "big": 2 ** 70})
+
+        body = json.loads(mock_post.call_args.kwargs["data"])
+        assert body["metadata"] == {"3": "c", "big": 2 ** 70}
+
+def test_sync_remote_binary_vector_frames():
+    import struct
+    import numpy as np
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[], content=b'{"ids": [0, 1]}')
+
+        client = SyncRemoteClient("http://localhost:3000")
+        vecs = np.array([[1.0, 0.0, 0.5], [0.0, 1.0, -0.5]])
+        assert client.insert_bin(vecs, collection="docs") == [0, 1]
+
+        kw = mock_post.call_args.kwargs
+        assert mock_post.call_args.args[0].endswith("/v1/vectors/insert_bin")
+        assert kw["headers"]["Content-Type"] == "application/octet-stream"
+        assert kw["params"] == {"collection": "docs"}
+        assert struct.unpack("<II", kw["data"][:8]) == (3, 2)
+        assert np.frombuffer(kw["data"][8:], dtype="<f4").tolist() == vecs.ravel().tolist()
+
+        mock_post.return_value.content = b'{"results": [{"id": 0, "score": 0.0}]}'
+        assert client.search_bin(vecs[0], k=5) == [{"id": 0, "score": 0.0}]
+        data = mock_post.call_args.kwargs["data"]
+        assert struct.unpack("<II", data[:8]) == (3, 5)
+        assert len(data) == 8 + 3 * 4
+
+@pytest.mark.parametrize("quant,tol", [("fp16", 1e-3), ("int8", 1e-2)])
+def test_sync_remote_quantized_insert_and_search(quant, tol):
+    import json
+    import numpy as np
+    from valoricore.remote import _dequantized
+
+    vec = np.array([0.5, -1.0, 0.3, 0.01], dtype=np.float32)
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[], content=b'{"id": 1}')
+
+        client = SyncRemoteClient("http://localhost:3000", quant=quant)
+        assert client.insert(vec) == 1
+        wire = json.loads(mock_post.call_args.kwargs["data"])["values"]
+        assert isinstance(wire, dict)
+        assert np.allclose(_dequantized(wire), vec, atol=tol)
+
+        mock_post.return_value.content = b'{"results": []}'
+        client.search(vec, k=3)
+        assert json.loads(mock_post.call_args.kwargs["data"])["query"] == wire
+
+def test_sync_remote_upsert_vector_full_respects_quant():
+    import json
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[], content=json.dumps({
+            "memory_id": "rec:1", "record_id": 1, "document_node_id": 2, "chunk_node_id": 3,
+            "proof_hash": "cd" * 32,
+        }).encode())
+
+        client = SyncRemoteClient("http://localhost:3000", quant="fp16")
+        res = client.upsert_vector_full([0.5, -1.0, 0.25, 0.0])
+
+        body = json.loads(mock_post.call_args.kwargs["data"])
+        assert set(body["vector"]) == {"f16"}
+        # The node's proof of the stored (rounded) vector is passed through.
+        assert res["proof_hash"] == "cd" * 32
+
+def test_sync_remote_upsert_document_batch_respects_quant():
+    import json
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200, history=[], content=json.dumps({
+            "document_node_id": 2, "memory_ids": ["rec:1"], "record_ids": [1],
+            "chunk_node_ids": [3], "proof_hashes": ["cd" * 32],
+        }).encode())
+
+        client = SyncRemoteClient("http://localhost:3000", quant="int8")
+        res = client.upsert_document_batch([[0.5, -1.0, 0.25, 0.0]])
+
+        body = json.loads(mock_post.call_args.kwargs["data"])
+        assert set(body["vectors"][0]) == {"scale", "i8"}
+        assert res["proof_hashes"] == ["cd" * 32]
+
+def test_sync_remote_rejects_unknown_quant():
+    with pytest.raises(ValueError):
+        SyncRemoteClient("http://localhost:3000", quant="int4")
+
+def test_rpc_urls_are_built_once_per_target():
+    from valoricore.remote import _RpcUrls
+
+    urls = _RpcUrls()
+    first = urls.url("http://seed:3000", "/v1/search")
+    assert first == "http://seed:3000/v1/search"
+    assert urls.url("http://seed:3000", "/v1/search") is first
+    assert urls.url("http://leader:3000", "/v1/search") == "http://leader:3000/v1/search"
@@ -50,7 +50,7 @@ _warnings.filterwarnings(
 from .local import LocalClient
 from .remote import SyncRemoteClient, AsyncRemoteClient, ClusterClient, AsyncClusterClient
 from .memory import MemoryClient
-from .protocol import ProtocolClient, ProtocolRemoteClient
+from .protocol import ProtocolClient, ProtocolRemoteClient, AsyncProtocolRemoteClient
 from .graph import Node, DocumentGraph
 from .async_memory import AsyncMemoryClient
 from .factory import Valoricore, AsyncValoricore
@@ -125,6 +125,7 @@ __all__ = [
     # ── Protocol clients ───────────────────────────────────────────
     "ProtocolClient",
     "ProtocolRemoteClient",
+    "AsyncProtocolRemoteClient",
 
     # ── Base clients ───────────────────────────────────────────────
     "LocalClient",
@@ -31,7 +31,7 @@ class AsyncMemoryClient:
         remote:       HTTP URL of a standalone ``valori-node``.  When set, all
                       operations are forwarded over the network.
         index_kind:   Vector index backend: ``"bruteforce"``, ``"hnsw"``, or ``"ivf"``.
-        quantization: Reserved for future use.
+        quantization: ``"none"`` or ``"binary"`` (see :class:`MemoryClient`).
 
     Example::
 
@@ -131,6 +131,19 @@ class AsyncMemoryClient:
             chunks, embed, parent_document_node, title,
         )
 
+    async def add_document_with_vectors(
+        self,
+        chunks: List[str],
+        vectors: List[Vector],
+        parent_document_node: Optional[int] = None,
+        title: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async version of :meth:`MemoryClient.add_document_with_vectors`."""
+        return await self._thread(
+            self._sync_client.add_document_with_vectors,
+            chunks, vectors, parent_document_node, title,
+        )
+
     async def upsert_vector(
         self,
         vector: Vector,
@@ -49,7 +49,7 @@ from __future__ import annotations
 import os
 import hashlib
 import logging
-from typing import Callable, List, Optional, Any
+from typing import Callable, List, Optional, Any, Tuple
 
 # Every provider uses this logger — set level with logging.getLogger("valoricore.embeddings")
 logger = logging.getLogger(__name__)
@@ -702,6 +702,58 @@ class AsyncEmbedder:
         return await loop.run_in_executor(None, self._embedder.embed_batch, texts)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch dispatch
+# ─────────────────────────────────────────────────────────────────────────────
+def embed_many(embed: Any, texts: List[str]) -> List[List[float]]:
+    """
+    Embed *texts* with as few provider calls as *embed* allows.
+
+    Uses ``embed.embed_batch`` when present (every :class:`BaseEmbedder`),
+    else calls ``embed(texts)`` once if the callable sets
+    ``supports_batch = True``, else falls back to one call per text.
+
+    Batched calls see the texts sorted by length, so a model that pads each
+    mini-batch to its longest input pads similar-length chunks together.
+    Results are returned in the order of *texts*.
+
+    Example::
+
+        def my_embed(texts):            # accepts a list
+            return model.encode(texts).tolist()
+        my_embed.supports_batch = True
+
+        vecs = embed_many(my_embed, ["a", "b", "c"])   # one call
+    """
+    batch = _batch_fn(embed)
+    if batch is None:
+        return [embed(t) for t in texts]
+    order, by_length = _by_length(texts)
+    return _unsort(order, list(batch(by_length)))
+
+
+def _batch_fn(embed: Any) -> Optional[Callable[[List[str]], Any]]:
+    """The callable that embeds a list of texts at once, or None if *embed* can't."""
+    batch = getattr(embed, "embed_batch", None)
+    if batch is None and getattr(embed, "supports_batch", False):
+        batch = embed
+    return batch
+
+
+def _by_length(texts: List[str]) -> Tuple[List[int], List[str]]:
+    """Permutation sorting *texts* by length, and the texts in that order."""
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    return order, [texts[i] for i in order]
+
+
+def _unsort(order: List[int], vecs: List[Any]) -> List[Any]:
+    """Invert :func:`_by_length`: put ``vecs[pos]`` back at ``order[pos]``."""
+    out: List[Any] = [None] * len(order)
+    for pos, i in enumerate(order):
+        out[i] = vecs[pos]
+    return out
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Convenience factory
 # ─────────────────────────────────────────────────────────────────────────────
@@ -760,5 +812,6 @@ __all__ = [
     "CachedEmbedder",
     "AsyncEmbedder",
     "get_embedder",
+    "embed_many",
     "EmbedFn",
 ]
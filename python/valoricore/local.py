@@ -1,11 +1,15 @@
 # Copyright (c) 2025 Varshith Gudur. Licensed under MIT OR Apache-2.0.
+from array import array
 from collections import deque
 from typing import List, Dict, Optional, Any, Tuple
+import json
 import os
 import threading
+import numpy as np
 from .types import Vector, RecordId, NodeId, Proof, StateHash
 from .exceptions import ValidationError, KernelError
 from .base import ValoriClient
+from . import graph as _g
 
 # H-1: Process-global lock that serialises the env-var mutation → engine-init →
 # env-restore block.  Without this, two threads racing through LocalClient.__init__
@@ -22,6 +26,13 @@ except ImportError:
     except ImportError:
         _ffi = None
 
+def _pack_f32(vector: Vector) -> bytes:
+    """Pack *vector* as native-endian f32 bytes for the kernel's ``*_packed`` calls."""
+    if isinstance(vector, np.ndarray):
+        return np.ascontiguousarray(vector, dtype=np.float32).tobytes()
+    return array("f", vector).tobytes()
+
+
 class LocalClient(ValoriClient):
     """Synchronous FFI client for the embedded Valoricore Kernel."""
 
@@ -37,7 +48,7 @@ class LocalClient(ValoriClient):
         """
         Args:
             path:        Database directory.
-            index_kind:  ``"bruteforce"`` | ``"hnsw"`` | ``"ivf"``
+            index_kind:  ``"bruteforce"`` | ``"hnsw"`` | ``"ivf"`` | ``"bq"``
 
                          **Index selection:**
                          - ``"bruteforce"`` — O(N) scan. Fine up to ~50K records
@@ -49,6 +60,9 @@ class LocalClient(ValoriClient):
                            (0.107 ms / 9 199 QPS at 1M records).
                          - ``"ivf"`` — Approximate; good at 10K–100K. Degrades at 1M+
                            without centroid tuning. Use HNSW instead for large datasets.
+                         - ``"bq"`` — 1-bit binary quantization. Scans packed sign
+                           bits by Hamming distance, then re-ranks the oversampled
+                           candidate pool with exact f32 L2.
 
             max_records: Vector pool capacity. Overrides ``VALORI_MAX_RECORDS``.
                          Default 0 inherits the kernel default (1 000 000).
@@ -126,7 +140,7 @@ class LocalClient(ValoriClient):
     ) -> RecordId:
         """Insert a vector into the kernel."""
         try:
-            res = self.kernel.insert(vector, tag)
+            res = self.kernel.insert_packed(_pack_f32(vector), tag)
             self._check_auto_snapshot(1)
             return res
         except ValueError as e:
@@ -135,7 +149,7 @@ class LocalClient(ValoriClient):
     def insert_with_proof(self, vector: Vector, tag: int = 0) -> Tuple[RecordId, Proof]:
         """Insert a vector and return its ID and binary Merkle proof."""
         try:
-            rid, proof_hex = self.kernel.insert_with_proof(vector, tag)
+            rid, proof_hex = self.kernel.insert_with_proof_packed(_pack_f32(vector), tag)
             self._check_auto_snapshot(1)
             return rid, bytes.fromhex(proof_hex)
         except ValueError as e:
@@ -157,7 +171,7 @@ class LocalClient(ValoriClient):
     ) -> List[Dict[str, Any]]:
         """Perform nearest neighbour search."""
         try:
-            hits = self.kernel.search(query, k, filter_tag)
+            hits = self.kernel.search_packed(_pack_f32(query), k, filter_tag)
             return [{"id": h[0], "score": h[1]} for h in hits]
         except ValueError as e:
             raise ValidationError(str(e))
@@ -168,6 +182,14 @@ class LocalClient(ValoriClient):
     def create_edge(self, from_id: int, to_id: int, kind: int) -> int:
         return self.kernel.create_edge(from_id, to_id, kind)
 
+    def create_nodes_batch(self, kind: int, record_ids: List[Optional[int]]) -> List[NodeId]:
+        """Create one node per record ID in a single FFI call."""
+        return self.kernel.create_nodes_batch(kind, record_ids)
+
+    def create_edges_batch(self, from_id: int, to_ids: List[int], kind: int) -> List[int]:
+        """Create ``from_id -> to`` edges for every ID in *to_ids* in a single FFI call."""
+        return self.kernel.create_edges_batch(from_id, to_ids, kind)
+
     # ── High-level fluent graph API ────────────────────────────────────────────
 
     def node(self, kind: int, vector=None, tag: int = 0):
@@ -182,7 +204,6 @@ class LocalClient(ValoriClient):
             #   rid = db.insert(my_embedding)
             #   nid = db.create_node(NODE_CHUNK, record_id=rid)
         """
-        from . import graph as _g
         record_id = None
         if vector is not None:
             record_id = self.insert(vector, tag=tag)
@@ -197,7 +218,6 @@ class LocalClient(ValoriClient):
             db.edge(doc_node, chunk_node, EDGE_PARENT_OF)
             db.edge(3, 7, EDGE_REFERS_TO)   # raw ints still work
         """
-        from . import graph as _g
         from_id = from_node.id if isinstance(from_node, _g.Node) else int(from_node)
         to_id   = to_node.id   if isinstance(to_node,   _g.Node) else int(to_node)
         return self.create_edge(from_id=from_id, to_id=to_id, kind=kind)
@@ -214,7 +234,6 @@ class LocalClient(ValoriClient):
             doc  = builder.document    # root Node
             rids = builder.record_ids  # [0, 1, 2, …]
         """
-        from . import graph as _g
         return _g.DocumentGraph(self, title=title)
 
     def delete_node(self, node_id: int) -> None:
@@ -222,7 +241,6 @@ class LocalClient(ValoriClient):
         try:
             self.kernel.delete_node(node_id)
         except Exception as e:
-            from .exceptions import KernelError
             raise KernelError(f"Failed to delete node {node_id}: {e}")
 
     def delete_edge(self, edge_id: int) -> None:
@@ -230,7 +248,6 @@ class LocalClient(ValoriClient):
         try:
             self.kernel.delete_edge(edge_id)
         except Exception as e:
-            from .exceptions import KernelError
             raise KernelError(f"Failed to delete edge {edge_id}: {e}")
 
     def get_node(self, node_id: int) -> Optional[Dict[str, Any]]:
@@ -348,21 +365,19 @@ class LocalClient(ValoriClient):
     
     def get_metadata(self, record_id: int) -> Optional[Dict[str, Any]]:
         """Return metadata dict for a record, or None if not set."""
-        import json as _json
         raw = self.kernel.get_metadata(record_id)
         if raw is None:
             return None
         try:
             blob = bytes(raw) if not isinstance(raw, (bytes, bytearray)) else raw
-            return _json.loads(blob.decode())
+            return json.loads(blob.decode())
         except Exception:
             return None
 
     def set_metadata(self, record_id: int, metadata: Dict[str, Any]) -> None:
         """Attach a metadata dict to a record (stored as UTF-8 JSON bytes)."""
-        import json as _json
         try:
-            blob = _json.dumps(metadata, separators=(",", ":")).encode()
+            blob = json.dumps(metadata, separators=(",", ":")).encode()
             self.kernel.set_metadata(record_id, list(blob))
         except ValueError as e:
             raise ValidationError(str(e))
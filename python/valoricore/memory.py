@@ -6,8 +6,9 @@ from .kinds import (
     EDGE_PARENT_OF, EDGE_REFERS_TO,
 )
 from .ingest import chunk_text
+from .embeddings import embed_many
 from .types import Vector, RecordId, NodeId, Proof, Metadata, StateHash
-from .exceptions import ValidationError
+from .exceptions import NotFoundError, ValidationError
 
 EmbedFn = Callable[[str], Vector]
 
@@ -34,8 +35,11 @@ class MemoryClient:
         Args:
             path:         Directory for the local embedded database.
             remote:       HTTP URL of a standalone ``valori-node``.
-            index_kind:   ``"bruteforce"`` | ``"hnsw"``
-            quantization: Reserved for future quantization options.
+            index_kind:   ``"bruteforce"`` | ``"hnsw"`` | ``"ivf"`` | ``"bq"``
+            quantization: ``"none"`` | ``"binary"``. ``"binary"`` selects the kernel's
+                          1-bit tier (Hamming prefilter, f32 rescore) and is
+                          shorthand for ``index_kind="bq"``. Local mode only; a
+                          remote node's index is configured on the node.
             max_records:  Vector pool capacity. Default 0 inherits the kernel default
                           (1 000 000). Override only when you need a different limit.
                           Example: ``max_records=500_000``.
@@ -44,6 +48,15 @@ class MemoryClient:
             max_nodes:    Knowledge Graph node capacity.
             max_edges:    Knowledge Graph edge capacity.
         """
+        if quantization == "binary":
+            if index_kind not in ("bruteforce", "bq"):
+                raise ValidationError(
+                    f"quantization='binary' uses the 'bq' index; got index_kind={index_kind!r}"
+                )
+            index_kind = "bq"
+        elif quantization != "none":
+            raise ValidationError(f"Unknown quantization {quantization!r}; expected 'none' or 'binary'")
+
         self._db = Valoricore(
             remote=remote,
             path=path,
@@ -58,6 +71,10 @@ class MemoryClient:
         # Dimension configured at construction time.  0 means "infer from
         # first insert" — we skip explicit validation in that case.
         self._dim = dim
+        # Flipped off the first time a remote node answers
+        # /v1/memory/upsert_vectors with 404/405; documents then take the
+        # staged insert / nodes / edges path.
+        self.supports_bulk = True
 
     def add_document(
         self,
@@ -86,26 +103,64 @@ class MemoryClient:
         parent_document_node: Optional[int] = None,
         title: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Lower-level API to register pre-chunked text."""
-        chunk_node_ids = []
-        record_ids = []
-        proof_hashes = []
-        
+        """Lower-level API to register pre-chunked text.
+
+        *embed* is called once for all chunks when it batches (see
+        ``valoricore.embeddings.embed_many``), else once per chunk.
+        """
+        return self.add_document_with_vectors(
+            chunks=chunks,
+            vectors=embed_many(embed, chunks),
+            parent_document_node=parent_document_node,
+            title=title,
+        )
+
+    def add_document_with_vectors(
+        self,
+        chunks: List[str],
+        vectors: List[Vector],
+        parent_document_node: Optional[int] = None,
+        title: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Register pre-chunked text whose embeddings were computed by the caller."""
+        if len(vectors) != len(chunks):
+            raise ValidationError(f"Got {len(vectors)} vectors for {len(chunks)} chunks")
+
+        # A remote node does the insert, chunk nodes and edges in one request.
+        upsert_document = getattr(self._db, "upsert_document_batch", None)
+        if len(vectors) and upsert_document is not None and self.supports_bulk:
+            try:
+                res = upsert_document(vectors, attach_to_document_node=parent_document_node)
+            except NotFoundError:
+                # Node predates the route: stage it below, now and from now on.
+                self.supports_bulk = False
+            else:
+                return {
+                    "document_node_id": res["document_node_id"],
+                    "chunk_node_ids": res["chunk_node_ids"],
+                    "record_ids": res["record_ids"],
+                    "proof_hashes": res["proof_hashes"],
+                    "title": title,
+                    "chunk_count": len(chunks)
+                }
+
         if parent_document_node is None:
             doc_node_id = self._db.create_node(kind=NODE_DOCUMENT, record_id=None)
         else:
             doc_node_id = parent_document_node
-            
-        for chunk in chunks:
-            vec = embed(chunk)
-            rid, proof = self._db.insert_with_proof(vec)
-            record_ids.append(rid)
-            proof_hashes.append(proof if isinstance(proof, str) else proof.hex())
-            
-            cid = self._db.create_node(kind=NODE_CHUNK, record_id=rid)
-            chunk_node_ids.append(cid)
-            self._db.create_edge(from_id=doc_node_id, to_id=cid, kind=EDGE_PARENT_OF)
-            
+
+        chunk_node_ids: List[int] = []
+        record_ids: List[int] = []
+        proof_hashes: List[str] = []
+
+        # One call per stage rather than per chunk: insert, chunk nodes, edges.
+        if len(vectors):
+            inserted = self._db.insert_batch_with_proof(vectors, [0] * len(vectors))
+            record_ids = [rid for rid, _ in inserted]
+            proof_hashes = [p if isinstance(p, str) else p.hex() for _, p in inserted]
+            chunk_node_ids = self._db.create_nodes_batch(NODE_CHUNK, record_ids)
+            self._db.create_edges_batch(doc_node_id, chunk_node_ids, EDGE_PARENT_OF)
+
         return {
             "document_node_id": doc_node_id,
             "chunk_node_ids": chunk_node_ids,
@@ -124,6 +179,18 @@ class MemoryClient:
         if self._dim and len(vector) != self._dim:
             raise ValidationError(f"Embedding must be {self._dim}-dimensional, got {len(vector)}")
 
+        # A remote node does the insert, chunk node and edge in one request,
+        # and returns the proof of what it stored ("" from nodes predating it).
+        upsert_full = getattr(self._db, "upsert_vector_full", None)
+        if upsert_full is not None:
+            res = upsert_full(vector, attach_to_document_node=attach_to_document_node)
+            return {
+                "record_id": res["record_id"],
+                "document_node_id": res["document_node_id"],
+                "chunk_node_id": res["chunk_node_id"],
+                "proof_hash": res.get("proof_hash", ""),
+            }
+
         rid, proof = self._db.insert_with_proof(vector)
 
         if attach_to_document_node is None:
@@ -153,17 +220,7 @@ class MemoryClient:
             raise ValidationError(f"Embedding must be {self._dim}-dimensional, got {len(vec)}")
             
         hits = self._db.search(vec, k=k)
-        
-        normalized_hits = []
-        for hit in hits:
-            if isinstance(hit, (list, tuple)):
-                 rid, score = hit
-            else:
-                 rid = hit["id"]
-                 score = hit["score"]
-            normalized_hits.append({"id": rid, "score": score})
-            
-        return normalized_hits
+        return [{"id": hit["id"], "score": hit["score"]} for hit in hits]
 
     # ── Batch operations ───────────────────────────────────────────────────
 
@@ -321,6 +378,33 @@ class MemoryClient:
         """
         return self._db.create_edge(from_id=from_id, to_id=to_id, kind=kind)
 
+    def create_nodes_batch(self, kind: int, record_ids: List[Optional[int]]) -> List[NodeId]:
+        """
+        Create one Knowledge Graph node per record ID.
+
+        Args:
+            kind:       Integer node kind shared by every new node.
+            record_ids: Record ID (or ``None``) to attach to each node.
+
+        Returns:
+            New node IDs in input order.
+        """
+        return self._db.create_nodes_batch(kind, record_ids)
+
+    def create_edges_batch(self, from_id: int, to_ids: List[int], kind: int) -> List[int]:
+        """
+        Create a directed edge from one node to each of several nodes.
+
+        Args:
+            from_id: Source node ID.
+            to_ids:  Target node IDs.
+            kind:    Integer edge kind shared by every new edge.
+
+        Returns:
+            New edge IDs in input order.
+        """
+        return self._db.create_edges_batch(from_id, to_ids, kind)
+
     # ── High-level fluent graph API ────────────────────────────────────────────
 
     def node(self, kind: int, vector=None, tag: int = 0):
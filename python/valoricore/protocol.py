@@ -2,12 +2,55 @@
 # Copyright (c) 2025 Varshith Gudur. Licensed under MIT OR Apache-2.0.
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import inspect
+import queue
+import sys
+import threading
+import time
+import warnings
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import numpy as np
 import requests
-from typing import Callable, List, Dict, Any, Optional, TypedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Dict, Any, AsyncIterator, Optional, Tuple, TypedDict, Union
+
+# Optional fast path: msgspec parses response bodies in C. Decoding is
+# untyped, so a response carries the same keys whichever parser ran.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+# Optional fast path: BLAKE3 keys the embedding cache (blake2b otherwise).
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Optional: the h2 package lets AsyncProtocolRemoteClient multiplex requests
+# over HTTP/2. httpx refuses http2=True without it, so fall back to HTTP/1.1.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 from .memory import MemoryClient
-from .remote import _BearerAuth
-from .kinds import NODE_DOCUMENT, NODE_CHUNK, EDGE_PARENT_OF
+from .ingest import chunk_text
+from .embeddings import embed_many, _batch_fn, _by_length, _unsort
+# Request bodies (including the float32 arrays _validate_vector returns) are
+# encoded with orjson when it is installed; see remote._dumps.
+from .remote import (
+    _BearerAuth, _JSON_HEADERS, _SNAPSHOT_ACCEPT, _SNAPSHOT_CHUNK, _SNAPSHOT_REJECTED, SnapshotSource,
+    _dumps, _loads, _post_snapshot, _read_snapshot, _snapshot_attempts, _snapshot_decoder,
+)
 from .exceptions import (
     ValoricoreError,
     ValidationError,
@@ -17,6 +60,9 @@ from .exceptions import (
 # Backward-compat alias — callers that caught AuthError still work
 AuthError = AuthenticationError
 
+# An EmbedFn maps one text to one vector. Embedders that expose
+# ``embed_batch(texts)`` (every BaseEmbedder) or set ``supports_batch = True``
+# and accept a list are called once per document instead; see embed_many.
 EmbedFn = Callable[[str], List[float]]
 
 class MemoryUpsertTextRequest(TypedDict, total=False):
@@ -33,16 +79,34 @@ class MemoryUpsertResponse(TypedDict):
     chunk_node_ids: List[int]
     chunk_count: int
 
-class MemoryUpsertVectorResponse(TypedDict):
+class _MemoryUpsertVectorResponseOptional(TypedDict, total=False):
+    proof_hash: str
+    log_index: int
+
+class MemoryUpsertVectorResponse(_MemoryUpsertVectorResponseOptional):
     memory_id: str
     record_id: int
     document_node_id: int
     chunk_node_id: int
 
-class MemorySearchResponseHit(TypedDict):
+class _MemoryUpsertVectorsResponseOptional(TypedDict, total=False):
+    log_index: int
+
+class MemoryUpsertVectorsResponse(_MemoryUpsertVectorsResponseOptional):
+    document_node_id: int
+    memory_ids: List[str]
+    record_ids: List[int]
+    chunk_node_ids: List[int]
+
+class _MemorySearchResponseHitOptional(TypedDict, total=False):
+    decay_factor: float
+    age_secs: int
+
+class MemorySearchResponseHit(_MemorySearchResponseHitOptional):
     memory_id: str
     record_id: int
-    score: int
+    # Local FFI returns integer distances, the node returns f32.
+    score: float
     metadata: Optional[Dict[str, Any]]
 
 class MemorySearchResponse(TypedDict):
@@ -55,190 +119,1139 @@ FXP_MIN = -32767.0
 MAX_SAFE_FLOAT = FXP_MAX # Alias for backward compat/clarity
 MIN_SAFE_FLOAT = FXP_MIN
 
-def _validate_vector(vector: List[float]) -> None:
-    for i, v in enumerate(vector):
-        if not (MIN_SAFE_FLOAT <= v <= MAX_SAFE_FLOAT):
-            raise ValidationError(
-                f"Embedding value at index {i} ({v}) out of allowed range [{MIN_SAFE_FLOAT}, {MAX_SAFE_FLOAT}] for Q16.16 fixed-point storage."
-            )
+def _validate_vector(vector: List[float]) -> np.ndarray:
+    """Range-check *vector* for Q16.16 storage and return it as float32.
+
+    The check runs as two vectorised reductions; only a failing vector pays
+    for locating the offending index. NaN still fails, as it did with the
+    element-wise loop, because it propagates through min/max.
+
+    A float32 ndarray, ``array('f')`` or memoryview is used without a copy.
+    """
+    arr = np.asarray(vector, dtype=np.float32)
+    if arr.ndim != 1:
+        raise ValidationError(f"Embedding must be a 1-D vector, got shape {arr.shape}")
+    if arr.size and not (MIN_SAFE_FLOAT <= arr.min() and arr.max() <= MAX_SAFE_FLOAT):
+        i = int(np.argmin((arr >= MIN_SAFE_FLOAT) & (arr <= MAX_SAFE_FLOAT)))
+        raise ValidationError(
+            f"Embedding value at index {i} ({vector[i]}) out of allowed range [{MIN_SAFE_FLOAT}, {MAX_SAFE_FLOAT}] for Q16.16 fixed-point storage."
+        )
+    return arr
+
+_FXP_SCALE = 65536.0
+
+def _q16_bytes(arr: np.ndarray) -> bytes:
+    """Quantise a validated float32 vector to little-endian i32 Q16.16 bytes.
+
+    Matches the kernel's ``fxp::ops::from_f32`` bit for bit: the scale by
+    2**16 is exact in float64, and rounding is half away from zero like
+    Rust's ``f32::round`` (``np.round`` would round half to even).
+    """
+    scaled = arr.astype(np.float64) * _FXP_SCALE
+    return (np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)).astype("<i4").tobytes()
+
+# Canonical memory id for a record ("rec:<record_id>"). Concatenating onto an
+# interned prefix beats str.format (method dispatch + format-spec parsing),
+# which matters when building ids for k=100+ hits or whole documents.
+_REC_PREFIX = sys.intern("rec:")
+
+def _format_memory_id(record_id: int) -> str:
+    return _REC_PREFIX + str(record_id)
+
+def _memory_ids(record_ids: Iterable[int]) -> List[str]:
+    return [_REC_PREFIX + rid for rid in map(str, record_ids)]
+
+# Compact search response the node sends for ``Accept: application/x-valori-hits``:
+# a u32 hit count, then (u32 record_id, f32 score) per hit, all little-endian.
+_BINARY_HITS_MEDIA_TYPE = "application/x-valori-hits"
+_BINARY_HIT_DTYPE = np.dtype([("record_id", "<u4"), ("score", "<f4")])
+
+def _decode_binary_hits(content: bytes) -> MemorySearchResponse:
+    """Decode a binary hits body into the usual response, without metadata."""
+    count = int.from_bytes(content[:4], "little")
+    if len(content) < 4 or len(content) != 4 + count * _BINARY_HIT_DTYPE.itemsize:
+        raise ProtocolError("invalid server response: truncated binary hits")
+    hits = np.frombuffer(content, dtype=_BINARY_HIT_DTYPE, offset=4)
+    ids = hits["record_id"].tolist()
+    scores = hits["score"].tolist()
+    return {
+        "results": [
+            {"memory_id": mid, "record_id": rid, "score": score, "metadata": None}
+            for mid, rid, score in zip(_memory_ids(ids), ids, scores)
+        ]
+    }
+
+_OCTET_HEADERS = {"Content-Type": "application/octet-stream"}
+# JSON stays acceptable so a node without the binary encoding still answers.
+_BINARY_HITS_HEADERS = {**_JSON_HEADERS, "Accept": "application/x-valori-hits, application/json;q=0.5"}
+
+# The two hot request bodies are spliced from constant fragments around the
+# serialised vector, skipping the per-call dict build and key encoding.
+def _search_body(arr: np.ndarray, k: int) -> bytes:
+    return b'{"query_vector":' + _dumps(arr) + b',"k":%d}' % k
+
+def _upsert_body(arr: np.ndarray) -> bytes:
+    return b'{"vector":' + _dumps(arr) + b"}"
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+def _text_key(text: str) -> bytes:
+    data = text.encode()
+    if _blake3 is not None:
+        return _blake3(data).digest(length=16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+class _CachedEmbed:
+    """LRU cache in front of an EmbedFn, keyed by a 16-byte hash of the text.
+
+    Keying by digest keeps memory bounded by ``maxsize`` vectors rather than
+    by the size of the cached chunk texts. ``embed_batch`` only sends cache
+    misses to the wrapped embedder, in one call when it can batch.
+    """
+
+    def __init__(self, embed: EmbedFn, maxsize: int) -> None:
+        self._embed = embed
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[bytes, Tuple[float, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _get(self, key: bytes) -> Optional[Tuple[float, ...]]:
+        with self._lock:
+            vec = self._cache.get(key)
+            if vec is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(key)
+            return vec
+
+    def _put(self, key: bytes, vec: Tuple[float, ...]) -> None:
+        with self._lock:
+            self._cache[key] = vec
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def __call__(self, text: str) -> List[float]:
+        key = _text_key(text)
+        vec = self._get(key)
+        if vec is None:
+            vec = tuple(self._embed(text))
+            self._put(key, vec)
+        return list(vec)
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        keys = [_text_key(t) for t in texts]
+        vecs = [self._get(k) for k in keys]
+        missing = [i for i, v in enumerate(vecs) if v is None]
+        if missing:
+            fresh = embed_many(self._embed, [texts[i] for i in missing])
+            for i, vec in zip(missing, fresh):
+                vecs[i] = tuple(vec)
+                self._put(keys[i], vecs[i])
+        return [list(v) for v in vecs]
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Drop every cached vector and reset the stats, like ``lru_cache``."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+class _BatchEmbed:
+    """EmbedFn built from a list-in, list-out ``embed_batch`` callable.
 
-def _ensure_keys(d: dict, keys):
-    missing = [k for k in keys if k not in d]
+    Exposes ``embed_batch`` so embed_many (and the embedding cache) hand it
+    every chunk of a document in one call. Single texts go to *embed* when
+    one was also given, else through a one-element batch.
+    """
+
+    def __init__(self, embed: Optional[EmbedFn], embed_batch: Callable[[List[str]], List[List[float]]]) -> None:
+        self._embed = embed
+        self.embed_batch = embed_batch
+
+    def __call__(self, text: str) -> List[float]:
+        if self._embed is not None:
+            return self._embed(text)
+        return self.embed_batch([text])[0]
+
+def _embed_fn(embed: Optional[EmbedFn], embed_batch: Optional[Callable[[List[str]], List[List[float]]]]) -> EmbedFn:
+    """Resolve the ``embed`` / ``embed_batch`` constructor pair to one EmbedFn."""
+    if embed_batch is not None:
+        return _BatchEmbed(embed, embed_batch)
+    if embed is None:
+        raise ValueError("ProtocolClient needs embed or embed_batch")
+    return embed
+
+_UPSERT_VECTOR_KEYS = ("memory_id", "record_id", "document_node_id", "chunk_node_id")
+_UPSERT_VECTORS_KEYS = ("document_node_id", "memory_ids", "record_ids", "chunk_node_ids")
+
+def _decode_response(content: bytes, required: Tuple[str, ...]) -> Dict[str, Any]:
+    """Parse a JSON response body and check it has the *required* keys.
+
+    Optional and unknown keys are kept as sent, with or without msgspec.
+    """
+    try:
+        res = msgspec.json.decode(content) if msgspec is not None else _loads(content)
+    except ValueError:  # msgspec.DecodeError subclasses ValueError too
+        raise ProtocolError("Server returned non-JSON response")
+    if not isinstance(res, dict):
+        raise ProtocolError("invalid server response: expected a JSON object")
+    missing = [k for k in required if k not in res]
     if missing:
         raise ProtocolError(f"missing keys in server response: {missing}")
-        
-import json
+    return res
+
+def _validate_matrix(vectors: Any) -> np.ndarray:
+    """Range-check a batch of equal-length vectors as one float32 (N, D) matrix.
+
+    Two reductions over all N*D values replace N calls to _validate_vector;
+    a failure reports the offending (chunk, index).
+    """
+    try:
+        m = np.asarray(vectors, dtype=np.float32)
+    except ValueError:
+        raise ValueError("vectors must all have the same dimension")
+    if m.ndim != 2:
+        raise ValueError("vectors must all have the same dimension")
+    if m.size and not (MIN_SAFE_FLOAT <= m.min() and m.max() <= MAX_SAFE_FLOAT):
+        ok = (m >= MIN_SAFE_FLOAT) & (m <= MAX_SAFE_FLOAT)
+        row, col = np.unravel_index(int(np.argmin(ok)), m.shape)
+        raise ValidationError(
+            f"Embedding value at chunk {row}, index {col} ({m[row, col]}) out of allowed range [{MIN_SAFE_FLOAT}, {MAX_SAFE_FLOAT}] for Q16.16 fixed-point storage."
+        )
+    return m
+
+def _check_vectors(vectors: List[List[float]], expected_dim: int) -> np.ndarray:
+    """Dim- and range-check a batch, returning the float32 matrix to send."""
+    m = _validate_matrix(vectors)
+    if expected_dim > 0 and m.shape[1] != expected_dim:
+        raise ValueError(f"Embedding must be {expected_dim}-dimensional")
+    return m
+
+def _bulk_payload(
+    arrays: np.ndarray,
+    attach_to_document_node: Optional[int],
+    tags: Optional[List[str]],
+    metadata: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"vectors": arrays}
+    if attach_to_document_node is not None:
+        payload["attach_to_document_node"] = attach_to_document_node
+    if tags is not None:
+        payload["tags"] = tags
+    if metadata is not None:
+        payload["metadata"] = metadata
+    return payload
+
+def _decode_bulk_response(content: bytes, count: int) -> Dict[str, Any]:
+    res = _decode_response(content, _UPSERT_VECTORS_KEYS)
+    if len(res["record_ids"]) != count or len(res["chunk_node_ids"]) != count:
+        raise ProtocolError(f"server upserted {len(res['record_ids'])} of {count} vectors")
+    # L-2: older nodes return no per-chunk proof here; don't fabricate one.
+    res.setdefault("proof_hashes", [""] * count)
+    return res
+
+def _merge_chunk_upserts(results: List[Dict[str, Any]], doc_node_id: int) -> Dict[str, Any]:
+    """Fold per-vector upsert responses (in chunk order) into the bulk shape."""
+    record_ids = []
+    chunk_node_ids = []
+    proof_hashes = []
+    for res in results:
+        if res["document_node_id"] != doc_node_id:
+            raise ProtocolError(f"server returned inconsistent document_node_id between chunks. Expected {doc_node_id}, got {res['document_node_id']}")
+        record_ids.append(res["record_id"])
+        chunk_node_ids.append(res["chunk_node_id"])
+        proof_hashes.append(res.get("proof_hash", ""))
+    return {
+        "document_node_id": doc_node_id,
+        "memory_ids": _memory_ids(record_ids),
+        "record_ids": record_ids,
+        "chunk_node_ids": chunk_node_ids,
+        "proof_hashes": proof_hashes,
+    }
+
+def _text_upsert_result(res: Optional[Dict[str, Any]], chunk_count: int) -> Dict[str, Any]:
+    if res is None:
+        return {
+            "memory_ids": [],
+            "record_ids": [],
+            "document_node_id": None,
+            "chunk_node_ids": [],
+            "proof_hashes": [],
+            "chunk_count": 0,
+        }
+    return {
+        "memory_ids": res["memory_ids"],
+        "record_ids": res["record_ids"],
+        "document_node_id": res["document_node_id"],
+        "chunk_node_ids": res["chunk_node_ids"],
+        "proof_hashes": res["proof_hashes"],
+        "chunk_count": chunk_count,
+    }
+
+# Metadata writes are coalesced by a background thread: it POSTs up to this many
+# queued writes per /v1/memory/meta/set_batch call, waiting at most this long
+# for a batch to fill after the first write arrives.
+_META_BATCH_MAX = 128
+_META_BATCH_WINDOW_SECS = 0.05
+
+# Clients whose background metadata writer has started. The writer is a daemon
+# thread, so whatever is still queued at interpreter exit is flushed here.
+_META_WRITERS: "weakref.WeakSet[ProtocolRemoteClient]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_meta_writers() -> None:
+    for client in list(_META_WRITERS):
+        try:
+            client.flush()
+        except Exception as e:
+            warnings.warn(f"queued metadata writes failed at exit: {e}", RuntimeWarning)
+
+# Connection pool per scheme. At least max_parallel so concurrent chunk
+# upserts never wait for a socket; beyond that, spare keep-alive connections
+# for callers sharing the client across threads.
+_POOL_MAXSIZE = 32
+
+
+class _Endpoints:
+    """Absolute URLs of the routes the protocol clients call, built once per client."""
+
+    __slots__ = (
+        "upsert_vector", "upsert_vectors", "upsert_vector_q16", "search_vector",
+        "meta_set", "meta_set_batch", "meta_get",
+        "snapshot_download", "snapshot_upload",
+    )
+
+    def __init__(self, base_url: str) -> None:
+        self.upsert_vector = f"{base_url}/v1/memory/upsert_vector"
+        self.upsert_vectors = f"{base_url}/v1/memory/upsert_vectors"
+        self.upsert_vector_q16 = f"{base_url}/v1/memory/upsert_vector_q16"
+        self.search_vector = f"{base_url}/v1/memory/search_vector"
+        self.meta_set = f"{base_url}/v1/memory/meta/set"
+        self.meta_set_batch = f"{base_url}/v1/memory/meta/set_batch"
+        self.meta_get = f"{base_url}/v1/memory/meta/get"
+        self.snapshot_download = f"{base_url}/v1/snapshot/download"
+        self.snapshot_upload = f"{base_url}/v1/snapshot/upload"
+
+
+def _raise_protocol_error(resp: Union[requests.Response, httpx.Response]) -> None:
+    # Handle Auth Errors specifically
+    if resp.status_code in (401, 403):
+        reason = resp.reason_phrase if isinstance(resp, httpx.Response) else resp.reason
+        raise AuthenticationError(f"Authentication failed ({resp.status_code}): {reason}")
+
+    # Try to parse JSON error message, fallback to text (decoded only then)
+    try:
+        err = _loads(resp.content)
+    except ValueError:
+        msg = resp.text
+    else:
+        msg = (err.get("message") or err.get("error") or err) if isinstance(err, dict) else err
+    raise ProtocolError(f"{resp.status_code} Server Error: {msg}")
+
+
+# A capability probe (allow_missing=True) reads these as "the node has no such
+# route" (404/405) or "no such body encoding" (415); the caller falls back.
+_PROBE_MISSING = (404, 405, 415)
+
+def _checked_response(resp: Any, allow_missing: bool) -> Any:
+    """*resp*, or ``None`` for a probe the node doesn't support; raises on errors.
+
+    Shared by the sync and async clients so both read statuses the same way.
+    """
+    if allow_missing and resp.status_code in _PROBE_MISSING:
+        return None
+    ok = resp.is_success if isinstance(resp, httpx.Response) else resp.ok
+    if not ok:
+        _raise_protocol_error(resp)
+    return resp
+
+def _q16_params(attach_to_document_node: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Query string of /v1/memory/upsert_vector_q16."""
+    if attach_to_document_node is None:
+        return None
+    return {"attach_to_document_node": attach_to_document_node}
+
+def _make_poster(
+    client: "ProtocolRemoteClient",
+    url: str,
+    required: Tuple[str, ...],
+) -> Callable[[Union[Dict[str, Any], bytes]], Dict[str, Any]]:
+    """POST-and-decode for one hot route, with its URL, auth and response shape bound.
+
+    Equivalent to ``_post_raw`` + ``_decode_response`` minus the per-call URL
+    handling and argument marshalling. ``client.session.post`` is still looked
+    up per call so a swapped or patched session is honoured.
+    """
+    auth = client._auth
+
+    def post(payload: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        body = payload if isinstance(payload, bytes) else _dumps(payload)
+        resp = client.session.post(url, data=body, headers=_JSON_HEADERS, auth=auth, timeout=10)
+        _checked_response(resp, allow_missing=False)
+        return _decode_response(resp.content, required)
+
+    return post
+
+
+class _NonReplayingRetry(Retry):
+    """urllib3 Retry that only replays a POST the node is known not to have applied.
+
+    The memory endpoints carry no idempotency key, so a 502/504 after the
+    request reached the node could duplicate an upsert. A 503 ("no leader")
+    and connect failures are rejected before anything is applied; GETs are
+    always safe to repeat.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST" and status_code != 503:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
 
-# H-2: custom auth class that redacts itself in __repr__/__str__ so bearer tokens
-# do not appear in tracebacks, Sentry reports, or Python logging output.
 class ProtocolRemoteClient:
-    def __init__(self, base_url: str, embed_fn, expected_dim: int, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        embed_fn,
+        expected_dim: int,
+        api_key: Optional[str] = None,
+        max_parallel: int = 8,
+    ):
         self.base_url = base_url.rstrip("/")
+        self._urls = _Endpoints(self.base_url)
         self.session = requests.Session()
+        # upsert_text fans chunk upserts out over max_parallel threads; size the
+        # connection pool so they don't queue for a socket. Transient 5xx and
+        # connect failures are retried with backoff instead of raised.
+        self.max_parallel = max(1, max_parallel)
+        pool_size = max(_POOL_MAXSIZE, self.max_parallel)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=_NonReplayingRetry(
+                total=3,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+                # Hand the last response back so _post_raw reports the status.
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Threads are only spawned on first submit.
+        self._pool = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="valoricore-upsert")
         # H-2: use per-request auth (via __call__) rather than session-level default
         # headers, so the token is not captured in session.__repr__ or tracebacks.
+        # _BearerAuth also redacts itself in __repr__/__str__.
         self._auth = _BearerAuth(api_key) if api_key else None
         self._embed = embed_fn
         # M-1: 0 means "skip client-side dim check; let the server enforce it".
         self.expected_dim = expected_dim
+        # Background metadata flush (see set_metadata). The worker thread is
+        # started on the first queued write; errors it hits surface on flush().
+        self._meta_q: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+        self._meta_thread: Optional[threading.Thread] = None
+        self._meta_lock = threading.Lock()
+        self._meta_error: Optional[BaseException] = None
+        self._meta_batch_supported = True
+        # Flipped off the first time the node answers /v1/memory/upsert_vectors
+        # with 404/405; upsert_vectors_bulk then falls back to per-vector upserts.
+        self.supports_bulk = True
+        # Same for /v1/memory/upsert_vector_q16 (also 415); upsert_vector_q16
+        # then sends JSON.
+        self.supports_q16 = True
+        # Specialised posters for the per-vector hot paths.
+        self._post_upsert_vector = _make_poster(self, self._urls.upsert_vector, _UPSERT_VECTOR_KEYS)
+        self._post_search_vector = _make_poster(self, self._urls.search_vector, ("results",))
 
-    def _post(self, path: str, json_data: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
-        # Robust URL construction
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        resp = self.session.post(url, json=json_data, auth=self._auth, timeout=timeout)
-        
-        if not resp.ok:
-            # Handle Auth Errors specifically
-            if resp.status_code in (401, 403):
-                 raise AuthenticationError(f"Authentication failed ({resp.status_code}): {resp.reason}")
+    def _post_raw(
+        self,
+        path: str,
+        json_data: Union[Dict[str, Any], bytes],
+        timeout: int = 10,
+        *,
+        allow_missing: bool = False,
+        headers: Dict[str, str] = _JSON_HEADERS,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[requests.Response]:
+        # Built-in routes pass a prebuilt URL from self._urls; paths still work.
+        url = path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+        # bytes are an already-encoded body (see _search_body/_upsert_body).
+        body = json_data if isinstance(json_data, bytes) else _dumps(json_data)
+        resp = self.session.post(
+            url, data=body, headers=headers, params=params, auth=self._auth, timeout=timeout
+        )
+        return _checked_response(resp, allow_missing)
 
-            # Try to parse JSON error message, fallback to text
-            try:
-                err = resp.json()
-                msg = err.get("message") or err.get("error") or err
-            except (ValueError, json.JSONDecodeError):
-                msg = resp.text
-            raise ProtocolError(f"{resp.status_code} Server Error: {msg}")
-            
+    def _post(self, path: str, json_data: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
+        resp = self._post_raw(path, json_data, timeout=timeout)
         try:
-            return resp.json()
-        except (ValueError, json.JSONDecodeError):
+            return _loads(resp.content)
+        except ValueError:
              raise ProtocolError("Server returned non-JSON response")
 
-    def snapshot(self) -> bytes:
-        url = f"{self.base_url}/v1/snapshot/download"
+    def snapshot(self, out: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """
+        Download the node's snapshot.
+
+        Args:
+            out: Writable binary file. When given, the snapshot is streamed
+                 into it in 1 MiB chunks and ``None`` is returned; otherwise
+                 the whole blob is returned as ``bytes``.
+        """
+        self.flush()
+        url = self._urls.snapshot_download
         # M-3: snapshots can be hundreds of MB — use a longer timeout.
-        resp = self.session.get(url, auth=self._auth, timeout=120)
-        resp.raise_for_status()
-        return resp.content
+        with self.session.get(
+            url, auth=self._auth, headers=_SNAPSHOT_ACCEPT, timeout=120, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            return _read_snapshot(resp, out)
 
-    def restore(self, data: bytes) -> None:
-        url = f"{self.base_url}/v1/snapshot/upload"
-        headers = {"Content-Type": "application/octet-stream"}
+    def restore(self, data: SnapshotSource, compress: bool = False) -> None:
+        """
+        Upload a snapshot.
+
+        Args:
+            data: ``bytes``, a binary file opened for reading, or an iterable
+                  of ``bytes`` chunks. Files and iterables are streamed by
+                  requests rather than read into memory first.
+            compress: Send the upload zstd-compressed (needs ``zstandard``).
+                  Nodes that reject it get it uncompressed.
+        """
+        url = self._urls.snapshot_upload
         # M-3: uploads can be large — use a longer timeout.
-        resp = self.session.post(url, data=data, headers=headers, auth=self._auth, timeout=120)
+        resp = _post_snapshot(self.session.post, url, data, compress, auth=self._auth, timeout=120)
         resp.raise_for_status()
 
-    def upsert_vector(self, vector: List[float], attach_to_document_node: Optional[int]=None, **kwargs):
+    def upsert_vector(
+        self,
+        vector: List[float],
+        attach_to_document_node: Optional[int] = None,
+        **kwargs,
+    ):
+        self._assert_dim(vector)
+        # Validate Input Range; the float32 array goes straight into the body.
+        arr = _validate_vector(vector)
+        return self._upsert_checked(arr, attach_to_document_node, kwargs)
+
+    def _assert_dim(self, vector: Any) -> None:
         # M-1: only check dim client-side when explicitly configured (non-zero).
         # When expected_dim=0 the server enforces the dimension at insert time.
-        if self.expected_dim > 0 and len(vector) != self.expected_dim:
+        if self.expected_dim and len(vector) != self.expected_dim:
             raise ValueError(f"Embedding must be {self.expected_dim}-dimensional")
-            
-        # Validate Input Range
-        _validate_vector(vector)
-        
-        payload = {"vector": vector}
-        if attach_to_document_node is not None:
-            payload["attach_to_document_node"] = attach_to_document_node
-        # kwargs (tags/metadata) ignored for now per logic or can be added to payload
-        if "tags" in kwargs: payload["tags"] = kwargs["tags"]
-        if "metadata" in kwargs: payload["metadata"] = kwargs["metadata"]
-        
-        res = self._post("/v1/memory/upsert_vector", payload)
+
+    def _upsert_checked(
+        self, arr: np.ndarray, attach_to_document_node: Optional[int], kwargs: Dict[str, Any]
+    ):
+        """POST one already dim- and range-checked vector to /v1/memory/upsert_vector."""
+        if attach_to_document_node is None and kwargs.get("tags") is None and kwargs.get("metadata") is None:
+            # Common case: a bare vector (null tags/metadata read as absent on
+            # the node), sent as a pre-spliced body.
+            payload: Union[Dict[str, Any], bytes] = _upsert_body(arr)
+        else:
+            payload = {"vector": arr}
+            if attach_to_document_node is not None:
+                payload["attach_to_document_node"] = attach_to_document_node
+            # kwargs (tags/metadata) ignored for now per logic or can be added to payload
+            if "tags" in kwargs: payload["tags"] = kwargs["tags"]
+            if "metadata" in kwargs: payload["metadata"] = kwargs["metadata"]
         
         # L-2: do NOT fabricate a local proof when the server doesn't return one.
         # A client-side proof hash was never committed to the audit chain and
         # would give users false assurance that the data is auditable.
-        # If the server omits proof_hash it means the node predates the proof
-        # endpoint — treat proof_hash as optional rather than manufacturing it.
-        _ensure_keys(res, ("memory_id", "record_id", "document_node_id", "chunk_node_id"))
-        return res
+        # If the server omits proof_hash it means the node predates it —
+        # treat proof_hash as optional rather than manufacturing it.
+        return self._post_upsert_vector(payload)
 
-    def search_vector(self, vector: List[float], k: int = 5):
-        # M-1: only check dim client-side when explicitly configured.
-        if self.expected_dim > 0 and len(vector) != self.expected_dim:
-            raise ValueError(f"Embedding must be {self.expected_dim}-dimensional")
-            
-        # Validate Input Range
-        _validate_vector(vector)
-            
-        payload = {"query_vector": vector, "k": k}
-        res = self._post("/v1/memory/search_vector", payload)
+    def upsert_vector_q16(self, vector: List[float], attach_to_document_node: Optional[int] = None):
+        """
+        Upsert a vector pre-quantised to Q16.16 and sent as raw ``i32`` bytes.
+
+        The body is 4 bytes per dimension instead of ~10 characters of JSON per
+        float, and the node skips float parsing. The stored record is identical
+        to :meth:`upsert_vector`'s. Nodes without the route get the JSON upsert.
+        """
+        self._assert_dim(vector)
+        arr = _validate_vector(vector)
+
+        if self.supports_q16:
+            resp = self._post_raw(
+                self._urls.upsert_vector_q16,
+                _q16_bytes(arr),
+                allow_missing=True,
+                headers=_OCTET_HEADERS,
+                params=_q16_params(attach_to_document_node),
+            )
+            if resp is not None:
+                return _decode_response(resp.content, _UPSERT_VECTOR_KEYS)
+            self.supports_q16 = False
+        return self._upsert_checked(arr, attach_to_document_node, {})
+
+    def search_vector(self, vector: List[float], k: int = 5, *, binary: bool = False):
+        """Search for the *k* nearest records.
+
+        With ``binary=True`` the node is asked for the compact binary hit
+        encoding (8 bytes per hit instead of a JSON object); hits then carry
+        ``metadata=None``. Nodes that only speak JSON are handled transparently.
+        """
+        self._assert_dim(vector)
+        # Validate Input Range; the float32 array goes straight into the body.
+        return self._search_checked(_validate_vector(vector), k, binary)
+
+    def _search_checked(self, arr: np.ndarray, k: int, binary: bool):
+        """POST one already dim- and range-checked query to /v1/memory/search_vector."""
+        if binary:
+            resp = self._post_raw(self._urls.search_vector, _search_body(arr, k), headers=_BINARY_HITS_HEADERS)
+            if resp.headers.get("Content-Type", "").startswith(_BINARY_HITS_MEDIA_TYPE):
+                return _decode_binary_hits(resp.content)
+            res = _decode_response(resp.content, ("results",))
+        else:
+            res = self._post_search_vector(_search_body(arr, k))
         
-        if "results" not in res or not isinstance(res["results"], list):
+        if not isinstance(res["results"], list):
             raise ProtocolError("invalid search response shape")
             
         return res
     
-    def set_metadata(self, target_id: str, metadata: Dict[str, Any]):
-        """Set metadata for a memory_id, record_id, or node_id."""
-        url = f"{self.base_url}/v1/memory/meta/set"
+    def set_metadata(self, target_id: str, metadata: Dict[str, Any], *, sync: bool = True):
+        """
+        Set metadata for a memory_id, record_id, or node_id.
+
+        With ``sync=False`` the write is queued and sent by a background
+        thread, which coalesces queued writes into ``/v1/memory/meta/set_batch``
+        calls. Errors then surface on :meth:`flush` (or :meth:`close`);
+        pending writes are also flushed at interpreter exit.
+
+        Args:
+            target_id: ``"rec:<id>"``, ``"node:<id>"`` or a memory_id.
+            metadata:  JSON-serialisable mapping.
+            sync:      POST immediately and wait for the server's ack (default).
+        """
+        if sync:
+            self._set_metadata_now(target_id, metadata)
+            return
+        self._meta_q.put((target_id, metadata))
+        if self._meta_thread is None:
+            with self._meta_lock:
+                if self._meta_thread is None:
+                    self._meta_thread = threading.Thread(
+                        target=self._flush_meta_loop, name="valoricore-meta-flush", daemon=True
+                    )
+                    self._meta_thread.start()
+                    _META_WRITERS.add(self)
+
+    def flush(self) -> None:
+        """Block until every queued metadata write has been sent.
+
+        Raises the first error the background writer hit since the last flush.
+        """
+        self._meta_q.join()
+        err, self._meta_error = self._meta_error, None
+        if err is not None:
+            raise err
+
+    def close(self) -> None:
+        """Send queued metadata writes, then release the upsert pool and session.
+
+        Raises like :meth:`flush` if a queued write failed; the pool and
+        session are released either way.
+        """
+        try:
+            self.flush()
+        finally:
+            _META_WRITERS.discard(self)
+            self._pool.shutdown()
+            self.session.close()
+
+    def __enter__(self) -> "ProtocolRemoteClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _set_metadata_now(self, target_id: str, metadata: Dict[str, Any]) -> None:
+        url = self._urls.meta_set
         payload = {"target_id": target_id, "metadata": metadata}
         resp = self.session.post(url, json=payload, auth=self._auth, timeout=5)
         resp.raise_for_status()
 
+    def _flush_meta_loop(self) -> None:
+        while True:
+            batch = [self._meta_q.get()]
+            deadline = time.monotonic() + _META_BATCH_WINDOW_SECS
+            while len(batch) < _META_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._meta_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._send_meta_batch(batch)
+            except Exception as e:
+                if self._meta_error is None:
+                    self._meta_error = e
+            finally:
+                for _ in batch:
+                    self._meta_q.task_done()
+
+    def _send_meta_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        if self._meta_batch_supported:
+            url = self._urls.meta_set_batch
+            items = [{"target_id": t, "metadata": m} for t, m in batch]
+            resp = self.session.post(url, json={"items": items}, auth=self._auth, timeout=5)
+            if resp.status_code not in (404, 405):
+                resp.raise_for_status()
+                return
+            # Node predates set_batch — use per-item meta/set from now on.
+            self._meta_batch_supported = False
+        for target_id, metadata in batch:
+            self._set_metadata_now(target_id, metadata)
+
     def get_metadata(self, target_id: str) -> Optional[Dict[str, Any]]:
-        """Get metadata for a target_id."""
-        url = f"{self.base_url}/v1/memory/meta/get"
+        """Get metadata for a target_id. Pending queued writes are flushed first."""
+        self.flush()
+        url = self._urls.meta_get
         resp = self.session.get(url, params={"target_id": target_id}, auth=self._auth, timeout=5)
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         return data.get("metadata")
 
     def upsert_text(self, text: str, chunk_size: int = 512, vector: Optional[List[float]] = None, **kwargs):
         # chunk locally using existing chunk_text
-        from .ingest import chunk_text
-        
         # Implementation Detail: If vector is provided, we assume 1:1 mapping (no chunking)
         if vector is not None:
             chunks = [text] # Treat as single chunk
+            vectors = [vector]
         else:
             chunks = chunk_text(text, max_chars=chunk_size)
-            
-        record_ids = []
-        chunk_node_ids = []
-        proof_hashes = []
-        # create document node first via 1st upsert (server will create doc node id)
-        doc_node_id = None
-        
+            if chunks and not self.supports_bulk and _batch_fn(self._embed) is None:
+                res = self._upsert_chunks_pipelined(chunks)
+                return self._finish_text_upsert(res, len(chunks), kwargs)
+            # One embed call for the whole document when the embedder can batch.
+            vectors = embed_many(self._embed, chunks)
+
+        if not vectors:
+            return _text_upsert_result(None, 0)
+
+        res = self.upsert_vectors_bulk(vectors)
+        return self._finish_text_upsert(res, len(chunks), kwargs)
+
+    def _finish_text_upsert(self, res: Dict[str, Any], chunk_count: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         # Extract metadata from kwargs to set on the DOCUMENT node
         doc_metadata = kwargs.get("metadata", None)
-        
-        for i, chunk in enumerate(chunks):
-            if vector is not None:
-                # Use provided vector for the first (and only) chunk
-                if i > 0: 
-                     # Should not happen if chunks=[text], but safety check
-                     raise ValueError("Cannot provide single vector for multi-chunk text.")
-                vec = vector
-            else:
-                vec = self._embed(chunk)
-                
-            if len(vec) != self.expected_dim:
-                raise ValueError("Embedding mismatch")
-            
-            # upsert_vector validation happens inside call
-            res = self.upsert_vector(vec, attach_to_document_node=doc_node_id)
-            
-            # server returns document_node_id for the created/used doc
-            # capture it from the first chunk response
+        if doc_metadata:
+            # Convention: "node:100", "rec:10".
+            self.set_metadata(f"node:{res['document_node_id']}", doc_metadata)
+
+        return _text_upsert_result(res, chunk_count)
+
+    def _upsert_chunks_pipelined(self, chunks: List[str]) -> Dict[str, Any]:
+        """Embed and upsert one chunk at a time, overlapping the two stages.
+
+        Used when neither the embedder nor the node can batch: chunk i+1 is
+        embedded on this thread while chunk i's upsert is in flight on the
+        pool, instead of embedding the whole document before the first POST.
+        """
+        first = self._pool.submit(self.upsert_vector, self._embed(chunks[0]))
+        doc_node_id = None
+        futures = []
+        for chunk in chunks[1:]:
+            vec = self._embed(chunk)
             if doc_node_id is None:
-                doc_node_id = res["document_node_id"]
-                # Set metadata ONCE for the document node if provided
-                if doc_metadata:
-                     # We assume we can target "node:{id}" 
-                     # But Protocol returns integer IDs.
-                     # We need to format it.
-                     # Convention: "node:100", "rec:10".
-                     self.set_metadata(f"node:{doc_node_id}", doc_metadata)
-                     
-            elif res["document_node_id"] != doc_node_id:
-                raise ProtocolError(f"server returned inconsistent document_node_id between chunks. Expected {doc_node_id}, got {res['document_node_id']}")
-                
-            record_ids.append(res["record_id"])
-            chunk_node_ids.append(res["chunk_node_id"])
-            proof_hashes.append(res.get("proof_hash", ""))
-            
-        memory_ids = [f"rec:{rid}" for rid in record_ids]
-        return {
-            "memory_ids": memory_ids,
-            "record_ids": record_ids,
-            "document_node_id": doc_node_id,
-            "chunk_node_ids": chunk_node_ids,
-            "proof_hashes": proof_hashes,
-            "chunk_count": len(chunks),
-        }
+                # Later chunks attach to the document node the first one created.
+                doc_node_id = first.result()["document_node_id"]
+            futures.append(self._pool.submit(self.upsert_vector, vec, attach_to_document_node=doc_node_id))
+        results = [first.result()] + [f.result() for f in futures]
+        return _merge_chunk_upserts(results, results[0]["document_node_id"])
+
+    def upsert_vectors_bulk(
+        self,
+        vectors: List[List[float]],
+        attach_to_document_node: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upsert one document's chunk vectors in a single POST.
+
+        The first vector creates the document node (unless
+        *attach_to_document_node* is given) and every chunk is linked to it.
+        Nodes without ``/v1/memory/upsert_vectors`` get the same result from
+        concurrent per-vector upserts.
+
+        Returns:
+            ``document_node_id``, ``memory_ids``, ``record_ids``,
+            ``chunk_node_ids`` and ``proof_hashes``, one entry per vector.
+        """
+        if len(vectors) == 0:
+            raise ValueError("vectors must not be empty")
+        arrays = _check_vectors(vectors, self.expected_dim)
+
+        if self.supports_bulk:
+            payload = _bulk_payload(arrays, attach_to_document_node, tags, metadata)
+            resp = self._post_raw(self._urls.upsert_vectors, payload, timeout=30, allow_missing=True)
+            if resp is not None:
+                return _decode_bulk_response(resp.content, len(vectors))
+            self.supports_bulk = False
+
+        return self._upsert_vectors_each(arrays, attach_to_document_node, tags, metadata)
+
+    def _upsert_vectors_each(
+        self,
+        vectors: np.ndarray,
+        attach_to_document_node: Optional[int],
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        extra: Dict[str, Any] = {}
+        if tags is not None:
+            extra["tags"] = tags
+        if metadata is not None:
+            extra["metadata"] = metadata
+
+        # The first upsert creates the document node; the rest attach to it and
+        # are independent, so they run concurrently on the pool.
+        # Rows were checked as one matrix, so they go straight to the POST.
+        first = self._upsert_checked(vectors[0], attach_to_document_node, extra)
+        doc_node_id = first["document_node_id"]
+        futures = [
+            self._pool.submit(self._upsert_checked, vec, doc_node_id, extra)
+            for vec in vectors[1:]
+        ]
+
+        # Results are collected in submission order, so ids line up with chunks.
+        return _merge_chunk_upserts([first] + [f.result() for f in futures], doc_node_id)
+
+async def _aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+def _async_body(body: Any) -> Any:
+    """An upload body httpx.AsyncClient accepts: bytes as is, files and iterables async."""
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return bytes(body)
+    if hasattr(body, "read"):
+        f = body
+        return _aiter_chunks(iter(lambda: f.read(_SNAPSHOT_CHUNK), b""))
+    return _aiter_chunks(body)
+
+
+class _AsyncBearerAuth(httpx.Auth):
+    """httpx counterpart of ``_BearerAuth``: sets the token per request, redacted in repr."""
+
+    def __init__(self, token: str) -> None:
+        self._token = token
+
+    def auth_flow(self, request: httpx.Request) -> Iterator[httpx.Request]:
+        request.headers["Authorization"] = f"Bearer {self._token}"
+        yield request
+
+    def __repr__(self) -> str:
+        return "<BearerAuth [REDACTED]>"
+
+
+class AsyncProtocolRemoteClient:
+    """
+    Non-blocking counterpart of :class:`ProtocolRemoteClient` on ``httpx.AsyncClient``.
+
+    Requests share one connection pool (HTTP/2 when ``h2`` is installed), and
+    nodes without the bulk route get a document's chunk upserts concurrently,
+    at most *max_parallel* in flight.
+
+    *embed_fn* may be sync or async: plain callables, ``BaseEmbedder`` and
+    :class:`~valoricore.embeddings.AsyncEmbedder` all work. A sync embedder
+    runs on the event loop, so wrap slow models in ``AsyncEmbedder``.
+
+    Example::
+
+        async with AsyncProtocolRemoteClient("http://localhost:3000", embed, 384) as client:
+            await client.upsert_text(document)
+            hits = await client.search_text("what is valori?")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        embed_fn,
+        expected_dim: int,
+        api_key: Optional[str] = None,
+        max_parallel: int = 16,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._urls = _Endpoints(self.base_url)
+        self.max_parallel = max(1, max_parallel)
+        pool_size = max(_POOL_MAXSIZE, self.max_parallel)
+        # retries= only replays connect failures, which never reach the node,
+        # so it is as safe for the memory POSTs as _NonReplayingRetry.
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                retries=3,
+            ),
+            timeout=10,
+        )
+        # H-2: per-request auth, as in ProtocolRemoteClient — the token never
+        # sits in the client's default headers.
+        self._auth = _AsyncBearerAuth(api_key) if api_key else None
+        self._embed = embed_fn
+        # M-1: 0 means "skip client-side dim check; let the server enforce it".
+        self.expected_dim = expected_dim
+        # Capability flags, as on ProtocolRemoteClient.
+        self.supports_bulk = True
+        self.supports_q16 = True
+
+    @classmethod
+    def _from_protocol_args(
+        cls,
+        embed: Optional[EmbedFn] = None,
+        remote: Optional[str] = None,
+        api_key: Optional[str] = None,
+        index_kind: str = "bruteforce",
+        quantization: str = "none",
+        expected_dim: int = 0,
+        path: str = "./valori_db",
+        max_parallel: int = 16,
+        cache_embeddings: bool = False,
+        cache_size: int = 1024,
+        embed_batch: Optional[Callable[[List[str]], List[List[float]]]] = None,
+    ) -> "AsyncProtocolRemoteClient":
+        """Build from ``ProtocolClient(..., async_=True)`` arguments."""
+        if not (remote and remote.startswith(("http://", "https://"))):
+            raise ValueError("async_=True needs an http(s) remote; local mode is synchronous")
+        if cache_embeddings:
+            raise ValueError("cache_embeddings is not supported with async_=True")
+        return cls(
+            remote, _embed_fn(embed, embed_batch), expected_dim, api_key=api_key, max_parallel=max_parallel
+        )
+
+    async def __aenter__(self) -> "AsyncProtocolRemoteClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        # Same dispatch as embed_many, awaiting whatever the embedder returns.
+        batch = getattr(self._embed, "embed_batch", None)
+        if batch is None and not getattr(self._embed, "supports_batch", False):
+            vecs = [self._embed(t) for t in texts]
+            if vecs and inspect.isawaitable(vecs[0]):
+                vecs = await asyncio.gather(*vecs)
+            return list(vecs)
+        order, by_length = _by_length(texts)
+        res = batch(by_length) if batch is not None else self._embed(by_length)
+        if inspect.isawaitable(res):
+            res = await res
+        return _unsort(order, list(res))
+
+    async def _post_raw(
+        self,
+        path: str,
+        json_data: Union[Dict[str, Any], bytes],
+        timeout: int = 10,
+        *,
+        allow_missing: bool = False,
+        headers: Dict[str, str] = _JSON_HEADERS,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[httpx.Response]:
+        url = path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+        body = json_data if isinstance(json_data, bytes) else _dumps(json_data)
+        resp = await self.client.post(
+            url, content=body, headers=headers, params=params, auth=self._auth, timeout=timeout
+        )
+        return _checked_response(resp, allow_missing)
+
+    async def _post(self, path: str, json_data: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
+        resp = await self._post_raw(path, json_data, timeout=timeout)
+        try:
+            return _loads(resp.content)
+        except ValueError:
+            raise ProtocolError("Server returned non-JSON response")
+
+    async def snapshot(self, out: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Snapshot bytes, or ``None`` after streaming them into *out* in 1 MiB chunks.
+
+        As with :meth:`ProtocolRemoteClient.snapshot`, the node is asked for a
+        zstd download when ``zstandard`` is installed.
+        """
+        url = self._urls.snapshot_download
+        parts: List[bytes] = []
+        write = parts.append if out is None else out.write
+        # M-3: snapshots can be hundreds of MB — use a longer timeout.
+        async with self.client.stream(
+            "GET", url, headers=_SNAPSHOT_ACCEPT, auth=self._auth, timeout=120
+        ) as resp:
+            resp.raise_for_status()
+            decode = _snapshot_decoder(resp.headers)
+            if decode is None:
+                async for chunk in resp.aiter_bytes(_SNAPSHOT_CHUNK):
+                    write(chunk)
+            else:
+                async for chunk in resp.aiter_raw(_SNAPSHOT_CHUNK):
+                    write(decode(chunk))
+        return b"".join(parts) if out is None else None
+
+    async def restore(self, data: SnapshotSource, compress: bool = False) -> None:
+        """Upload a snapshot; arguments as for :meth:`ProtocolRemoteClient.restore`.
+
+        Files and iterables are read on the event loop as they are sent.
+        """
+        url = self._urls.snapshot_upload
+        for body, headers in _snapshot_attempts(data, compress):
+            # M-3: uploads can be large — use a longer timeout.
+            resp = await self.client.post(
+                url, content=_async_body(body), headers=headers, auth=self._auth, timeout=120
+            )
+            if resp.status_code not in _SNAPSHOT_REJECTED:
+                break
+        resp.raise_for_status()
+
+    async def upsert_vector(
+        self,
+        vector: List[float],
+        attach_to_document_node: Optional[int] = None,
+        **kwargs,
+    ):
+        arr = _check_vectors([vector], self.expected_dim)[0]
+        return await self._upsert_checked(arr, attach_to_document_node, kwargs)
+
+    async def _upsert_checked(
+        self, arr: np.ndarray, attach_to_document_node: Optional[int], kwargs: Dict[str, Any]
+    ):
+        """POST one already dim- and range-checked vector to /v1/memory/upsert_vector."""
+        if attach_to_document_node is None and kwargs.get("tags") is None and kwargs.get("metadata") is None:
+            payload: Union[Dict[str, Any], bytes] = _upsert_body(arr)
+        else:
+            payload = {"vector": arr}
+            if attach_to_document_node is not None:
+                payload["attach_to_document_node"] = attach_to_document_node
+            if "tags" in kwargs: payload["tags"] = kwargs["tags"]
+            if "metadata" in kwargs: payload["metadata"] = kwargs["metadata"]
+
+        resp = await self._post_raw(self._urls.upsert_vector, payload)
+        # L-2: proof_hash stays optional; see ProtocolRemoteClient.upsert_vector.
+        return _decode_response(resp.content, _UPSERT_VECTOR_KEYS)
+
+    async def upsert_vector_q16(self, vector: List[float], attach_to_document_node: Optional[int] = None):
+        """Async :meth:`ProtocolRemoteClient.upsert_vector_q16`."""
+        arr = _check_vectors([vector], self.expected_dim)[0]
+        if self.supports_q16:
+            resp = await self._post_raw(
+                self._urls.upsert_vector_q16,
+                _q16_bytes(arr),
+                allow_missing=True,
+                headers=_OCTET_HEADERS,
+                params=_q16_params(attach_to_document_node),
+            )
+            if resp is not None:
+                return _decode_response(resp.content, _UPSERT_VECTOR_KEYS)
+            self.supports_q16 = False
+        return await self._upsert_checked(arr, attach_to_document_node, {})
+
+    async def search_vector(self, vector: List[float], k: int = 5):
+        arr = _check_vectors([vector], self.expected_dim)[0]
+        return await self._search_checked(arr, k)
+
+    async def _search_checked(self, arr: np.ndarray, k: int):
+        """POST one already dim- and range-checked query to /v1/memory/search_vector."""
+        resp = await self._post_raw(self._urls.search_vector, _search_body(arr, k))
+        res = _decode_response(resp.content, ("results",))
+        if not isinstance(res["results"], list):
+            raise ProtocolError("invalid search response shape")
+        return res
+
+    async def search_text(self, query: str, k: int = 5):
+        vec = (await self._embed_many([query]))[0]
+        return await self.search_vector(vec, k=k)
+
+    async def set_metadata(self, target_id: str, metadata: Dict[str, Any]) -> None:
+        """Set metadata for a memory_id, record_id, or node_id."""
+        url = self._urls.meta_set
+        payload = {"target_id": target_id, "metadata": metadata}
+        resp = await self.client.post(
+            url, content=_dumps(payload), headers=_JSON_HEADERS, auth=self._auth, timeout=5
+        )
+        resp.raise_for_status()
+
+    async def get_metadata(self, target_id: str) -> Optional[Dict[str, Any]]:
+        url = self._urls.meta_get
+        resp = await self.client.get(url, params={"target_id": target_id}, auth=self._auth, timeout=5)
+        resp.raise_for_status()
+        return _loads(resp.content).get("metadata")
+
+    async def upsert_text(self, text: str, chunk_size: int = 512, vector: Optional[List[float]] = None, **kwargs):
+        if vector is not None:
+            chunks = [text]
+            vectors = [vector]
+        else:
+            chunks = chunk_text(text, max_chars=chunk_size)
+            vectors = await self._embed_many(chunks)
+
+        if not vectors:
+            return _text_upsert_result(None, 0)
+
+        res = await self.upsert_vectors_bulk(vectors)
+
+        doc_metadata = kwargs.get("metadata", None)
+        if doc_metadata:
+            await self.set_metadata(f"node:{res['document_node_id']}", doc_metadata)
+
+        return _text_upsert_result(res, len(chunks))
+
+    async def upsert_vectors_bulk(
+        self,
+        vectors: List[List[float]],
+        attach_to_document_node: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Async :meth:`ProtocolRemoteClient.upsert_vectors_bulk`."""
+        if len(vectors) == 0:
+            raise ValueError("vectors must not be empty")
+        arrays = _check_vectors(vectors, self.expected_dim)
+
+        if self.supports_bulk:
+            payload = _bulk_payload(arrays, attach_to_document_node, tags, metadata)
+            resp = await self._post_raw(self._urls.upsert_vectors, payload, timeout=30, allow_missing=True)
+            if resp is not None:
+                return _decode_bulk_response(resp.content, len(vectors))
+            self.supports_bulk = False
+
+        extra: Dict[str, Any] = {}
+        if tags is not None:
+            extra["tags"] = tags
+        if metadata is not None:
+            extra["metadata"] = metadata
+
+        # The first upsert creates the document node; the rest attach to it.
+        first = await self._upsert_checked(arrays[0], attach_to_document_node, extra)
+        doc_node_id = first["document_node_id"]
+        sem = asyncio.Semaphore(self.max_parallel)
+
+        async def _upsert_under(vec: np.ndarray) -> Dict[str, Any]:
+            async with sem:
+                return await self._upsert_checked(vec, doc_node_id, extra)
+
+        # gather preserves argument order, so ids line up with chunks.
+        rest = await asyncio.gather(*(_upsert_under(vec) for vec in arrays[1:]))
+        return _merge_chunk_upserts([first, *rest], doc_node_id)
 
 class ProtocolClient:
     """
@@ -246,26 +1259,61 @@ class ProtocolClient:
 
     - If remote is None, uses local FFI kernel.
     - If remote is a URL, uses HTTP-backed node.
-    - Uses a user-provided embed() function for text operations.
+    - Uses a user-provided embed() function for text operations. upsert_text
+      embeds all chunks in one call when the embedder batches (see
+      ``valoricore.embeddings.embed_many``), or when ``embed_batch`` — a
+      list-in, list-out callable — is passed instead of (or alongside) embed.
+    - ``async_=True`` returns an :class:`AsyncProtocolRemoteClient` for the
+      same remote instead (``max_parallel`` defaults to 16 there).
+    - ``aupsert_text`` / ``asearch_text`` / ``asearch_vector`` are coroutine
+      versions of the text and search calls on an ordinary client.
     """
 
+    _async_impl: Optional["AsyncProtocolRemoteClient"] = None
+    _async_args: Optional[Tuple[Any, ...]] = None
+    _local_lock: Optional[threading.Lock] = None
+
+    def __new__(cls, *args: Any, async_: bool = False, **kwargs: Any):
+        if async_:
+            return AsyncProtocolRemoteClient._from_protocol_args(*args, **kwargs)
+        return super().__new__(cls)
+
     def __init__(
         self,
-        embed: EmbedFn,
+        embed: Optional[EmbedFn] = None,
         remote: Optional[str] = None,
         api_key: Optional[str] = None,
         index_kind: str = "bruteforce",
         quantization: str = "none",
         expected_dim: int = 0,
         path: str = "./valori_db",
+        max_parallel: int = 8,
+        cache_embeddings: bool = False,
+        cache_size: int = 1024,
+        async_: bool = False,
+        embed_batch: Optional[Callable[[List[str]], List[List[float]]]] = None,
     ) -> None:
+        embed = _embed_fn(embed, embed_batch)
+        # Optional LRU in front of embed(), shared by upsert_text and search_text
+        # so repeated queries and re-ingested chunks skip the embedder.
+        self._embed_cache = _CachedEmbed(embed, cache_size) if cache_embeddings else None
+        if self._embed_cache is not None:
+            embed = self._embed_cache
         self._embed = embed
 
         if remote and (remote.startswith("http://") or remote.startswith("https://")):
             # M-1: pass expected_dim=0 by default so the server enforces dimension,
             # not the SDK. Callers that want client-side validation can pass expected_dim
             # explicitly (e.g. expected_dim=384 for MiniLM, 1536 for OpenAI).
-            self._impl = ProtocolRemoteClient(remote, embed, expected_dim, api_key=api_key)
+            self._impl = ProtocolRemoteClient(
+                remote, embed, expected_dim, api_key=api_key, max_parallel=max_parallel
+            )
+            # Coroutine twin behind aupsert_text/asearch_*, built on first use.
+            self._async_args = (remote, embed, expected_dim, api_key, max_parallel)
+            # The backend is fixed for the client's lifetime, so the hot
+            # per-vector calls pick their path once here, not on every call.
+            self._upsert_vector_impl = self._upsert_vector_remote
+            self._search_vector_impl = self._search_vector_remote
         else:
             # Use Local/FFI Memory Client
             self._impl = None
@@ -279,34 +1327,93 @@ class ProtocolClient:
                 index_kind=index_kind,
                 quantization=quantization,
             )
+            # The a* methods run local calls in worker threads, one at a time.
+            self._local_lock = threading.Lock()
+            self._upsert_vector_impl = self._upsert_vector_local
+            self._search_vector_impl = self._search_vector_local
+            self._db_search = self._memory._db.search
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Embedding-cache hit/miss stats, or None when ``cache_embeddings`` is off."""
+        if self._embed_cache is None:
+            return None
+        return self._embed_cache.cache_info()
+
+    def invalidate_cache(self) -> None:
+        """Forget cached embeddings, e.g. after swapping the embedding model.
+
+        No-op when ``cache_embeddings`` is off.
+        """
+        if self._embed_cache is not None:
+            self._embed_cache.cache_clear()
 
     # Helpers to construct canonical memory ids
     @staticmethod
     def _memory_id_from_record_id(record_id: int) -> str:
-        return f"rec:{record_id}"
+        return _format_memory_id(record_id)
     
-    def snapshot(self) -> bytes:
+    def snapshot(self, out: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Snapshot bytes, or ``None`` after writing them to *out* when given."""
         if self._impl:
-            return self._impl.snapshot()
-        return self._memory._db.snapshot()
+            return self._impl.snapshot(out)
+        blob = self._memory._db.snapshot()
+        if out is None:
+            return blob
+        out.write(blob)
+        return None
+
+    def restore(self, data: SnapshotSource, compress: bool = False) -> None:
+        """Restore from ``bytes``, a readable binary file, or an iterable of chunks.
 
-    def restore(self, data: bytes) -> None:
+        ``compress`` zstd-compresses a remote upload; it has no effect locally.
+        """
         if self._impl:
-            return self._impl.restore(data)
-        self._memory._db.restore(data)
+            return self._impl.restore(data, compress=compress)
+        # The kernel restores from one buffer, so local mode reads the stream fully.
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = data.read() if hasattr(data, "read") else b"".join(data)
+        self._memory._db.restore(bytes(data))
 
-    def set_metadata(self, target_id: str, metadata: Dict[str, Any]):
+    @staticmethod
+    def _local_record_id(target_id: str) -> int:
+        # The local kernel keeps metadata per record only; node targets need a node.
+        if not target_id.startswith(_REC_PREFIX):
+            raise NotImplementedError("Local Mode (FFI) only stores metadata on records (rec:<id>)")
+        try:
+            return int(target_id[len(_REC_PREFIX):])
+        except ValueError:
+            raise ValidationError(f"Invalid memory_id: {target_id!r}")
+
+    def set_metadata(self, target_id: str, metadata: Dict[str, Any], *, sync: bool = True):
         if self._impl:
-            self._impl.set_metadata(target_id, metadata)
+            self._impl.set_metadata(target_id, metadata, sync=sync)
         else:
-            # Fallback to local if supported, or raise
-            raise NotImplementedError("Metadata not yet supported in Local Mode (FFI)")
+            # Local writes are immediate; ``sync`` only matters remotely.
+            self._memory.set_metadata(self._local_record_id(target_id), metadata)
 
     def get_metadata(self, target_id: str) -> Optional[Dict[str, Any]]:
         if self._impl:
             return self._impl.get_metadata(target_id)
-        else:
-            raise NotImplementedError("Metadata not yet supported in Local Mode (FFI)")
+        return self._memory.get_metadata(self._local_record_id(target_id))
+
+    def flush(self) -> None:
+        """Wait for queued remote metadata writes. No-op in local mode."""
+        if self._impl:
+            self._impl.flush()
+
+    def close(self) -> None:
+        """Flush and release the remote client's pool and session. No-op in local mode.
+
+        The coroutine API's connections are released by :meth:`aclose`.
+        """
+        if self._impl:
+            self._impl.close()
+
+    def __enter__(self) -> "ProtocolClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
     def upsert_text(
@@ -334,7 +1441,7 @@ class ProtocolClient:
         """
         Text-first API:
         - chunk text
-        - embed each chunk
+        - embed the chunks (one call when the embedder batches)
         - insert into Valoricore
         - create document + chunk nodes
         - link document -> chunk
@@ -342,15 +1449,21 @@ class ProtocolClient:
         # For v0 we ignore doc_id/actor_id/tags/metadata at kernel level,
         # but they are kept here for future host-layer storage.
 
-        res = self._memory.add_document(
-            text=text,
-            embed=self._embed,
+        if vector is not None:
+            chunks = [text]
+            vectors = [vector]
+        else:
+            chunks = chunk_text(text, max_chars=chunk_size)
+            vectors = embed_many(self._embed, chunks)
+
+        res = self._memory.add_document_with_vectors(
+            chunks=chunks,
+            vectors=vectors,
             title=doc_id, # Mapping doc_id to title for now as per MemoryClient api
-            chunk_size=chunk_size,
         )
 
         record_ids = res["record_ids"]
-        memory_ids = [self._memory_id_from_record_id(rid) for rid in record_ids]
+        memory_ids = _memory_ids(record_ids)
 
         return {
             "memory_ids": memory_ids,
@@ -375,25 +1488,81 @@ class ProtocolClient:
         - Optionally attach to an existing document node.
         - Creates a CHUNK node pointing to the record.
         """
-        # Validation
-        _validate_vector(vector)
+        # Validation — once here; the remote client reuses the checked array.
+        return self._upsert_vector_impl(
+            _validate_vector(vector), attach_to_document_node, tags, metadata
+        )
 
+    def upsert_vectors(
+        self,
+        vectors: Union[List[List[float]], np.ndarray],
+        *,
+        attach_to_document_node: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Vector-first batch API: upsert *vectors* as the chunks of one document.
+
+        The batch is checked once as a float32 ``(N, D)`` matrix instead of
+        vector by vector. Remote clients send it in one request (see
+        :meth:`ProtocolRemoteClient.upsert_vectors_bulk`); local mode inserts
+        it with one batched kernel call.
+
+        As on the node, *metadata* is stored on every record of the batch.
+        *tags* are not supported in local mode.
+        """
         if self._impl:
-            return self._impl.upsert_vector(
-                vector=vector,
-                attach_to_document_node=attach_to_document_node,
-                tags=tags,
-                metadata=metadata
-            )
+            return self._impl.upsert_vectors_bulk(vectors, attach_to_document_node, tags, metadata)
 
-        # Call MemoryClient helper
-        res = self._memory.upsert_vector(vector, attach_to_document_node)
+        if tags is not None:
+            raise NotImplementedError("Tags not yet supported in Local Mode (FFI)")
+        if len(vectors) == 0:
+            raise ValueError("vectors must not be empty")
+        m = _validate_matrix(vectors)
+        # add_document_with_vectors only counts the chunks; there is no text here.
+        res = self._memory.add_document_with_vectors(
+            chunks=[""] * len(m),
+            vectors=m,
+            parent_document_node=attach_to_document_node,
+        )
+        if metadata is not None:
+            for record_id in res["record_ids"]:
+                self._memory.set_metadata(record_id, metadata)
+        return {
+            "document_node_id": res["document_node_id"],
+            "memory_ids": _memory_ids(res["record_ids"]),
+            "record_ids": res["record_ids"],
+            "chunk_node_ids": res["chunk_node_ids"],
+            "proof_hashes": res["proof_hashes"],
+        }
+
+    def _upsert_vector_remote(
+        self,
+        arr: np.ndarray,
+        attach_to_document_node: Optional[int],
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]],
+    ) -> MemoryUpsertVectorResponse:
+        self._impl._assert_dim(arr)
+        return self._impl._upsert_checked(
+            arr, attach_to_document_node, {"tags": tags, "metadata": metadata}
+        )
+
+    def _upsert_vector_local(
+        self,
+        arr: np.ndarray,
+        attach_to_document_node: Optional[int],
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]],
+    ) -> MemoryUpsertVectorResponse:
+        # Call MemoryClient helper; the kernel takes the float32 array as one buffer.
+        res = self._memory.upsert_vector(arr, attach_to_document_node)
         
         record_id = res["record_id"]
-        memory_id = self._memory_id_from_record_id(record_id)
 
         return {
-            "memory_id": memory_id,
+            "memory_id": _REC_PREFIX + str(record_id),
             "record_id": record_id,
             "document_node_id": res["document_node_id"],
             "chunk_node_id": res["chunk_node_id"],
@@ -405,33 +1574,74 @@ class ProtocolClient:
         vec = self._embed(query)
         return self.search_vector(vec, k=k)
 
-    def search_vector(self, vector: List[float], k: int = 5) -> MemorySearchResponse:
-        # Validation
-        _validate_vector(vector)
+    def search_vector(self, vector: List[float], k: int = 5, *, binary: bool = False) -> MemorySearchResponse:
+        # Validation — once here; the remote client reuses the checked array.
+        return self._search_vector_impl(_validate_vector(vector), k, binary)
+
+    def _search_vector_remote(self, arr: np.ndarray, k: int, binary: bool) -> MemorySearchResponse:
+        self._impl._assert_dim(arr)
+        return self._impl._search_checked(arr, k, binary)
+
+    def _search_vector_local(self, arr: np.ndarray, k: int, binary: bool) -> MemorySearchResponse:
+        # Local Mode — dimension is validated by the kernel on insert.
+        # semantic_search in MemoryClient expects text and an embedder, so
+        # pre-computed vectors go straight to _db.search (bound at __init__).
+        hits = self._db_search(arr, k=k)
+
+        # Every ValoriClient backend returns {"id", "score"} dicts.
+        return {
+            "results": [
+                {"memory_id": _REC_PREFIX + str(h["id"]), "record_id": h["id"], "score": h["score"], "metadata": None}
+                for h in hits
+            ]
+        }
+
+    # ── Coroutine API ─────────────────────────────────────────────────────────
+
+    def _async_remote(self) -> "AsyncProtocolRemoteClient":
+        if self._async_impl is None:
+            remote, embed, expected_dim, api_key, max_parallel = self._async_args
+            self._async_impl = AsyncProtocolRemoteClient(
+                remote, embed, expected_dim, api_key=api_key, max_parallel=max_parallel
+            )
+        return self._async_impl
 
+    async def _in_thread(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        def locked() -> Any:
+            with self._local_lock:
+                return fn(*args, **kwargs)
+        return await asyncio.to_thread(locked)
+
+    async def aupsert_text(self, text: str, **kwargs: Any) -> MemoryUpsertResponse:
+        """Coroutine version of :meth:`upsert_text`.
+
+        Remote mode uses an :class:`AsyncProtocolRemoteClient`: one bulk
+        request, or chunk upserts fanned out with ``asyncio.gather`` (at most
+        ``max_parallel`` in flight) on nodes without it. Local mode runs
+        :meth:`upsert_text` in a worker thread.
+        """
         if self._impl:
-            return self._impl.search_vector(vector, k=k)
+            return await self._async_remote().upsert_text(text, **kwargs)
+        return await self._in_thread(self.upsert_text, text, **kwargs)
 
-        # Local Mode — dimension is validated by the kernel on insert
-            
-        # semantic_search in MemoryClient expects text and an embedder.
-        # simpler to just call _db.search directly for pre-computed vectors.
-        hits = self._memory._db.search(vector, k=k)
-
-        # Normalization
-        normalized = []
-        for hit in hits:
-            # Handle both dict (remote/client wrapper) and tuple (local FFI)
-            if isinstance(hit, dict):
-                rid = hit["id"]
-                score = hit["score"]
-            else:
-                rid, score = hit
-            
-            normalized.append({
-                "memory_id": self._memory_id_from_record_id(rid),
-                "record_id": rid,
-                "score": score,
-                "metadata": None # Metadata not yet supported in local mode return
-            })
-        return {"results": normalized}
+    async def asearch_vector(self, vector: List[float], k: int = 5) -> MemorySearchResponse:
+        """Coroutine version of :meth:`search_vector`."""
+        if self._impl:
+            # Validation — once here, as in search_vector; the async client
+            # reuses the checked array.
+            arr = _validate_vector(vector)
+            self._impl._assert_dim(arr)
+            return await self._async_remote()._search_checked(arr, k)
+        return await self._in_thread(self.search_vector, vector, k=k)
+
+    async def asearch_text(self, query: str, k: int = 5) -> MemorySearchResponse:
+        """Coroutine version of :meth:`search_text`."""
+        if self._impl:
+            return await self._async_remote().search_text(query, k=k)
+        return await self._in_thread(self.search_text, query, k=k)
+
+    async def aclose(self) -> None:
+        """Close the connection pool behind the coroutine API, if one was opened."""
+        if self._async_impl is not None:
+            await self._async_impl.aclose()
+            self._async_impl = None
@@ -1,11 +1,16 @@
 # Copyright (c) 2025 Varshith Gudur. Licensed under MIT OR Apache-2.0.
+import base64
+import json
+import struct
 import time
 import re
 import warnings
 from collections import deque
-from typing import List, Dict, Optional, Any, Tuple
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Dict, Mapping, Optional, Any, Tuple, Union
 from uuid import uuid4
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 
 from .base import ValoriClient
 from .types import Vector, RecordId, NodeId, Proof
@@ -15,6 +20,36 @@ from .exceptions import (
 )
 
 
+# Optional fast path: orjson encodes vector-heavy bodies several times faster
+# than json.dumps (C float formatting, numpy arrays serialised natively).
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Optional: with zstandard installed, snapshot downloads and uploads are
+# zstd-compressed on the wire (Accept-Encoding / Content-Encoding: zstd).
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None  # type: ignore[assignment]
+
+# Optional: with the h2 package installed the async transport multiplexes
+# concurrent requests over one HTTP/2 connection; httpx needs it for http2=True.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Sockets kept per host. requests' default of 10 makes an 11th thread sharing
+# a client open and discard a fresh connection (and TLS handshake) per call.
+_POOL_MAXSIZE = 64
+# Distinct hosts pooled at once: the seed node plus whichever leader it
+# redirects to as leadership moves.
+_POOL_CONNECTIONS = 16
+
+
 class _Retryable(Exception):
     """Internal marker for a transient cluster condition worth retrying."""
 
@@ -36,6 +71,168 @@ def _base_of(final_url: str, path: str) -> Optional[str]:
     return None
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _json_default(obj: Any) -> Any:
+    # numpy arrays and scalars, without importing numpy here.
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Non-str keys are stringified, as json does.
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a request body; numpy arrays are serialised as JSON arrays.
+
+    Bodies orjson rejects (e.g. ints wider than 64 bits) go through json, so
+    what can be sent does not depend on the ``fast`` extra.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj, default=_json_default).encode()
+
+# orjson.JSONDecodeError subclasses ValueError, like json's.
+_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+# Body of /v1/vectors/insert_bin and /v1/vectors/search_bin: little-endian
+# u32 dim, u32 n, then dim * n float32 (n = vector count, or k for search).
+_FRAME_HEADERS = {"Content-Type": "application/octet-stream"}
+
+def _vector_frame(vectors: Any, n: Optional[int] = None) -> bytes:
+    """Pack a 2-D float array as a binary vector frame; ``n`` overrides the row count."""
+    arr = np.ascontiguousarray(vectors, dtype="<f4")
+    if arr.ndim != 2 or arr.shape[1] == 0:
+        raise ValidationError(f"expected a non-empty 2-D array of vectors, got shape {arr.shape}")
+    rows, dim = arr.shape
+    return struct.pack("<II", dim, rows if n is None else n) + arr.tobytes()
+
+
+# quant= modes for insert/search bodies. The node dequantizes on parse:
+# {"scale": s, "i8": b64(int8[dim])} -> i8 * s, {"f16": b64(<f2[dim])}.
+_QUANT_MODES = (None, "int8", "fp16")
+
+def _check_quant(quant: Optional[str]) -> Optional[str]:
+    if quant not in _QUANT_MODES:
+        raise ValueError(f"quant must be one of {_QUANT_MODES}, got {quant!r}")
+    return quant
+
+def _wire_vector(vector: Any, quant: Optional[str]) -> Any:
+    """A vector as sent in a JSON body: unchanged, or quantized per ``quant``."""
+    if quant is None:
+        return vector
+    arr = np.asarray(vector, dtype=np.float32)
+    if quant == "fp16":
+        return {"f16": base64.b64encode(arr.astype("<f2").tobytes()).decode()}
+    max_abs = float(np.abs(arr).max()) if arr.size else 0.0
+    scale = np.float32(max_abs / 127 if max_abs else 1.0)
+    q = np.clip(np.round(arr / scale), -127, 127).astype(np.int8)
+    return {"scale": float(scale), "i8": base64.b64encode(q.tobytes()).decode()}
+
+def _dequantized(wire: Any) -> Any:
+    """The vector the node stores for a ``_wire_vector`` payload."""
+    if not isinstance(wire, dict):
+        return wire
+    if "f16" in wire:
+        return np.frombuffer(base64.b64decode(wire["f16"]), dtype="<f2").astype(np.float32)
+    q = np.frombuffer(base64.b64decode(wire["i8"]), dtype=np.int8)
+    return q.astype(np.float32) * np.float32(wire["scale"])
+
+
+# Snapshots are streamed this many bytes at a time, so peak memory stays flat
+# regardless of snapshot size.
+_SNAPSHOT_CHUNK = 1 << 20
+
+SnapshotSource = Union[bytes, BinaryIO, Iterable[bytes]]
+
+_SNAPSHOT_ACCEPT = {"Accept-Encoding": "zstd"} if _zstd is not None else {}
+
+def _snapshot_decoder(headers: Mapping[str, str]) -> Optional[Callable[[bytes], bytes]]:
+    """Chunk decoder for a zstd-encoded snapshot download, or ``None`` if it is plain."""
+    if headers.get("Content-Encoding") != "zstd":
+        return None
+    return _zstd.ZstdDecompressor().decompressobj().decompress
+
+def _snapshot_chunks(resp: requests.Response) -> Iterator[bytes]:
+    """Chunks of a ``stream=True`` snapshot download, zstd-decoded if the node compressed it."""
+    decode = _snapshot_decoder(resp.headers)
+    if decode is None:
+        yield from resp.iter_content(chunk_size=_SNAPSHOT_CHUNK)
+        return
+    for chunk in resp.raw.stream(_SNAPSHOT_CHUNK, decode_content=False):
+        yield decode(chunk)
+
+def _read_snapshot(resp: requests.Response, out: Optional[BinaryIO]) -> Optional[bytes]:
+    """The snapshot bytes, or ``None`` after copying them into *out*."""
+    if out is None:
+        return b"".join(_snapshot_chunks(resp))
+    for chunk in _snapshot_chunks(resp):
+        out.write(chunk)
+    return None
+
+def _zstd_chunks(cctx: Any, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    chunker = cctx.chunker(chunk_size=_SNAPSHOT_CHUNK)
+    for chunk in chunks:
+        yield from chunker.compress(chunk)
+    yield from chunker.finish()
+
+def _snapshot_upload(data: SnapshotSource, compress: bool = False) -> Tuple[Any, Dict[str, str]]:
+    """Body and headers for a snapshot upload; files and iterables stay streamed."""
+    if not compress:
+        return data, _FRAME_HEADERS
+    if _zstd is None:
+        raise ImportError("compress=True needs the zstandard package (pip install valoricore[fast])")
+    cctx = _zstd.ZstdCompressor()
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        body: Any = cctx.compress(data)
+    elif hasattr(data, "read"):
+        body = cctx.read_to_iter(data, read_size=_SNAPSHOT_CHUNK)
+    else:
+        body = _zstd_chunks(cctx, data)
+    return body, {**_FRAME_HEADERS, "Content-Encoding": "zstd"}
+
+# Statuses with which a node without request decompression rejects a zstd upload.
+_SNAPSHOT_REJECTED = (400, 415)
+
+def _snapshot_attempts(data: SnapshotSource, compress: bool) -> Iterator[Tuple[Any, Dict[str, str]]]:
+    """``(body, headers)`` to POST in turn for a snapshot upload.
+
+    The caller stops at the first response not in ``_SNAPSHOT_REJECTED``.
+    After a rejected zstd body, bytes and seekable files are offered again
+    uncompressed; an iterable of chunks cannot be replayed, so it is not.
+    """
+    start = data.tell() if compress and hasattr(data, "seek") else None
+    yield _snapshot_upload(data, compress)
+    if not compress:
+        return
+    if start is not None:
+        data.seek(start)  # type: ignore[union-attr]
+    elif not isinstance(data, (bytes, bytearray, memoryview)):
+        return
+    yield data, _FRAME_HEADERS
+
+def _post_snapshot(post: Callable[..., Any], url: str, data: SnapshotSource, compress: bool, **kw: Any) -> Any:
+    """POST a snapshot upload via *post*, returning the response (see ``_snapshot_attempts``)."""
+    for body, headers in _snapshot_attempts(data, compress):
+        resp = post(url, data=body, headers=headers, **kw)
+        if resp.status_code not in _SNAPSHOT_REJECTED:
+            break
+    return resp
+
+
+def _client_proofs(vectors: List[Vector]) -> List[Proof]:
+    """Client-side embedding proofs; empty bytes when the FFI module is absent."""
+    try:
+        import valoricore as _vc
+        return [bytes.fromhex(_vc.generate_proof(_vc.ingest_embedding(v))) for v in vectors]
+    except (ImportError, AttributeError):
+        return [b""] * len(vectors)
+
+
 class _BearerAuth(requests.auth.AuthBase):
     """Per-request auth injector that redacts itself in repr/tracebacks."""
     def __init__(self, token: str) -> None:
@@ -51,6 +248,33 @@ class _BearerAuth(requests.auth.AuthBase):
 
 # ── Transport layer (DIP) ────────────────────────────────────────────────────
 
+class _RpcUrls:
+    """Absolute RPC URLs, built once per path for the node currently targeted.
+
+    The insert/search hot paths hit the same few routes on the same node, so
+    the URL string is looked up instead of re-concatenated per call. The table
+    is rebuilt only when the target moves (leader discovered or lost).
+
+    The base and its table live in one tuple that is read and replaced in a
+    single step, so a thread never pairs a new base with the old table.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self) -> None:
+        self._table: Tuple[Optional[str], Dict[str, str]] = (None, {})
+
+    def url(self, base: str, path: str) -> str:
+        table_base, urls = self._table
+        if base != table_base:
+            urls = {}
+            self._table = (base, urls)
+        url = urls.get(path)
+        if url is None:
+            url = urls[path] = base + path
+        return url
+
+
 class _SyncTransport:
     """Cluster-aware synchronous HTTP transport.
 
@@ -72,8 +296,13 @@ class _SyncTransport:
         self._max_retries = max_retries
         self._retry_backoff = retry_backoff
         self._leader_url: Optional[str] = None
+        self._rpc_urls = _RpcUrls()
         self._session = requests.Session()
         self._session.auth = auth
+        # No adapter-level retries: post_rpc runs its own leader-aware loop.
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     # ── Low-level verbs ───────────────────────────────────────────────────────
 
@@ -104,19 +333,36 @@ class _SyncTransport:
         """POST with leader discovery, idempotency, and retry on transient errors."""
         if idempotency_key is not None:
             json_data = {**json_data, "request_id": list(idempotency_key)}
+        return self._post_body(path, _dumps(json_data), _JSON_HEADERS)
+
+    def post_frame(
+        self, path: str, frame: bytes, params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """post_rpc for a binary vector frame; the response is still JSON."""
+        return self._post_body(path, frame, _FRAME_HEADERS, params)
+
+    def _post_body(
+        self,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
         last_err: Optional[Exception] = None
         for attempt in range(self._max_retries + 1):
-            base = self._leader_url or self.base_url
-            url = base + path
+            url = self._rpc_urls.url(self._leader_url or self.base_url, path)
             try:
-                resp = self._session.post(url, json=json_data, timeout=self._timeout)
+                resp = self._session.post(
+                    url, data=body, headers=headers, params=params, timeout=self._timeout
+                )
                 if resp.status_code == 307:
                     self._leader_url = None
                     raise _Retryable("no leader to redirect to (307 without Location)")
                 if resp.status_code == 503:
                     self._leader_url = None
                     raise _Retryable("node reports no leader (503)")
-                if resp.status_code == 404:
+                if resp.status_code in (404, 405):
+                    # 405: the node has the path but not as a POST route.
                     raise NotFoundError(f"Resource not found: {path}")
                 if resp.status_code in (401, 403):
                     action = "set token=" if resp.status_code == 401 else "check token permissions for"
@@ -134,7 +380,7 @@ class _SyncTransport:
                 _raise_for_status(resp)
                 if resp.history:
                     self._leader_url = _base_of(resp.url, path)
-                return resp.json()
+                return _loads(resp.content)
             except (_Retryable, requests.exceptions.ConnectionError) as e:
                 last_err = e
                 self._leader_url = None
@@ -173,9 +419,16 @@ class _AsyncTransport:
         self._max_retries = max_retries
         self._retry_backoff = retry_backoff
         self._leader_url: Optional[str] = None
+        self._rpc_urls = _RpcUrls()
         headers = {"Authorization": f"Bearer {token}"} if token else {}
         self._client = httpx.AsyncClient(
-            timeout=timeout, follow_redirects=True, headers=headers
+            timeout=timeout,
+            follow_redirects=True,
+            headers=headers,
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=_POOL_MAXSIZE, max_keepalive_connections=_POOL_MAXSIZE // 2
+            ),
         )
 
     async def get(self, url: str, **kw):
@@ -192,22 +445,36 @@ class _AsyncTransport:
 
     async def post_rpc(
         self, path: str, json_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return await self._post_body(path, _dumps(json_data), _JSON_HEADERS)
+
+    async def post_frame(
+        self, path: str, frame: bytes, params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        return await self._post_body(path, frame, _FRAME_HEADERS, params)
+
+    async def _post_body(
+        self,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         import asyncio
         import httpx
         last_err: Optional[Exception] = None
         for attempt in range(self._max_retries + 1):
-            base = self._leader_url or self.base_url
-            url = base + path
+            url = self._rpc_urls.url(self._leader_url or self.base_url, path)
             try:
-                resp = await self._client.post(url, json=json_data)
+                resp = await self._client.post(url, content=body, headers=headers, params=params)
                 if resp.status_code == 307:
                     self._leader_url = None
                     raise _Retryable("no leader (307)")
                 if resp.status_code == 503:
                     self._leader_url = None
                     raise _Retryable("no leader (503)")
-                if resp.status_code == 404:
+                if resp.status_code in (404, 405):
+                    # 405: the node has the path but not as a POST route.
                     raise NotFoundError(f"Resource not found: {path}")
                 if resp.status_code in (401, 403):
                     action = "set token=" if resp.status_code == 401 else "check token permissions for"
@@ -225,7 +492,7 @@ class _AsyncTransport:
                 _raise_for_status(resp)
                 if resp.history:
                     self._leader_url = _base_of(str(resp.url), path)
-                return resp.json()
+                return _loads(resp.content)
             except (_Retryable, httpx.ConnectError) as e:
                 last_err = e
                 self._leader_url = None
@@ -269,6 +536,7 @@ class _SyncAutoSnapshotMixin:
 
 class _SyncRecordsMixin(_SyncAutoSnapshotMixin):
     _t: _SyncTransport
+    _quant: Optional[str] = None
 
     def insert(
         self,
@@ -278,7 +546,7 @@ class _SyncRecordsMixin(_SyncAutoSnapshotMixin):
         idempotency_key: Optional[bytes] = None,
         text: Optional[str] = None,
     ) -> RecordId:
-        data: Dict[str, Any] = {"values": vector, "tag": tag}
+        data: Dict[str, Any] = {"values": _wire_vector(vector, self._quant), "tag": tag}
         if collection != "default":
             data["collection"] = collection
         if text is not None:
@@ -293,7 +561,9 @@ class _SyncRecordsMixin(_SyncAutoSnapshotMixin):
     ) -> Tuple[RecordId, Proof]:
         try:
             import valoricore as _vc
-            fixed_vals = _vc.ingest_embedding(vector)
+            # With quant= set, prove the vector the node actually stores.
+            stored = _dequantized(_wire_vector(vector, self._quant))
+            fixed_vals = _vc.ingest_embedding(stored)
             proof_bytes: Proof = bytes.fromhex(_vc.generate_proof(fixed_vals))
         except (ImportError, AttributeError):
             proof_bytes = b""
@@ -314,7 +584,7 @@ class _SyncRecordsMixin(_SyncAutoSnapshotMixin):
         The receipt's state_hash can be independently verified by recomputing
         BLAKE3("valori-insert-receipt-v1" || fields).
         """
-        data: Dict[str, Any] = {"values": vector, "tag": tag}
+        data: Dict[str, Any] = {"values": _wire_vector(vector, self._quant), "tag": tag}
         if collection != "default":
             data["collection"] = collection
         if text is not None:
@@ -350,20 +620,25 @@ class _SyncRecordsMixin(_SyncAutoSnapshotMixin):
         self._check_auto_snapshot(len(batch))
         return resp["ids"]
 
+    def insert_bin(self, vectors: Any, collection: str = "default") -> List[RecordId]:
+        """insert_batch for a float array, sent as raw float32 instead of JSON.
+
+        ``vectors`` is one vector or a 2-D ``(n, dim)`` array.
+        """
+        arr = np.asarray(vectors, dtype=np.float32)
+        frame = _vector_frame(arr.reshape(1, -1) if arr.ndim == 1 else arr)
+        params = None if collection == "default" else {"collection": collection}
+        resp = self._t.post_frame("/v1/vectors/insert_bin", frame, params)
+        self._check_auto_snapshot(len(resp["ids"]))
+        return resp["ids"]
+
     def insert_batch_with_proof(
         self, vectors: List[Vector], tags: Optional[List[int]] = None
     ) -> List[Tuple[RecordId, Proof]]:
         if tags is None:
             tags = [0] * len(vectors)
         ids = self.insert_batch(vectors, metadata=None)
-        try:
-            import valoricore as _vc
-            proofs: List[Proof] = [
-                bytes.fromhex(_vc.generate_proof(_vc.ingest_embedding(v)))
-                for v in vectors
-            ]
-        except (ImportError, AttributeError):
-            proofs = [b""] * len(vectors)
+        proofs = _client_proofs(vectors)
         self._check_auto_snapshot(len(vectors))
         return list(zip(ids, proofs))
 
@@ -422,6 +697,7 @@ class _SyncRecordsMixin(_SyncAutoSnapshotMixin):
 
 class _SyncSearchMixin:
     _t: _SyncTransport
+    _quant: Optional[str] = None
 
     def search(
         self,
@@ -437,7 +713,7 @@ class _SyncSearchMixin:
         query_text: Optional[str] = None,
         metadata_filter: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        data: Dict[str, Any] = {"query": query, "k": k}
+        data: Dict[str, Any] = {"query": _wire_vector(query, self._quant), "k": k}
         if filter_tag is not None:
             data["filter_tag"] = filter_tag
         if consistency is not None:
@@ -460,6 +736,17 @@ class _SyncSearchMixin:
             return resp
         return resp["results"]
 
+    def search_bin(
+        self, query: Any, k: int, collection: str = "default"
+    ) -> List[Dict[str, Any]]:
+        """search for a float array query, sent as raw float32 instead of JSON.
+
+        Equivalent to ``search(query, k, rerank=False, collection=collection)``.
+        """
+        frame = _vector_frame(np.asarray(query, dtype=np.float32).reshape(1, -1), n=k)
+        params = None if collection == "default" else {"collection": collection}
+        return self._t.post_frame("/v1/vectors/search_bin", frame, params)["results"]
+
     def graphrag(
         self,
         query_vector: Vector,
@@ -492,6 +779,17 @@ class _SyncGraphMixin:
             data["collection"] = collection
         return self._t.post_rpc("/v1/graph/edge", data)["edge_id"]
 
+    def create_nodes_batch(
+        self, kind: int, record_ids: List[Optional[int]], collection: str = "default"
+    ) -> List[NodeId]:
+        # The node has no batch graph endpoint; kept for LocalClient parity.
+        return [self.create_node(kind, rid, collection=collection) for rid in record_ids]
+
+    def create_edges_batch(
+        self, from_id: int, to_ids: List[int], kind: int, collection: str = "default"
+    ) -> List[int]:
+        return [self.create_edge(from_id, to, kind, collection=collection) for to in to_ids]
+
     def get_node(self, node_id: int, collection: str = "default") -> Optional[Dict[str, Any]]:
         url = self._t.base_url + f"/v1/graph/node/{node_id}"
         params = {} if collection == "default" else {"collection": collection}
@@ -622,22 +920,36 @@ class _SyncSnapshotMixin:
     _insert_count: int
     _snapshot_dir: str
 
-    def snapshot(self, auto_interval: Optional[int] = None, save_dir: str = "./valoricore_snapshots") -> bytes:
+    def snapshot(
+        self,
+        auto_interval: Optional[int] = None,
+        save_dir: str = "./valoricore_snapshots",
+        out: Optional[BinaryIO] = None,
+    ) -> Optional[bytes]:
+        """Download the node's snapshot; with *out*, stream it there and return ``None``."""
         if auto_interval is not None:
             self._auto_snapshot_interval = auto_interval
             self._insert_count = 0
             self._snapshot_dir = save_dir
         try:
-            resp = self._t.get(self._t.base_url + "/v1/snapshot/download", timeout=30)
-            _raise_for_status(resp)
-            return resp.content
+            with self._t.get(
+                self._t.base_url + "/v1/snapshot/download",
+                headers=_SNAPSHOT_ACCEPT, stream=True, timeout=30,
+            ) as resp:
+                _raise_for_status(resp)
+                return _read_snapshot(resp, out)
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Failed to download snapshot: {e}")
 
-    def restore(self, data: bytes) -> None:
+    def restore(self, data: SnapshotSource, compress: bool = False) -> None:
+        """Restore from ``bytes``, a readable binary file, or an iterable of chunks.
+
+        ``compress=True`` sends the upload zstd-compressed (needs
+        ``zstandard``); nodes that reject it get it uncompressed.
+        """
         url = self._t.base_url + "/v1/snapshot/upload"
         try:
-            resp = self._t.post(url, data=data, headers={"Content-Type": "application/octet-stream"}, timeout=60)
+            resp = _post_snapshot(self._t.post, url, data, compress, timeout=60)
             _raise_for_status(resp)
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Failed to restore snapshot: {e}")
@@ -714,6 +1026,7 @@ class _SyncCollectionsMixin:
 
 class _SyncMemoryMixin:
     _t: _SyncTransport
+    _quant: Optional[str] = None
 
     def memory_upsert(
         self,
@@ -723,7 +1036,7 @@ class _SyncMemoryMixin:
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        data: Dict[str, Any] = {"vector": vector}
+        data: Dict[str, Any] = {"vector": _wire_vector(vector, self._quant)}
         if collection != "default":
             data["collection"] = collection
         if attach_to_document_node is not None:
@@ -734,6 +1047,50 @@ class _SyncMemoryMixin:
             data["tags"] = tags
         return self._t.post_rpc("/v1/memory/upsert_vector", data)
 
+    def upsert_vector_full(
+        self,
+        vector: Vector,
+        attach_to_document_node: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Insert one vector with its chunk node and parent edge in one request.
+
+        Same result as :meth:`MemoryClient.upsert_vector`'s insert /
+        create_node / create_edge sequence, but applied by the node in a single
+        round-trip. ``proof_hash`` is the node's proof of the vector as stored
+        (after ``quant=`` rounding); nodes that predate it return none.
+        """
+        return self.memory_upsert(vector, attach_to_document_node=attach_to_document_node)
+
+    def upsert_document_batch(
+        self,
+        vectors: List[Vector],
+        collection: str = "default",
+        attach_to_document_node: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Insert a document's chunk vectors in one request.
+
+        The node inserts the records and creates one document node (or uses
+        *attach_to_document_node*) plus a linked chunk node per vector. The
+        response carries ``document_node_id``, ``record_ids``,
+        ``chunk_node_ids``, ``memory_ids`` and the node's ``proof_hashes``
+        for the vectors as stored. ``quant=`` applies to every vector.
+        """
+        data: Dict[str, Any] = {"vectors": [_wire_vector(v, self._quant) for v in vectors]}
+        if collection != "default":
+            data["collection"] = collection
+        if attach_to_document_node is not None:
+            data["attach_to_document_node"] = attach_to_document_node
+        if metadata is not None:
+            data["metadata"] = metadata
+        if tags is not None:
+            data["tags"] = tags
+        resp = self._t.post_rpc("/v1/memory/upsert_vectors", data)
+        # Nodes that predate per-chunk proofs return none; don't make them up.
+        resp.setdefault("proof_hashes", [""] * len(vectors))
+        return resp
+
     def memory_search(
         self,
         query_vector: Vector,
@@ -1232,6 +1589,7 @@ class _AsyncAutoSnapshotMixin:
 
 class _AsyncRecordsMixin(_AsyncAutoSnapshotMixin):
     _t: _AsyncTransport
+    _quant: Optional[str] = None
 
     async def insert(
         self,
@@ -1240,7 +1598,7 @@ class _AsyncRecordsMixin(_AsyncAutoSnapshotMixin):
         collection: str = "default",
         text: Optional[str] = None,
     ) -> RecordId:
-        data: Dict[str, Any] = {"values": vector, "tag": tag}
+        data: Dict[str, Any] = {"values": _wire_vector(vector, self._quant), "tag": tag}
         if collection != "default":
             data["collection"] = collection
         if text is not None:
@@ -1254,7 +1612,8 @@ class _AsyncRecordsMixin(_AsyncAutoSnapshotMixin):
     ) -> Tuple[RecordId, Proof]:
         try:
             import valoricore as _vc
-            fixed_vals = _vc.ingest_embedding(vector)
+            stored = _dequantized(_wire_vector(vector, self._quant))
+            fixed_vals = _vc.ingest_embedding(stored)
             proof_bytes: Proof = bytes.fromhex(_vc.generate_proof(fixed_vals))
         except (ImportError, AttributeError):
             proof_bytes = b""
@@ -1273,7 +1632,7 @@ class _AsyncRecordsMixin(_AsyncAutoSnapshotMixin):
         Returns a dict with: record_id, old_root, new_root, proof,
         sequence, timestamp, state_hash — all as hex strings where applicable.
         """
-        data: Dict[str, Any] = {"values": vector, "tag": tag}
+        data: Dict[str, Any] = {"values": _wire_vector(vector, self._quant), "tag": tag}
         if collection != "default":
             data["collection"] = collection
         if text is not None:
@@ -1303,6 +1662,14 @@ class _AsyncRecordsMixin(_AsyncAutoSnapshotMixin):
         await self._check_auto_snapshot(len(batch))
         return resp["ids"]
 
+    async def insert_bin(self, vectors: Any, collection: str = "default") -> List[RecordId]:
+        arr = np.asarray(vectors, dtype=np.float32)
+        frame = _vector_frame(arr.reshape(1, -1) if arr.ndim == 1 else arr)
+        params = None if collection == "default" else {"collection": collection}
+        resp = await self._t.post_frame("/v1/vectors/insert_bin", frame, params)
+        await self._check_auto_snapshot(len(resp["ids"]))
+        return resp["ids"]
+
     async def insert_batch_with_proof(
         self, vectors: List[Vector], tags: Optional[List[int]] = None
     ) -> List[Tuple[RecordId, Proof]]:
@@ -1359,6 +1726,7 @@ class _AsyncRecordsMixin(_AsyncAutoSnapshotMixin):
 
 class _AsyncSearchMixin:
     _t: _AsyncTransport
+    _quant: Optional[str] = None
 
     async def search(
         self,
@@ -1374,7 +1742,7 @@ class _AsyncSearchMixin:
         query_text: Optional[str] = None,
         metadata_filter: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        data: Dict[str, Any] = {"query": query, "k": k}
+        data: Dict[str, Any] = {"query": _wire_vector(query, self._quant), "k": k}
         if filter_tag is not None:
             data["filter_tag"] = filter_tag
         if consistency is not None:
@@ -1397,6 +1765,14 @@ class _AsyncSearchMixin:
             return resp
         return resp["results"]
 
+    async def search_bin(
+        self, query: Any, k: int, collection: str = "default"
+    ) -> List[Dict[str, Any]]:
+        frame = _vector_frame(np.asarray(query, dtype=np.float32).reshape(1, -1), n=k)
+        params = None if collection == "default" else {"collection": collection}
+        resp = await self._t.post_frame("/v1/vectors/search_bin", frame, params)
+        return resp["results"]
+
     async def graphrag(
         self,
         query_vector: Vector,
@@ -1651,6 +2027,7 @@ class _AsyncCollectionsMixin:
 
 class _AsyncMemoryMixin:
     _t: _AsyncTransport
+    _quant: Optional[str] = None
 
     async def memory_upsert(
         self,
@@ -1660,7 +2037,7 @@ class _AsyncMemoryMixin:
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        data: Dict[str, Any] = {"vector": vector}
+        data: Dict[str, Any] = {"vector": _wire_vector(vector, self._quant)}
         if collection != "default":
             data["collection"] = collection
         if attach_to_document_node is not None:
@@ -1671,6 +2048,36 @@ class _AsyncMemoryMixin:
             data["tags"] = tags
         return await self._t.post_rpc("/v1/memory/upsert_vector", data)
 
+    async def upsert_vector_full(
+        self,
+        vector: Vector,
+        attach_to_document_node: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Async version of :meth:`SyncRemoteClient.upsert_vector_full`."""
+        return await self.memory_upsert(vector, attach_to_document_node=attach_to_document_node)
+
+    async def upsert_document_batch(
+        self,
+        vectors: List[Vector],
+        collection: str = "default",
+        attach_to_document_node: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Async version of :meth:`SyncRemoteClient.upsert_document_batch`."""
+        data: Dict[str, Any] = {"vectors": [_wire_vector(v, self._quant) for v in vectors]}
+        if collection != "default":
+            data["collection"] = collection
+        if attach_to_document_node is not None:
+            data["attach_to_document_node"] = attach_to_document_node
+        if metadata is not None:
+            data["metadata"] = metadata
+        if tags is not None:
+            data["tags"] = tags
+        resp = await self._t.post_rpc("/v1/memory/upsert_vectors", data)
+        resp.setdefault("proof_hashes", [""] * len(vectors))
+        return resp
+
     async def memory_search(
         self,
         query_vector: Vector,
@@ -2131,6 +2538,10 @@ class SyncRemoteClient(
     ``ui_url`` is the optional Next.js UI server URL (default: base_url with
     port replaced by 3001). Required only for deprecated ``list_contradictions``
     and ``resolve_contradiction``.
+
+    ``quant="int8"`` or ``"fp16"`` quantizes the vector in ``insert`` and
+    ``search`` bodies (per-vector scale for int8), cutting request size 2-4x;
+    the node dequantizes on receipt, so stored values carry the rounding.
     """
 
     def __init__(
@@ -2141,7 +2552,9 @@ class SyncRemoteClient(
         ui_url: Optional[str] = None,
         timeout: int = 10,
         token: Optional[str] = None,
+        quant: Optional[str] = None,
     ):
+        self._quant = _check_quant(quant)
         auth = _BearerAuth(token) if token else None
         self._t = _SyncTransport(
             base_url=base_url.rstrip("/"),
@@ -2207,6 +2620,8 @@ class AsyncRemoteClient(
     ``ui_url`` is the optional Next.js UI server URL (default: base_url with
     port replaced by 3001). Required only for deprecated ``list_contradictions``
     and ``resolve_contradiction``.
+
+    ``quant`` is as for :class:`SyncRemoteClient`.
     """
 
     def __init__(
@@ -2217,7 +2632,9 @@ class AsyncRemoteClient(
         ui_url: Optional[str] = None,
         token: Optional[str] = None,
         timeout: float = 10.0,
+        quant: Optional[str] = None,
     ):
+        self._quant = _check_quant(quant)
         self._t = _AsyncTransport(
             base_url=base_url.rstrip("/"),
             token=token,